@@ -0,0 +1,54 @@
+import sys
+
+# The top level API is imported from its submodule on first use, so `import aamva` stays cheap: datetime, the
+# issuing authority list and the code tables are only loaded by the code that needs them.
+LAZY_ATTRIBUTES = {
+    "BarcodeFile": "aamva.barcode",
+    "FileHeader": "aamva.barcode",
+    "Subfile": "aamva.barcode",
+    "SubfileDesignator": "aamva.barcode",
+    "extract_fields": "aamva.barcode",
+    "parse_barcode_string": "aamva.barcode",
+    "parse_barcode_bytes": "aamva.barcode_bytes",
+    "parse_barcode_lazy": "aamva.lazy",
+    "parse_barcode_compact": "aamva.records",
+    "ErrorCode": "aamva.result",
+    "ParseResult": "aamva.result",
+    "parse_barcode_string_result": "aamva.result",
+    "recover_barcode_string": "aamva.recovery",
+    "decode_barcode_file": "aamva.elements",
+    "encode_barcode": "aamva.encoder",
+    "parse_many": "aamva.batch",
+    "parse_many_threaded": "aamva.batch",
+    "iter_barcodes": "aamva.reader",
+    "ParseCache": "aamva.cache",
+    "DuplicateScanIndex": "aamva.duplicates",
+    "IssuingAuthority": "aamva.issuing_authority",
+    "get_authority_by_id": "aamva.issuing_authority",
+    "get_authority_by_abbr": "aamva.issuing_authority",
+    "get_authority_by_jurisdiction": "aamva.issuing_authority",
+    "parse_date": "aamva.dates",
+    "parse_eye_color": "aamva.eye_color",
+    "parse_hair_color": "aamva.hair_color",
+    "parse_race_ethnicity": "aamva.race_ethnicity"}
+
+__all__ = tuple(LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module 'aamva' has no attribute '{name}'")
+    __import__(module_name)  # Rather than importlib.import_module, which would cost importing importlib
+    value = getattr(sys.modules[module_name], name)
+    # Later lookups skip __getattr__. While instrumentation is enabled the value may be a wrapper that
+    # disable() does not know to restore here, so it is not cached.
+    instrumentation = sys.modules.get("aamva.instrumentation")
+    if instrumentation is None or not instrumentation.is_enabled():
+        globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
@@ -0,0 +1,130 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import Executor
+from functools import partial
+from typing import Optional
+
+from aamva.barcode import BarcodeFile, get_header_layout, parse_barcode_string
+from aamva.barcode_bytes import (
+    HEADER_PREFIX_BYTES, parse_file_header_bytes, parse_subfile_designators_bytes, read_int)
+from aamva.batch import DEFAULT_CHUNKSIZE, BatchResult, chunked, parse_chunk, parse_one
+from aamva.reader import Framing, parse_framed_record, unescape_record
+
+VERSION_END = 17  # The AAMVA version is the last field every header layout shares
+MAX_RECORD_LENGTH = 9999  # Subfile offsets and lengths are 4 digits
+READ_SIZE = 4096
+DEFAULT_MAX_IN_FLIGHT = 4
+
+
+async def fill(reader: asyncio.StreamReader, buffer: bytearray, size: int) -> bool:
+    # Reads until the buffer holds at least size bytes. Returns False at the end of the stream.
+    while len(buffer) < size:
+        data = await reader.read(READ_SIZE)
+        if not data:
+            return False
+        buffer += data
+    return True
+
+
+async def skip_to_header(reader: asyncio.StreamReader, buffer: bytearray) -> bool:
+    # Discards any noise before the next header prefix. Returns False at the end of the stream.
+    while (start := buffer.find(HEADER_PREFIX_BYTES)) < 0:
+        del buffer[:-len(HEADER_PREFIX_BYTES)]
+        if not await fill(reader, buffer, len(buffer) + 1):
+            return False
+    del buffer[:start]
+    return True
+
+
+async def read_record_body(reader: asyncio.StreamReader, buffer: bytearray, start: int, end: int) -> int:
+    # Reads up to end, but a record cut short by the next header prefix ends there, so a corrupted offset or
+    # length cannot swallow the records after it. Returns where the record ends.
+    while (prefix := buffer.find(HEADER_PREFIX_BYTES, start, end)) < 0:
+        if len(buffer) >= end:
+            return end
+        start = max(start, len(buffer) - len(HEADER_PREFIX_BYTES) + 1)
+        if not await fill(reader, buffer, len(buffer) + 1):
+            return len(buffer)
+    return prefix
+
+
+async def read_raw_record(reader: asyncio.StreamReader, buffer: Optional[bytearray] = None) -> Optional[bytes]:
+    # A raw record ends where its last subfile ends, so it is framed from its own header and designators
+    # without waiting for the next record to arrive. A record whose header cannot be read is returned as
+    # far as it was read, so parsing reports the error and the stream resynchronises on the next header.
+    # Bytes read past the end of the record are kept in buffer for the next call.
+    if buffer is None:
+        buffer = bytearray()
+    if not await skip_to_header(reader, buffer):
+        return None
+    end = VERSION_END
+    try:
+        if await fill(reader, buffer, end):
+            layout = get_header_layout(read_int(memoryview(bytes(buffer[:end])), 15, 17))
+            end = layout.header_length
+            if await fill(reader, buffer, end):
+                header = parse_file_header_bytes(memoryview(bytes(buffer[:end])))
+                end += layout.designator_stride * header["number_of_entries"]
+                if await fill(reader, buffer, end):
+                    body_end = end
+                    for designator in parse_subfile_designators_bytes(memoryview(bytes(buffer[:end])), header):
+                        body_end = max(body_end, designator["offset"] + designator["length"])
+                    end = await read_record_body(reader, buffer, end, min(body_end, MAX_RECORD_LENGTH))
+    except ValueError:
+        pass
+    record = bytes(buffer[:end])
+    del buffer[:end]
+    return record
+
+
+async def iter_stream_records(reader: asyncio.StreamReader, framing: Framing = "raw",
+                              unescape: bool = True) -> AsyncIterator[bytes]:
+    # With unescape=False escaped lines are yielded as read, to be decoded record by record with decode_record.
+    if framing == "raw":
+        buffer = bytearray()
+        while (record := await read_raw_record(reader, buffer)) is not None:
+            yield record
+    elif framing == "escaped":
+        while line := await reader.readline():
+            if line.strip():
+                yield unescape_record(line) if unescape else line.rstrip(b"\r\n")
+    else:
+        raise ValueError(f"Framing '{framing}' is not supported.")
+
+
+async def iter_stream_barcodes(
+        reader: asyncio.StreamReader,
+        framing: Framing = "raw",
+        parser: Callable[..., BarcodeFile] = parse_barcode_string) -> AsyncIterator[BatchResult]:
+    # A single barcode parses in tens of microseconds, so records are parsed inline on the event loop. The
+    # next record is only read once the consumer asks for it, which pushes back on the sender through the
+    # transport's flow control.
+    framed_parser = partial(parse_framed_record, framing=framing, parser=parser)
+    async for record in iter_stream_records(reader, framing, unescape=False):
+        yield parse_one(framed_parser, record)
+
+
+async def parse_batch(
+        barcodes: Iterable,
+        executor: Optional[Executor] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        parser: Callable[..., BarcodeFile] = parse_barcode_string) -> list[BatchResult]:
+    # Offloads a large batch to an executor in chunks, with at most max_in_flight chunks submitted at once.
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight cannot be less than 1.")
+    elif chunksize < 1:
+        raise ValueError("chunksize cannot be less than 1.")
+
+    loop = asyncio.get_running_loop()
+    task = partial(parse_chunk, parser)
+    results = list()
+    pending = deque()
+    for chunk in chunked(barcodes, chunksize):
+        pending.append(loop.run_in_executor(executor, task, chunk))
+        if len(pending) >= max_in_flight:
+            results.extend(await pending.popleft())
+    while pending:
+        results.extend(await pending.popleft())
+    return results
@@ -1,4 +1,6 @@
-from typing import TypedDict, Optional, Literal, NewType
+from collections.abc import Collection, Mapping
+from types import MappingProxyType
+from typing import NamedTuple, TypedDict, Optional, Literal, NewType
 
 BarcodeStr = NewType("BarcodeStr", str)
 
@@ -31,6 +33,32 @@ DATA_ELEMENT_SEPARATOR = "\n"
 RECORD_SEPARATOR = "\x1e"
 SEGMENT_TERMINATOR = "\r"
 FILE_TYPE = "ANSI "
+HEADER_PREFIX = COMPLIANCE_INDICATOR + DATA_ELEMENT_SEPARATOR + RECORD_SEPARATOR + SEGMENT_TERMINATOR + FILE_TYPE
+HEADER_PREFIX_ELEMENTS = (
+    ("COMPLIANCE_INDICATOR", 0, 1),
+    ("DATA_ELEMENT_SEPARATOR", 1, 2),
+    ("RECORD_SEPARATOR", 2, 3),
+    ("SEGMENT_TERMINATOR", 3, 4),
+    ("FILE_TYPE", 4, 9))
+DESIGNATOR_LENGTH = 10
+
+# AAMVA DL/ID Card Design Standard versions published to date.
+AAMVA_VERSIONS = range(1, 11)
+
+
+class HeaderLayout(NamedTuple):
+    header_length: Literal[19, 21]
+    jurisdiction_version_offset: Optional[int]  # Version 1 headers have no jurisdiction version
+    number_of_entries_offset: int
+    designator_stride: int
+
+
+# Built once per version, so the header, the designator table and the subfiles are all located from the
+# same offsets instead of recomputing them at each stage.
+HEADER_LAYOUTS = MappingProxyType({
+    aamva_version: HeaderLayout(19, None, 17, DESIGNATOR_LENGTH) if aamva_version < 2 else
+    HeaderLayout(21, 17, 19, DESIGNATOR_LENGTH)
+    for aamva_version in range(1, 100)})
 
 
 def trim_before(char: str, string: str) -> str:
@@ -40,10 +68,15 @@ def trim_before(char: str, string: str) -> str:
         return string
 
 
-def header_length(aamva_version: int) -> Literal[19, 21]:
-    if aamva_version < 1 or aamva_version > 99:
+def get_header_layout(aamva_version: int) -> HeaderLayout:
+    try:
+        return HEADER_LAYOUTS[aamva_version]
+    except KeyError:
         raise ValueError("aamva_version is out of range (1-99).")
-    return 19 if aamva_version < 2 else 21
+
+
+def header_length(aamva_version: int) -> Literal[19, 21]:
+    return get_header_layout(aamva_version).header_length
 
 
 def parse_file_header(barcode_string: BarcodeStr) -> FileHeader:
@@ -51,46 +84,87 @@ def parse_file_header(barcode_string: BarcodeStr) -> FileHeader:
 
     if len(barcode_string) < MIN_LENGTH:
         raise ValueError("Header length is too short.")
-    elif barcode_string[0] != COMPLIANCE_INDICATOR:
-        raise ValueError("Header element 'COMPLIANCE_INDICATOR' is invalid.")
-    elif barcode_string[1] != DATA_ELEMENT_SEPARATOR:
-        raise ValueError("Header element 'DATA_ELEMENT_SEPARATOR' is invalid.")
-    elif barcode_string[2] != RECORD_SEPARATOR:
-        raise ValueError("Header element 'RECORD_SEPARATOR' is invalid.")
-    elif barcode_string[3] != SEGMENT_TERMINATOR:
-        raise ValueError("Header element 'SEGMENT_TERMINATOR' is invalid.")
-    elif barcode_string[4:9] != FILE_TYPE:
-        raise ValueError("Header element 'FILE_TYPE' is invalid.")
+    elif not barcode_string.startswith(HEADER_PREFIX):
+        # Only a bad header pays for finding which element is wrong.
+        for name, start, end in HEADER_PREFIX_ELEMENTS:
+            if barcode_string[start:end] != HEADER_PREFIX[start:end]:
+                raise ValueError(f"Header element '{name}' is invalid.")
 
     aamva_version = int(barcode_string[15:17])
-    if len(barcode_string) < header_length(aamva_version):
+    layout = get_header_layout(aamva_version)
+    if len(barcode_string) < layout.header_length:
         raise ValueError("Header length is too short.")
 
-    issuer_id = int(barcode_string[9:15])
-    number_of_entries = int(barcode_string[17:19] if aamva_version < 2 else barcode_string[19:21])
-    jurisdiction_version = 0 if aamva_version < 2 else int(barcode_string[17:19])
+    entries = layout.number_of_entries_offset
+    jurisdiction = layout.jurisdiction_version_offset
+    # Dict literals rather than calls to the TypedDict classes, which cost several times more per record.
+    return {
+        "issuer_id": int(barcode_string[9:15]),
+        "aamva_version": aamva_version,
+        "number_of_entries": int(barcode_string[entries:entries + 2]),
+        "jurisdiction_version": 0 if jurisdiction is None else int(barcode_string[jurisdiction:jurisdiction + 2])}
 
-    return FileHeader(
-        issuer_id=issuer_id,
-        aamva_version=aamva_version,
-        number_of_entries=number_of_entries,
-        jurisdiction_version=jurisdiction_version)
+
+def read_subfile_designator(barcode_string: BarcodeStr, cursor: int) -> SubfileDesignator:
+    return {
+        "subfile_type": barcode_string[cursor:cursor + 2],
+        "offset": int(barcode_string[cursor + 2:cursor + 6]),
+        "length": int(barcode_string[cursor + 6:cursor + 10])}
 
 
 def parse_subfile_designator(barcode_string: BarcodeStr, aamva_version: int, designator_index: int) -> SubfileDesignator:
-    DESIGNATOR_LENGTH = 10
-    cursor = designator_index * DESIGNATOR_LENGTH + header_length(aamva_version)
+    layout = get_header_layout(aamva_version)
+    cursor = layout.header_length + designator_index * layout.designator_stride
+
+    if len(barcode_string) < cursor + layout.designator_stride:
+        raise ValueError("Subfile designator is too short.")
+
+    return read_subfile_designator(barcode_string, cursor)
+
+
+def parse_subfile_designators(barcode_string: BarcodeStr, header: FileHeader) -> tuple[SubfileDesignator, ...]:
+    # The whole designator table in one pass, with a single length check.
+    layout = get_header_layout(header["aamva_version"])
+    end = layout.header_length + header["number_of_entries"] * layout.designator_stride
 
-    if len(barcode_string) < cursor + DESIGNATOR_LENGTH:
+    if len(barcode_string) < end:
         raise ValueError("Subfile designator is too short.")
 
-    return SubfileDesignator(
-        subfile_type=str(barcode_string[cursor:cursor + 2]),
-        offset=int(barcode_string[cursor + 2:cursor + 6]),
-        length=int(barcode_string[cursor + 6:cursor + 10]))
+    return tuple(
+        read_subfile_designator(barcode_string, cursor)
+        for cursor in range(layout.header_length, end, layout.designator_stride))
 
 
-def parse_subfile(barcode_string: BarcodeStr, designator: SubfileDesignator) -> Subfile:
+def find_element(barcode_string: BarcodeStr, element_id: str, start: int, end: int) -> Optional[str]:
+    # Searches from the end, so a repeated element resolves to its last copy as it does in a full parse.
+    index = barcode_string.rfind(DATA_ELEMENT_SEPARATOR + element_id, start, end)
+    if index != -1:
+        value_start = index + 1 + len(element_id)
+    elif barcode_string.startswith(element_id, start, end):
+        value_start = start + len(element_id)
+    else:
+        return None
+    value_end = barcode_string.find(DATA_ELEMENT_SEPARATOR, value_start, end)
+    return barcode_string[value_start:end if value_end == -1 else value_end]
+
+
+def parse_elements(barcode_string: BarcodeStr, start: int, end: int,
+                   wanted: Optional[Collection[str]] = None) -> dict[str, str]:
+    if wanted is None:
+        items = barcode_string[start:end].split(DATA_ELEMENT_SEPARATOR)
+        return {item[:3]: item[3:] for item in items if item}
+
+    # Jumping straight to each wanted element is cheaper than splitting the whole subfile.
+    elements = dict()
+    for element_id in wanted:
+        value = find_element(barcode_string, element_id, start, end)
+        if value is not None:
+            elements[element_id] = value
+    return elements
+
+
+def parse_subfile(barcode_string: BarcodeStr, designator: SubfileDesignator,
+                  wanted: Optional[Collection[str]] = None) -> Subfile:
     subfile_type = designator["subfile_type"]
     offset = designator["offset"]
     length = designator["length"]
@@ -103,28 +177,44 @@ def parse_subfile(barcode_string: BarcodeStr, designator: SubfileDesignator) ->
     elif barcode_string[end_offset - 1] != SEGMENT_TERMINATOR:
         raise ValueError("Subfile is missing segment terminator.")
 
-    items = filter(None, barcode_string[offset + 2: end_offset - 1].split(DATA_ELEMENT_SEPARATOR))
-    elements = dict()
-    for item in items:
-        elements[item[:3]] = item[3:]
+    return {"subfile_type": subfile_type, "elements": parse_elements(barcode_string, offset + 2, end_offset - 1, wanted)}
+
 
-    return Subfile(
-        subfile_type=subfile_type,
-        elements=elements)
+def parse_barcode_string(barcode_string: BarcodeStr, wanted: Optional[Collection[str]] = None) -> BarcodeFile:
+    barcode_string = trim_before(COMPLIANCE_INDICATOR, barcode_string)
+    header = parse_file_header(barcode_string)
+    if header["number_of_entries"] < 1:
+        raise ValueError("Number of entries cannot be less than 1.")
 
+    designators = parse_subfile_designators(barcode_string, header)
+    subfiles = tuple(parse_subfile(barcode_string, designator, wanted) for designator in designators)
+    return {"header": header, "subfiles": subfiles}
 
-def parse_barcode_string(barcode_string: BarcodeStr) -> BarcodeFile:
+
+def find_element_value(barcode_file: BarcodeFile, element_id: str) -> Optional[str]:
+    # The value from the first subfile that has the element.
+    for subfile in barcode_file["subfiles"]:
+        value = subfile["elements"].get(element_id)
+        if value is not None:
+            return value
+    return None
+
+
+def extract_fields(barcode_string: BarcodeStr, wanted: Mapping[str, Collection[str]]) -> dict[str, dict[str, str]]:
+    # Reads only the designators up to the last wanted subfile, and only the wanted elements of each. Subfiles
+    # and elements that are not in the barcode are left out of the result.
     barcode_string = trim_before(COMPLIANCE_INDICATOR, barcode_string)
     header = parse_file_header(barcode_string)
     if header["number_of_entries"] < 1:
         raise ValueError("Number of entries cannot be less than 1.")
 
-    subfiles = list()
+    fields = dict()
     for i in range(header["number_of_entries"]):
         designator = parse_subfile_designator(barcode_string, header["aamva_version"], i)
-        subfile = parse_subfile(barcode_string, designator)
-        subfiles.append(subfile)
-
-    return BarcodeFile(
-        header=header,
-        subfiles=tuple(subfiles))
+        element_ids = wanted.get(designator["subfile_type"])
+        if element_ids is None or designator["subfile_type"] in fields:
+            continue
+        fields[designator["subfile_type"]] = parse_subfile(barcode_string, designator, element_ids)["elements"]
+        if len(fields) == len(wanted):
+            break
+    return fields
@@ -0,0 +1,180 @@
+import re
+from collections.abc import Iterator, Mapping
+from typing import Union
+
+from aamva.barcode import (
+    COMPLIANCE_INDICATOR, DATA_ELEMENT_SEPARATOR, DESIGNATOR_LENGTH, HEADER_PREFIX, HEADER_PREFIX_ELEMENTS,
+    SEGMENT_TERMINATOR, FileHeader, SubfileDesignator, Subfile, BarcodeFile, get_header_layout)
+
+BarcodeBytes = Union[bytes, bytearray, memoryview]
+
+# AAMVA barcodes are ISO 8859-1, which maps every byte to exactly one character.
+ENCODING = "latin-1"
+
+SEGMENT_TERMINATOR_BYTE = ord(SEGMENT_TERMINATOR)
+HEADER_PREFIX_BYTES = HEADER_PREFIX.encode(ENCODING)
+
+_COMPLIANCE_INDICATOR_PATTERN = re.compile(re.escape(COMPLIANCE_INDICATOR.encode(ENCODING)))
+_ELEMENT_PATTERN = re.compile(b"[^" + re.escape(DATA_ELEMENT_SEPARATOR.encode(ENCODING)) + b"]+")
+
+
+class ElementsView(Mapping):
+    # Read-only mapping of element IDs to values. Element positions are indexed on first access and
+    # values are decoded from the underlying buffer each time they are read.
+    __slots__ = ("_view", "_start", "_end", "_spans")
+
+    def __init__(self, view: memoryview, start: int, end: int):
+        self._view = view
+        self._start = start
+        self._end = end
+        self._spans = None
+
+    @property
+    def spans(self) -> dict[str, tuple[int, int]]:
+        spans = self._spans
+        if spans is None:
+            spans = self._spans = element_spans(self._view, self._start, self._end)
+        return spans
+
+    def __getitem__(self, code: str) -> str:
+        start, end = self.spans[code]
+        return str(self._view[start:end], ENCODING)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.spans)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self.spans
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        # A memoryview cannot be pickled, so the elements cross process boundaries as a plain dict.
+        return dict, (dict(self),)
+
+
+def as_view(buf: BarcodeBytes) -> memoryview:
+    # Results keep a view into the buffer, so a mutable buffer is copied first. Otherwise later writes to it
+    # would change values already parsed, and it could not be resized while the results are alive.
+    view = memoryview(buf)
+    if not view.readonly:
+        view = memoryview(view.tobytes())
+    return view if view.format == "B" else view.cast("B")
+
+
+def trim_before_bytes(view: memoryview) -> memoryview:
+    match = _COMPLIANCE_INDICATOR_PATTERN.search(view)
+    return view if match is None else view[match.start():]
+
+
+def read_int(view: memoryview, start: int, end: int) -> int:
+    value = 0
+    for byte in view[start:end]:
+        if byte < 48 or byte > 57:  # ASCII '0' to '9'
+            # Rare, so int() is only used here. It accepts, and rejects with the same message, exactly what
+            # the str parser does, e.g. padded numbers.
+            return int(str(view[start:end], ENCODING))
+        value = value * 10 + byte - 48
+    return value
+
+
+def element_spans(view: memoryview, start: int, end: int) -> dict[str, tuple[int, int]]:
+    spans = dict()
+    for match in _ELEMENT_PATTERN.finditer(view, start, end):
+        item_start, item_end = match.span()
+        # Elements shorter than an ID keep what is there, with an empty value, as in the str parser.
+        value_start = min(item_start + 3, item_end)
+        spans[str(view[item_start:value_start], ENCODING)] = (value_start, item_end)
+    return spans
+
+
+def parse_file_header_bytes(view: memoryview) -> FileHeader:
+    MIN_LENGTH = 17
+
+    if len(view) < MIN_LENGTH:
+        raise ValueError("Header length is too short.")
+    elif view[:len(HEADER_PREFIX_BYTES)] != HEADER_PREFIX_BYTES:
+        for name, start, end in HEADER_PREFIX_ELEMENTS:
+            if view[start:end] != HEADER_PREFIX_BYTES[start:end]:
+                raise ValueError(f"Header element '{name}' is invalid.")
+
+    aamva_version = read_int(view, 15, 17)
+    layout = get_header_layout(aamva_version)
+    if len(view) < layout.header_length:
+        raise ValueError("Header length is too short.")
+
+    issuer_id = read_int(view, 9, 15)
+    entries = layout.number_of_entries_offset
+    jurisdiction = layout.jurisdiction_version_offset
+    number_of_entries = read_int(view, entries, entries + 2)
+    jurisdiction_version = 0 if jurisdiction is None else read_int(view, jurisdiction, jurisdiction + 2)
+
+    return FileHeader(
+        issuer_id=issuer_id,
+        aamva_version=aamva_version,
+        number_of_entries=number_of_entries,
+        jurisdiction_version=jurisdiction_version)
+
+
+def read_subfile_designator_bytes(view: memoryview, cursor: int) -> SubfileDesignator:
+    return SubfileDesignator(
+        subfile_type=str(view[cursor:cursor + 2], ENCODING),
+        offset=read_int(view, cursor + 2, cursor + 6),
+        length=read_int(view, cursor + 6, cursor + 10))
+
+
+def parse_subfile_designator_bytes(view: memoryview, aamva_version: int, designator_index: int) -> SubfileDesignator:
+    layout = get_header_layout(aamva_version)
+    cursor = layout.header_length + designator_index * layout.designator_stride
+
+    if len(view) < cursor + DESIGNATOR_LENGTH:
+        raise ValueError("Subfile designator is too short.")
+
+    return read_subfile_designator_bytes(view, cursor)
+
+
+def parse_subfile_designators_bytes(view: memoryview, header: FileHeader) -> tuple[SubfileDesignator, ...]:
+    # The whole designator table before any subfile, as parse_subfile_designators reads it.
+    layout = get_header_layout(header["aamva_version"])
+    end = layout.header_length + header["number_of_entries"] * layout.designator_stride
+
+    if len(view) < end:
+        raise ValueError("Subfile designator is too short.")
+
+    return tuple(
+        read_subfile_designator_bytes(view, cursor)
+        for cursor in range(layout.header_length, end, layout.designator_stride))
+
+
+def parse_subfile_bytes(view: memoryview, designator: SubfileDesignator) -> Subfile:
+    subfile_type = designator["subfile_type"]
+    offset = designator["offset"]
+    length = designator["length"]
+    end_offset = offset + length
+
+    if len(view) < end_offset:
+        raise ValueError("Subfile length is too short.")
+    elif view[offset:offset + 2] != subfile_type.encode(ENCODING):
+        raise ValueError("Subfile is missing subfile type.")
+    elif view[end_offset - 1] != SEGMENT_TERMINATOR_BYTE:
+        raise ValueError("Subfile is missing segment terminator.")
+
+    return Subfile(
+        subfile_type=subfile_type,
+        elements=ElementsView(view, offset + 2, end_offset - 1))
+
+
+def parse_barcode_bytes(buf: BarcodeBytes) -> BarcodeFile:
+    view = trim_before_bytes(as_view(buf))
+    header = parse_file_header_bytes(view)
+    if header["number_of_entries"] < 1:
+        raise ValueError("Number of entries cannot be less than 1.")
+
+    designators = parse_subfile_designators_bytes(view, header)
+    return BarcodeFile(
+        header=header,
+        subfiles=tuple(parse_subfile_bytes(view, designator) for designator in designators))
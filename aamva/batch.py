@@ -0,0 +1,108 @@
+import os
+import pickle
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import NamedTuple, Optional
+
+from aamva.barcode import BarcodeFile, parse_barcode_string
+
+DEFAULT_CHUNKSIZE = 256
+
+
+class BatchResult(NamedTuple):
+    barcode_file: Optional[BarcodeFile]
+    error: Optional[Exception]  # Usually a ValueError from the parser
+
+
+def parse_one(parser: Callable[..., BarcodeFile], barcode) -> BatchResult:
+    # Any failure is confined to its own record, e.g. a TypeError for input of the wrong type.
+    try:
+        return BatchResult(parser(barcode), None)
+    except Exception as error:
+        return BatchResult(None, error)
+
+
+def parse_chunk(parser: Callable[..., BarcodeFile], chunk: tuple) -> tuple[BatchResult, ...]:
+    return tuple(parse_one(parser, barcode) for barcode in chunk)
+
+
+def pickle_result(result: BatchResult) -> bytes:
+    try:
+        return pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    except Exception as error:  # TypeError, PicklingError or AttributeError depending on the value
+        return pickle.dumps(BatchResult(None, TypeError(f"Result cannot be sent from a worker process: {error}")))
+
+
+def parse_chunk_pickled(parser: Callable[..., BarcodeFile], chunk: tuple) -> tuple[bytes, ...]:
+    # Runs in the worker processes. Each result is pickled on its own, so one that cannot be pickled becomes an
+    # error result instead of failing the whole chunk.
+    return tuple(pickle_result(result) for result in parse_chunk(parser, chunk))
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[tuple]:
+    iterator = iter(iterable)
+    while chunk := tuple(islice(iterator, size)):
+        yield chunk
+
+
+def map_chunks(executor: Executor, task: Callable, chunks: Iterable[tuple], max_in_flight: int) -> Iterator[BatchResult]:
+    # Keep a bounded number of chunks in flight so input is consumed lazily and results stay in order.
+    pending = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(task, chunk))
+        if len(pending) >= max_in_flight:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def parse_many(
+        barcodes: Iterable,
+        workers: Optional[int] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        parser: Callable[..., BarcodeFile] = parse_barcode_string) -> Iterator[BatchResult]:
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError("workers cannot be less than 1.")
+    elif chunksize < 1:
+        raise ValueError("chunksize cannot be less than 1.")
+
+    if workers == 1:
+        for chunk in chunked(barcodes, chunksize):
+            yield from parse_chunk(parser, chunk)
+        return
+
+    try:
+        pickle.dumps(parser)
+    except Exception:
+        raise ValueError("parser must be picklable to run in worker processes.")
+    task = partial(parse_chunk_pickled, parser)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for data in map_chunks(executor, task, chunked(barcodes, chunksize), workers * 2):
+            yield pickle.loads(data)
+
+
+def parse_many_threaded(
+        barcodes: Iterable,
+        workers: Optional[int] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        parser: Callable[..., BarcodeFile] = parse_barcode_string,
+        executor: Optional[ThreadPoolExecutor] = None) -> Iterator[BatchResult]:
+    # Same as parse_many, but on threads, so nothing is pickled and a server can share one executor across
+    # requests. The parser keeps no shared mutable state and its tables are read-only, so no locks are needed.
+    # On a standard CPython build the GIL keeps this to about one core; free-threaded builds scale with workers.
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError("workers cannot be less than 1.")
+    elif chunksize < 1:
+        raise ValueError("chunksize cannot be less than 1.")
+
+    task = partial(parse_chunk, parser)
+    if executor is not None:
+        yield from map_chunks(executor, task, chunked(barcodes, chunksize), workers * 2)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        yield from map_chunks(executor, task, chunked(barcodes, chunksize), workers * 2)
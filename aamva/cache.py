@@ -0,0 +1,124 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+from aamva.barcode import BarcodeFile, BarcodeStr, Subfile, parse_barcode_string
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    size_bytes: int
+
+
+class CacheEntry(NamedTuple):
+    barcode_file: BarcodeFile
+    size_bytes: int
+    expires_at: float
+
+
+def freeze_barcode_file(barcode_file: BarcodeFile) -> BarcodeFile:
+    # Read-only views at every level, so cached results can be shared between callers without copying.
+    # The parser's own dicts are wrapped rather than copied, as nothing else holds a reference to them.
+    return MappingProxyType(BarcodeFile(
+        header=MappingProxyType(barcode_file["header"]),
+        subfiles=tuple(
+            MappingProxyType(Subfile(
+                subfile_type=subfile["subfile_type"],
+                elements=MappingProxyType(subfile["elements"])))
+            for subfile in barcode_file["subfiles"])))
+
+
+def estimate_size(barcode_string: BarcodeStr, barcode_file: BarcodeFile) -> int:
+    size = sys.getsizeof(barcode_string) + sys.getsizeof(barcode_file["header"])
+    for subfile in barcode_file["subfiles"]:
+        size += sys.getsizeof(subfile) + sys.getsizeof(subfile["elements"])
+        size += sum(map(sys.getsizeof, subfile["elements"].values()))
+    return size
+
+
+class ParseCache:
+    # Thread-safe LRU cache in front of a parser, bounded by an estimated byte budget and an optional TTL.
+    # Entries are keyed on the payload itself: the dict lookup hashes it once and confirms a match by
+    # equality, so a hash collision can never return another card's result.
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, ttl: Optional[float] = None,
+                 parser: Callable[[BarcodeStr], BarcodeFile] = parse_barcode_string,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_bytes < 1:
+            raise ValueError("max_bytes cannot be less than 1.")
+        elif ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0.")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.parser = parser
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def parse(self, barcode_string: BarcodeStr) -> BarcodeFile:
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(barcode_string)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._entries.move_to_end(barcode_string)
+                    self._hits += 1
+                    return entry.barcode_file
+                self._remove(barcode_string)
+                self._expirations += 1
+            self._misses += 1
+
+        # Parse outside the lock; invalid payloads raise and are not cached.
+        barcode_file = self.parser(barcode_string)
+        size_bytes = estimate_size(barcode_string, barcode_file)
+        barcode_file = freeze_barcode_file(barcode_file)
+        if size_bytes > self.max_bytes:
+            return barcode_file
+
+        expires_at = float("inf") if self.ttl is None else now + self.ttl
+        with self._lock:
+            if barcode_string in self._entries:
+                self._remove(barcode_string)
+            self._entries[barcode_string] = CacheEntry(barcode_file, size_bytes, expires_at)
+            self._size_bytes += size_bytes
+            while self._size_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+        return barcode_file
+
+    def _remove(self, barcode_string: BarcodeStr) -> None:
+        self._size_bytes -= self._entries.pop(barcode_string).size_bytes
@@ -0,0 +1,143 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date
+from functools import partial
+from typing import Any, Optional, TextIO
+
+from aamva.barcode import parse_barcode_string
+from aamva.batch import DEFAULT_CHUNKSIZE, BatchResult, parse_many
+from aamva.elements import SCHEMAS, Height, decode_barcode_file
+from aamva.eye_color import EyeColor
+from aamva.hair_color import HairColor
+from aamva.race_ethnicity import RaceEthnicity
+from aamva.reader import decode_record, iter_records
+
+HEADER_FIELDS = ("issuer_id", "aamva_version", "jurisdiction_version")
+DEFAULT_FIELDS = HEADER_FIELDS + tuple(dict.fromkeys(
+    element.field for schema in SCHEMAS.values() for element in schema.values()))
+OUTPUT_FORMATS = ("ndjson", "csv")
+
+
+def format_value(value: Any) -> Any:
+    # Decoded values are flattened to JSON and CSV friendly scalars.
+    if isinstance(value, date):
+        return value.isoformat()
+    elif isinstance(value, Height):
+        return f"{value.value} {value.unit}"
+    elif isinstance(value, (EyeColor, HairColor, RaceEthnicity)):
+        return value.code
+    return value
+
+
+def parse_record(record: bytes, framing: str = "raw") -> dict[str, Any]:
+    # Runs in the worker processes, so only plain picklable values come back. Records are decoded here, so
+    # a line with a bad escape sequence is reported as that record's error.
+    barcode_file = parse_barcode_string(decode_record(record, framing))
+    decoded = decode_barcode_file(barcode_file)
+    row = {field: barcode_file["header"][field] for field in HEADER_FIELDS}
+    row.update((field, format_value(value)) for field, value in decoded.fields.items())
+    if decoded.errors:
+        row["decode_errors"] = decoded.errors
+    return row
+
+
+def read_barcodes(paths: Sequence[str], framing: str) -> Iterator[bytes]:
+    for path in paths or ("-",):
+        source = sys.stdin.buffer if path == "-" else path
+        yield from iter_records(source, framing, unescape=False)
+
+
+def output_rows(results: Iterable[BatchResult], fields: Optional[Sequence[str]]) -> Iterator[dict[str, Any]]:
+    for record, result in enumerate(results):
+        if result.error is not None:
+            yield {"record": record, "error": str(result.error)}
+            continue
+        row = result.barcode_file
+        if fields is not None:
+            row = {field: row.get(field) for field in fields}
+        yield {"record": record, **row}
+
+
+def write_ndjson(rows: Iterable[dict[str, Any]], output: TextIO) -> None:
+    for row in rows:
+        output.write(json.dumps(row, separators=(",", ":")))
+        output.write("\n")
+
+
+def write_csv(rows: Iterable[dict[str, Any]], output: TextIO, fields: Sequence[str]) -> None:
+    writer = csv.DictWriter(output, ("record",) + tuple(fields) + ("error",), extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def parse_fields(value: str) -> tuple[str, ...]:
+    fields = tuple(field.strip() for field in value.split(",") if field.strip())
+    unknown = [field for field in fields if field not in DEFAULT_FIELDS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown fields: {', '.join(unknown)}")
+    elif not fields:
+        raise argparse.ArgumentTypeError("no fields given")
+    return fields
+
+
+def parse_command(args: argparse.Namespace) -> int:
+    records = errors = 0
+
+    def results() -> Iterator[BatchResult]:
+        nonlocal records, errors
+        parser = partial(parse_record, framing=args.framing)
+        for result in parse_many(read_barcodes(args.files, args.framing), args.workers, args.batch_size, parser):
+            records += 1
+            errors += result.error is not None
+            yield result
+
+    start = time.perf_counter()
+    rows = output_rows(results(), args.fields)
+    if args.format == "csv":
+        write_csv(rows, sys.stdout, args.fields or DEFAULT_FIELDS)
+    else:
+        write_ndjson(rows, sys.stdout)
+    sys.stdout.flush()
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        rate = records / elapsed if elapsed > 0 else 0.0
+        print(f"{records} records, {errors} errors in {elapsed:.2f}s ({rate:,.0f} records/s)", file=sys.stderr)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aamva", description="AAMVA DL/ID barcode tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parse = commands.add_parser("parse", help="Parse barcodes and write their decoded fields.")
+    parse.add_argument("files", nargs="*", help="Files of raw barcodes. Reads stdin when omitted or '-'.")
+    parse.add_argument("--framing", choices=("raw", "escaped"), default="raw",
+                       help="raw: back to back barcodes (default). escaped: one escaped barcode per line.")
+    parse.add_argument("--format", choices=OUTPUT_FORMATS, default="ndjson", help="Output format (default: ndjson).")
+    parse.add_argument("--fields", type=parse_fields,
+                       help="Comma separated decoded fields to output, e.g. customer_id_number,date_of_birth.")
+    parse.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parse.add_argument("--batch-size", type=int, default=DEFAULT_CHUNKSIZE,
+                       help=f"Barcodes sent to a worker at a time (default: {DEFAULT_CHUNKSIZE}).")
+    parse.add_argument("-q", "--quiet", action="store_true", help="Do not print the throughput summary.")
+    parse.set_defaults(handler=parse_command)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except ValueError as error:
+        print(f"aamva: error: {error}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # The reader went away, e.g. piped into head. Silence the error Python would print at exit.
+        sys.stdout = open(os.devnull, "w")
+        return 1
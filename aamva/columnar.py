@@ -0,0 +1,204 @@
+import os
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date
+from functools import partial
+from types import MappingProxyType
+from typing import Literal, NamedTuple, Optional, Union
+
+import aamva.elements as elements
+from aamva.barcode import BarcodeFile, find_element_value, parse_barcode_string
+from aamva.batch import DEFAULT_CHUNKSIZE, parse_many
+from aamva.dates import get_issuer_date_format
+
+ColumnKind = Literal["int", "date", "string"]
+
+HEADER_COLUMNS = ("issuer_id", "aamva_version", "jurisdiction_version", "number_of_entries")
+DATE_ELEMENTS = frozenset(
+    element_id
+    for schema in elements.SCHEMAS.values()
+    for element_id, element in schema.items()
+    if element.decoder is elements.decode_date)
+
+# Buffers use Arrow's layouts: int64 values, int32 days since the Unix epoch for dates, int64 offsets into
+# UTF-8 data for strings, and a least significant bit first validity bitmap.
+VALUE_TYPECODES = MappingProxyType({"int": "q", "date": "i", "string": "q"})
+UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class Column(NamedTuple):
+    kind: ColumnKind
+    length: int
+    values: array
+    validity: bytearray
+    data: bytearray
+
+
+class ColumnarBatch(NamedTuple):
+    num_rows: int
+    columns: dict[str, Column]
+    errors: tuple[tuple[int, Exception], ...]
+
+
+def column_kind(name: str) -> ColumnKind:
+    if name in HEADER_COLUMNS:
+        return "int"
+    elif name in DATE_ELEMENTS:
+        return "date"
+    elif len(name) == 3:
+        return "string"
+    raise ValueError(f"Column '{name}' is not a header field or element ID.")
+
+
+class ColumnBuilder:
+    __slots__ = ("kind", "length", "values", "validity", "data")
+
+    def __init__(self, kind: ColumnKind):
+        self.kind = kind
+        self.length = 0
+        self.values = array(VALUE_TYPECODES[kind], [0] if kind == "string" else [])
+        self.validity = bytearray()
+        self.data = bytearray()
+
+    def append(self, value) -> None:
+        # Takes an int for int and date columns, a str for string columns, or None for a null.
+        if self.length & 7 == 0:
+            self.validity.append(0)
+        if value is not None:
+            self.validity[-1] |= 1 << (self.length & 7)
+        self.length += 1
+        if self.kind == "string":
+            if value is not None:
+                self.data += value.encode("utf-8")
+            self.values.append(len(self.data))
+        else:
+            self.values.append(0 if value is None else value)
+
+    def finish(self) -> Column:
+        return Column(self.kind, self.length, self.values, self.validity, self.data)
+
+
+def date_days(value: Optional[str], date_format: Optional[str],
+              decoder: Callable[[str, Optional[str]], date] = elements.decode_date) -> Optional[int]:
+    if value is None or date_format is None:
+        return None
+    try:
+        return decoder(value, date_format).toordinal() - UNIX_EPOCH_ORDINAL
+    except ValueError:
+        return None
+
+
+def append_row(builders: dict[str, ColumnBuilder], barcode_file: BarcodeFile) -> None:
+    header = barcode_file["header"]
+    date_format = None
+    schema = None
+    if any(builder.kind == "date" for builder in builders.values()):
+        # Dates are decoded as the element schema of the card's version decodes them.
+        schema = elements.get_schema(header["aamva_version"])
+        try:
+            date_format = get_issuer_date_format(header["issuer_id"], header["aamva_version"])
+        except ValueError:
+            pass  # Unknown issuer, so its dates are null
+
+    for name, builder in builders.items():
+        if builder.kind == "int":
+            builder.append(header.get(name))
+        elif builder.kind == "date":
+            element = schema.get(name)
+            decoder = elements.decode_date if element is None else element.decoder
+            builder.append(date_days(find_element_value(barcode_file, name), date_format, decoder))
+        else:
+            builder.append(find_element_value(barcode_file, name))
+
+
+def parse_columns(
+        barcodes: Iterable,
+        columns: Sequence[str],
+        workers: Optional[int] = None,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        parser: Optional[Callable[..., BarcodeFile]] = None) -> ColumnarBatch:
+    # Each parsed card is appended to the column buffers and dropped, so no list of BarcodeFile dicts is
+    # built. By default only the requested elements are extracted from each subfile. Barcodes that fail to
+    # parse are left out of the columns and reported by their input position.
+    if not columns:
+        raise ValueError("columns cannot be empty.")
+    builders = {name: ColumnBuilder(column_kind(name)) for name in columns}
+    if parser is None:
+        wanted = frozenset(name for name in columns if name not in HEADER_COLUMNS)
+        parser = partial(parse_barcode_string, wanted=wanted)
+
+    num_rows = 0
+    errors = list()
+    for index, result in enumerate(parse_many(barcodes, workers, chunksize, parser)):
+        if result.error is not None:
+            errors.append((index, result.error))
+        else:
+            append_row(builders, result.barcode_file)
+            num_rows += 1
+
+    return ColumnarBatch(num_rows, {name: builder.finish() for name, builder in builders.items()}, tuple(errors))
+
+
+def is_valid(column: Column, index: int) -> bool:
+    return bool(column.validity[index >> 3] & (1 << (index & 7)))
+
+
+def column_to_list(column: Column) -> list:
+    values = list()
+    for i in range(column.length):
+        if not is_valid(column, i):
+            values.append(None)
+        elif column.kind == "int":
+            values.append(column.values[i])
+        elif column.kind == "date":
+            values.append(date.fromordinal(column.values[i] + UNIX_EPOCH_ORDINAL))
+        else:
+            values.append(column.data[column.values[i]:column.values[i + 1]].decode("utf-8"))
+    return values
+
+
+def column_to_numpy(column: Column):
+    # Int columns become masked int64 arrays, date columns datetime64[D] arrays with NaT for nulls, and
+    # string columns object arrays with None for nulls. Requires numpy.
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("column_to_numpy requires numpy to be installed.")
+
+    validity = numpy.frombuffer(column.validity, dtype=numpy.uint8)
+    valid = numpy.unpackbits(validity, count=column.length, bitorder="little").astype(bool)
+    if column.kind == "int":
+        return numpy.ma.masked_array(numpy.frombuffer(column.values, dtype=numpy.int64), mask=~valid)
+    elif column.kind == "date":
+        days = numpy.frombuffer(column.values, dtype=numpy.int32).astype("datetime64[D]")
+        return numpy.where(valid, days, numpy.datetime64("NaT"))
+    return numpy.array(column_to_list(column), dtype=object)
+
+
+def to_numpy(batch: ColumnarBatch) -> dict:
+    return {name: column_to_numpy(column) for name, column in batch.columns.items()}
+
+
+def to_arrow(batch: ColumnarBatch):
+    # The column buffers are handed to pyarrow as they are, without copying. Requires pyarrow.
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("to_arrow requires pyarrow to be installed.")
+
+    arrow_types = {"int": pyarrow.int64(), "date": pyarrow.date32(), "string": pyarrow.large_string()}
+    arrays = list()
+    for column in batch.columns.values():
+        buffers = [pyarrow.py_buffer(column.validity), pyarrow.py_buffer(column.values)]
+        if column.kind == "string":
+            buffers.append(pyarrow.py_buffer(column.data))
+        arrays.append(pyarrow.Array.from_buffers(arrow_types[column.kind], column.length, buffers))
+    return pyarrow.Table.from_arrays(arrays, names=list(batch.columns))
+
+
+def write_parquet(batch: ColumnarBatch, path: Union[str, os.PathLike]) -> None:
+    try:
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("write_parquet requires pyarrow to be installed.")
+    pyarrow.parquet.write_table(to_arrow(batch), path)
@@ -1,27 +1,154 @@
+from collections.abc import Iterable
 from datetime import datetime, date
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+from aamva.barcode import AAMVA_VERSIONS, HEADER_LAYOUTS
+import aamva.issuing_authority as issuing_authority
+from aamva.issuing_authority import ISSUING_AUTHORITIES, IssuingAuthority, get_authority_by_id, get_authority_index
 
 ISO_FORMAT = "%Y%m%d"
 IMPERIAL_FORMAT = "%m%d%Y"
 
+# (year, month, day) slice positions for the fixed width 8 digit formats.
+DATE_FIELD_SLICES = MappingProxyType({
+    ISO_FORMAT: ((0, 4), (4, 6), (6, 8)),
+    IMPERIAL_FORMAT: ((4, 8), (0, 2), (2, 4))})
+
+COUNTRY_DATE_FORMATS = MappingProxyType({
+    "CANADA": ISO_FORMAT,
+    "MEXICO": ISO_FORMAT,
+    "USA": IMPERIAL_FORMAT})
+
 
 def country_date_format(country: str) -> str:
-    country = country.upper()
-    if country == "CANADA":
-        return ISO_FORMAT
-    elif country == "MEXICO":
-        return ISO_FORMAT
-    elif country == "USA":
-        return IMPERIAL_FORMAT
-    raise ValueError("Provided country is not supported.")
+    try:
+        return COUNTRY_DATE_FORMATS[country.upper()]
+    except KeyError:
+        raise ValueError("Provided country is not supported.")
 
 
 def get_date_format(aamva_version: int, country: str) -> str:
-    # AAMVA Version 3 introduced ISO date format option, prior versions only used Imperial format.
+    # AAMVA Version 1 used ISO format, Version 2 only Imperial format, and Version 3 introduced the ISO format
+    # option by country.
+    if aamva_version < 2:
+        return ISO_FORMAT
     return IMPERIAL_FORMAT if aamva_version < 3 else country_date_format(country)
 
 
+def build_issuer_date_formats(authorities: tuple[IssuingAuthority, ...]) -> dict[tuple[int, int], str]:
+    formats = dict()
+    for authority in authorities:
+        if authority.country.upper() not in COUNTRY_DATE_FORMATS:
+            continue
+        for aamva_version in AAMVA_VERSIONS:
+            formats[(authority.issuer_id, aamva_version)] = get_date_format(aamva_version, authority.country)
+    return formats
+
+
+class IssuerDateFormats(NamedTuple):
+    source: tuple[IssuingAuthority, ...]
+    # Precomputed, and filled in on demand for the newer versions a header can carry, so it holds at most
+    # one entry per issuer and version (1-99).
+    formats: dict[tuple[int, int], str]
+
+
+def build_issuer_date_format_index(authorities: tuple[IssuingAuthority, ...]) -> IssuerDateFormats:
+    return IssuerDateFormats(authorities, build_issuer_date_formats(authorities))
+
+
+_issuer_date_formats = build_issuer_date_format_index(ISSUING_AUTHORITIES)
+
+
+def get_issuer_date_formats() -> IssuerDateFormats:
+    # Rebuilt together with the authority index, so a replaced ISSUING_AUTHORITIES is never answered from
+    # formats built for the previous list.
+    global _issuer_date_formats
+    formats = _issuer_date_formats
+    if formats.source is not issuing_authority.ISSUING_AUTHORITIES:
+        source = get_authority_index().source
+        formats = _issuer_date_formats = build_issuer_date_format_index(source)
+    return formats
+
+
+def resolve_issuer_date_format(issuer_id: int, aamva_version: int) -> str:
+    return get_date_format(aamva_version, get_authority_by_id(issuer_id).country)
+
+
+def get_issuer_date_format(issuer_id: int, aamva_version: int) -> str:
+    # The staleness check is inlined, as this is called once per decoded card.
+    source, formats = _issuer_date_formats
+    if source is not issuing_authority.ISSUING_AUTHORITIES:
+        formats = get_issuer_date_formats().formats
+    try:
+        return formats[(issuer_id, aamva_version)]
+    except KeyError:
+        pass
+    if aamva_version not in HEADER_LAYOUTS:
+        raise ValueError("aamva_version is out of range (1-99).")
+    format = formats[(issuer_id, aamva_version)] = resolve_issuer_date_format(issuer_id, aamva_version)
+    return format
+
+
+def decode_date(date_string: str, format: str) -> date:
+    # Integer slicing is much faster than strptime for the two fixed width formats AAMVA uses.
+    (year_start, year_end), (month_start, month_end), (day_start, day_end) = DATE_FIELD_SLICES[format]
+    if len(date_string) != 8 or not (date_string.isascii() and date_string.isdigit()):
+        raise ValueError("Invalid date format for provided date string.")
+    try:
+        return date(
+            int(date_string[year_start:year_end]),
+            int(date_string[month_start:month_end]),
+            int(date_string[day_start:day_end]))
+    except ValueError:
+        raise ValueError("Invalid date format for provided date string.")
+
+
 def parse_date(date_string: str, format: str) -> date:
+    if format in DATE_FIELD_SLICES:
+        return decode_date(date_string, format)
     try:
         return datetime.strptime(date_string, format).date()
     except ValueError:
         raise ValueError("Invalid date format for provided date string.")
+
+
+def parse_dates(date_strings: Iterable[str], format: str) -> list[Optional[date]]:
+    dates = list()
+    for date_string in date_strings:
+        try:
+            dates.append(parse_date(date_string, format))
+        except ValueError:
+            dates.append(None)
+    return dates
+
+
+def parse_dates_array(date_strings: Iterable[str], format: str):
+    # Returns a numpy datetime64[D] array with NaT for invalid dates. Requires numpy.
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("parse_dates_array requires numpy to be installed.")
+
+    (year_start, year_end), (month_start, month_end), (day_start, day_end) = DATE_FIELD_SLICES[format]
+
+    # One extra character per row so strings longer than 8 characters can be detected.
+    chars = numpy.array(list(date_strings), dtype="U9").view(numpy.uint32).reshape(-1, 9)
+    digits = chars[:, :8].astype(numpy.int64) - ord("0")
+    valid = (chars[:, 8] == 0) & ((digits >= 0) & (digits <= 9)).all(axis=1)
+
+    def field(start: int, end: int):
+        weights = 10 ** numpy.arange(end - start - 1, -1, -1, dtype=numpy.int64)
+        return digits[:, start:end] @ weights
+
+    year = field(year_start, year_end)
+    month = field(month_start, month_end)
+    day = field(day_start, day_end)
+    valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+
+    months = (year - 1970).astype("datetime64[Y]").astype("datetime64[M]") + numpy.clip(month, 1, 12) - 1
+    month_starts = months.astype("datetime64[D]")
+    days_in_month = ((months + 1).astype("datetime64[D]") - month_starts).astype(numpy.int64)
+    valid &= day <= days_in_month
+
+    return numpy.where(valid, month_starts + (day - 1), numpy.datetime64("NaT"))
@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import NamedTuple, Optional
+
+from aamva.barcode import DATA_ELEMENT_SEPARATOR, BarcodeFile, BarcodeStr, find_element_value, parse_barcode_string
+from aamva.issuing_authority import get_authority_by_id
+
+DEFAULT_WINDOW = 300.0
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+class Sighting(NamedTuple):
+    first_seen: float
+    last_seen: float
+    count: int
+    source: Optional[Hashable]  # Where the card was last scanned, e.g. a kiosk ID
+
+
+class DuplicateStats(NamedTuple):
+    scans: int
+    duplicates: int
+    expirations: int
+    evictions: int
+    entries: int
+
+
+def scan_key(barcode_file: BarcodeFile, match_discriminator: bool = False) -> str:
+    # The issuer ID, customer ID number (DAQ) and optionally the document discriminator (DCF), joined into a
+    # single string. The data element separator cannot appear in a value, so distinct cards never share a key,
+    # and one string is smaller than a tuple of its parts.
+    authority = get_authority_by_id(barcode_file["header"]["issuer_id"])
+    customer_id = (find_element_value(barcode_file, "DAQ") or "").strip()
+    if not customer_id:
+        raise ValueError("Barcode has no customer ID number (DAQ).")
+    parts = [str(authority.issuer_id), customer_id]
+    if match_discriminator:
+        parts.append((find_element_value(barcode_file, "DCF") or "").strip())
+    return DATA_ELEMENT_SEPARATOR.join(parts)
+
+
+class DuplicateScanIndex:
+    # Thread-safe index of recently scanned cards. A scan is a duplicate when the same card was last scanned
+    # less than window seconds ago. Entries are kept in the order they were last seen, so expiry only looks at
+    # the oldest entries and insert, lookup and expiry are all O(1) amortized. Past max_entries the least
+    # recently seen card is evicted.
+
+    def __init__(self, window: float = DEFAULT_WINDOW, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 match_discriminator: bool = False,
+                 parser: Callable[[BarcodeStr], BarcodeFile] = parse_barcode_string,
+                 clock: Callable[[], float] = time.monotonic):
+        if window <= 0:
+            raise ValueError("window must be greater than 0.")
+        elif max_entries < 1:
+            raise ValueError("max_entries cannot be less than 1.")
+        self.window = window
+        self.max_entries = max_entries
+        self.match_discriminator = match_discriminator
+        self.parser = parser
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._scans = 0
+        self._duplicates = 0
+        self._expirations = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> DuplicateStats:
+        with self._lock:
+            return DuplicateStats(
+                scans=self._scans,
+                duplicates=self._duplicates,
+                expirations=self._expirations,
+                evictions=self._evictions,
+                entries=len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def record(self, barcode_file: BarcodeFile, source: Optional[Hashable] = None) -> Optional[Sighting]:
+        # Returns the card's previous sighting when this scan is a duplicate, otherwise None.
+        key = scan_key(barcode_file, self.match_discriminator)
+        with self._lock:
+            # Read the clock under the lock, so entries stay ordered by last_seen with concurrent producers.
+            now = self.clock()
+            self._expire(now)
+            previous = self._entries.pop(key, None)
+            self._scans += 1
+            if previous is None:
+                self._entries[key] = Sighting(now, now, 1, source)
+            else:
+                self._duplicates += 1
+                self._entries[key] = Sighting(previous.first_seen, now, previous.count + 1, source)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return previous
+
+    def scan(self, barcode_string: BarcodeStr,
+             source: Optional[Hashable] = None) -> tuple[BarcodeFile, Optional[Sighting]]:
+        # Parse outside the lock; invalid payloads raise and are not recorded.
+        barcode_file = self.parser(barcode_string)
+        return barcode_file, self.record(barcode_file, source)
+
+    def lookup(self, barcode_file: BarcodeFile) -> Optional[Sighting]:
+        key = scan_key(barcode_file, self.match_discriminator)
+        with self._lock:
+            self._expire(self.clock())
+            return self._entries.get(key)
+
+    def _expire(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._entries and next(iter(self._entries.values())).last_seen <= cutoff:
+            self._entries.popitem(last=False)
+            self._expirations += 1
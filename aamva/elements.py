@@ -0,0 +1,267 @@
+from collections.abc import Callable, Mapping
+from datetime import date
+from types import MappingProxyType
+from typing import Any, NamedTuple, Optional
+
+from aamva.barcode import AAMVA_VERSIONS, BarcodeFile
+from aamva.dates import get_issuer_date_format, parse_date
+from aamva.eye_color import EyeColor, parse_eye_color
+from aamva.hair_color import HairColor, parse_hair_color
+from aamva.race_ethnicity import RaceEthnicity, parse_race_ethnicity
+
+# Subfile types that carry the Annex D card elements.
+CARD_SUBFILE_TYPES = ("DL", "ID")
+
+SEXES = MappingProxyType({
+    "1": "Male",
+    "2": "Female",
+    "9": "Not specified",
+    "M": "Male",  # AAMVA Version 1 used letters
+    "F": "Female"})
+
+TRUNCATIONS = MappingProxyType({
+    "T": True,
+    "N": False,
+    "U": None})
+
+# AAMVA Version 1 cards may use two letter color codes, padded to three characters.
+VERSION_1_EYE_COLORS = MappingProxyType({
+    "BK": "BLK",
+    "BL": "BLU",
+    "BR": "BRO",
+    "DI": "DIC",
+    "GY": "GRY",
+    "GR": "GRN",
+    "HZ": "HAZ",
+    "MA": "MAR",
+    "PK": "PNK",
+    "UN": "UNK"})
+
+VERSION_1_HAIR_COLORS = MappingProxyType({
+    "BA": "BAL",
+    "BK": "BLK",
+    "BL": "BLN",
+    "BR": "BRO",
+    "GY": "GRY",
+    "RD": "RED",
+    "SD": "SDY",
+    "WH": "WHI",
+    "UN": "UNK"})
+
+
+class Height(NamedTuple):
+    value: int
+    unit: str
+
+
+class ElementSchema(NamedTuple):
+    field: str
+    decoder: Callable[[str, str], Any]
+
+
+class DecodedElements(NamedTuple):
+    fields: dict[str, Any]
+    errors: dict[str, str]
+
+
+def decode_text(value: str, date_format: str) -> str:
+    return value.strip()
+
+
+def decode_int(value: str, date_format: str) -> int:
+    return int(value)
+
+
+def decode_date(value: str, date_format: Optional[str]) -> date:
+    if date_format is None:
+        raise ValueError("Date format for the issuer is unknown.")
+    return parse_date(value.strip(), date_format)
+
+
+def decode_flag(value: str, date_format: str) -> bool:
+    return value.strip() == "1"
+
+
+def decode_sex(value: str, date_format: str) -> str:
+    try:
+        return SEXES[value.strip()]
+    except KeyError:
+        raise ValueError(f"Sex code '{value}' not found.")
+
+
+def decode_truncation(value: str, date_format: str) -> Optional[bool]:
+    try:
+        return TRUNCATIONS[value.strip()]
+    except KeyError:
+        raise ValueError(f"Truncation code '{value}' not found.")
+
+
+def decode_height(value: str, date_format: str) -> Height:
+    # Version 2 and later, for example "068 in" or "175 cm".
+    number, _, unit = value.strip().partition(" ")
+    if unit not in ("in", "cm"):
+        raise ValueError(f"Height '{value}' has an invalid unit.")
+    return Height(int(number), unit)
+
+
+def decode_height_feet_inches(value: str, date_format: str) -> Height:
+    # Version 1, for example "509" for 5'09".
+    value = value.strip()
+    return Height(int(value[:-2]) * 12 + int(value[-2:]), "in")
+
+
+def decode_height_cm(value: str, date_format: str) -> Height:
+    return Height(int(value), "cm")
+
+
+def decode_eye_color(value: str, date_format: str) -> EyeColor:
+    return parse_eye_color(value.strip())
+
+
+def decode_hair_color(value: str, date_format: str) -> HairColor:
+    return parse_hair_color(value.strip())
+
+
+def decode_eye_color_version_1(value: str, date_format: str) -> EyeColor:
+    value = value.strip()
+    return parse_eye_color(VERSION_1_EYE_COLORS.get(value, value))
+
+
+def decode_hair_color_version_1(value: str, date_format: str) -> HairColor:
+    value = value.strip()
+    return parse_hair_color(VERSION_1_HAIR_COLORS.get(value, value))
+
+
+def decode_race_ethnicity(value: str, date_format: str) -> RaceEthnicity:
+    return parse_race_ethnicity(value.strip())
+
+
+# Elements shared by every version.
+COMMON_ELEMENTS = MappingProxyType({
+    "DAG": ElementSchema("address_street_1", decode_text),
+    "DAH": ElementSchema("address_street_2", decode_text),
+    "DAI": ElementSchema("address_city", decode_text),
+    "DAJ": ElementSchema("address_jurisdiction_code", decode_text),
+    "DAK": ElementSchema("address_postal_code", decode_text),
+    "DAQ": ElementSchema("customer_id_number", decode_text),
+    "DAW": ElementSchema("weight_pounds", decode_int),
+    "DAX": ElementSchema("weight_kilograms", decode_int),
+    "DAY": ElementSchema("eye_color", decode_eye_color),
+    "DAZ": ElementSchema("hair_color", decode_hair_color),
+    "DBA": ElementSchema("document_expiration_date", decode_date),
+    "DBB": ElementSchema("date_of_birth", decode_date),
+    "DBC": ElementSchema("sex", decode_sex),
+    "DBD": ElementSchema("document_issue_date", decode_date)})
+
+VERSION_1_ELEMENTS = MappingProxyType({
+    "DAA": ElementSchema("customer_full_name", decode_text),
+    "DAB": ElementSchema("customer_family_name", decode_text),
+    "DAC": ElementSchema("customer_first_name", decode_text),
+    "DAD": ElementSchema("customer_middle_name", decode_text),
+    "DAE": ElementSchema("name_suffix", decode_text),
+    "DAF": ElementSchema("name_prefix", decode_text),
+    "DAR": ElementSchema("jurisdiction_vehicle_class", decode_text),
+    "DAS": ElementSchema("jurisdiction_restriction_codes", decode_text),
+    "DAT": ElementSchema("jurisdiction_endorsement_codes", decode_text),
+    "DAU": ElementSchema("height", decode_height_feet_inches),
+    "DAV": ElementSchema("height", decode_height_cm),
+    "DAY": ElementSchema("eye_color", decode_eye_color_version_1),
+    "DAZ": ElementSchema("hair_color", decode_hair_color_version_1)})
+
+# Elements introduced by Version 2.
+VERSION_2_ELEMENTS = MappingProxyType({
+    "DAU": ElementSchema("height", decode_height),
+    "DCA": ElementSchema("jurisdiction_vehicle_class", decode_text),
+    "DCB": ElementSchema("jurisdiction_restriction_codes", decode_text),
+    "DCD": ElementSchema("jurisdiction_endorsement_codes", decode_text),
+    "DCE": ElementSchema("weight_range", decode_int),
+    "DCF": ElementSchema("document_discriminator", decode_text),
+    "DCG": ElementSchema("country_identification", decode_text),
+    "DCI": ElementSchema("place_of_birth", decode_text),
+    "DCJ": ElementSchema("audit_information", decode_text),
+    "DCK": ElementSchema("inventory_control_number", decode_text),
+    "DCL": ElementSchema("race_ethnicity", decode_race_ethnicity),
+    "DCM": ElementSchema("standard_vehicle_classification", decode_text),
+    "DCN": ElementSchema("standard_endorsement_code", decode_text),
+    "DCO": ElementSchema("standard_restriction_code", decode_text),
+    "DCP": ElementSchema("jurisdiction_vehicle_class_description", decode_text),
+    "DCQ": ElementSchema("jurisdiction_endorsement_code_description", decode_text),
+    "DCR": ElementSchema("jurisdiction_restriction_code_description", decode_text),
+    "DCS": ElementSchema("customer_family_name", decode_text),
+    "DCT": ElementSchema("customer_given_names", decode_text),
+    "DCU": ElementSchema("name_suffix", decode_text),
+    "DBN": ElementSchema("alias_family_name", decode_text),
+    "DBG": ElementSchema("alias_given_name", decode_text),
+    "DBS": ElementSchema("alias_suffix_name", decode_text)})
+
+# Elements introduced by Version 4, which split given names and added the remaining optional elements.
+VERSION_4_ELEMENTS = MappingProxyType({
+    "DAC": ElementSchema("customer_first_name", decode_text),
+    "DAD": ElementSchema("customer_middle_name", decode_text),
+    "DDA": ElementSchema("compliance_type", decode_text),
+    "DDB": ElementSchema("card_revision_date", decode_date),
+    "DDC": ElementSchema("hazmat_endorsement_expiration_date", decode_date),
+    "DDD": ElementSchema("limited_duration_document", decode_flag),
+    "DDE": ElementSchema("family_name_truncation", decode_truncation),
+    "DDF": ElementSchema("first_name_truncation", decode_truncation),
+    "DDG": ElementSchema("middle_name_truncation", decode_truncation),
+    "DDH": ElementSchema("under_18_until", decode_date),
+    "DDI": ElementSchema("under_19_until", decode_date),
+    "DDJ": ElementSchema("under_21_until", decode_date),
+    "DDK": ElementSchema("organ_donor", decode_flag),
+    "DDL": ElementSchema("veteran", decode_flag)})
+
+
+def compile_schema(aamva_version: int) -> dict[str, ElementSchema]:
+    schema = dict(COMMON_ELEMENTS)
+    if aamva_version < 2:
+        schema.update(VERSION_1_ELEMENTS)
+        return schema
+    schema.update(VERSION_2_ELEMENTS)
+    if aamva_version >= 4:
+        schema.update(VERSION_4_ELEMENTS)
+    return schema
+
+
+SCHEMAS = MappingProxyType({
+    aamva_version: MappingProxyType(compile_schema(aamva_version)) for aamva_version in AAMVA_VERSIONS})
+
+
+def get_schema(aamva_version: int) -> Mapping[str, ElementSchema]:
+    # Versions newer than the library knows about are decoded with the latest schema.
+    try:
+        return SCHEMAS[aamva_version]
+    except KeyError:
+        if aamva_version > AAMVA_VERSIONS[-1]:
+            return SCHEMAS[AAMVA_VERSIONS[-1]]
+        raise ValueError("aamva_version is out of range (1-99).")
+
+
+def decode_elements(elements: Mapping[str, str], aamva_version: int,
+                    date_format: Optional[str]) -> DecodedElements:
+    # Unknown elements are skipped; elements that fail to decode are reported instead of aborting the card.
+    schema = get_schema(aamva_version)
+    fields = dict()
+    errors = dict()
+    for element_id, value in elements.items():
+        element = schema.get(element_id)
+        if element is None:
+            continue
+        try:
+            fields[element.field] = element.decoder(value, date_format)
+        except ValueError as error:
+            errors[element_id] = str(error)
+    return DecodedElements(fields, errors)
+
+
+def decode_barcode_file(barcode_file: BarcodeFile) -> DecodedElements:
+    header = barcode_file["header"]
+    for subfile in barcode_file["subfiles"]:
+        if subfile["subfile_type"] in CARD_SUBFILE_TYPES:
+            # An unknown issuer only leaves its dates undecoded, reported as element errors.
+            try:
+                date_format = get_issuer_date_format(header["issuer_id"], header["aamva_version"])
+            except ValueError:
+                date_format = None
+            return decode_elements(subfile["elements"], header["aamva_version"], date_format)
+    raise ValueError("Barcode file has no DL or ID subfile.")
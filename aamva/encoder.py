@@ -0,0 +1,100 @@
+from aamva.barcode import (
+    DATA_ELEMENT_SEPARATOR, DESIGNATOR_LENGTH, HEADER_PREFIX, RECORD_SEPARATOR, SEGMENT_TERMINATOR,
+    BarcodeFile, BarcodeStr, FileHeader, Subfile, get_header_layout)
+from aamva.barcode_bytes import ENCODING
+
+MAX_NUMBER_OF_ENTRIES = 99
+MAX_SUBFILE_POSITION = 9999
+SEPARATORS = frozenset((DATA_ELEMENT_SEPARATOR, RECORD_SEPARATOR, SEGMENT_TERMINATOR))
+
+
+def check_width(name: str, value: int, width: int) -> None:
+    if value < 0 or value >= 10 ** width:
+        raise ValueError(f"{name} does not fit in {width} digits.")
+
+
+def encode_file_header(header: FileHeader, number_of_entries: int) -> str:
+    aamva_version = header["aamva_version"]
+    layout = get_header_layout(aamva_version)  # Validates the version range
+    if header["number_of_entries"] != number_of_entries:
+        raise ValueError("Number of entries does not match the number of subfiles.")
+    elif number_of_entries < 1 or number_of_entries > MAX_NUMBER_OF_ENTRIES:
+        raise ValueError("Number of entries is out of range (1-99).")
+    check_width("issuer_id", header["issuer_id"], 6)
+
+    jurisdiction_version = header.get("jurisdiction_version") or 0
+    check_width("jurisdiction_version", jurisdiction_version, 2)
+
+    if layout.jurisdiction_version_offset is None:
+        if jurisdiction_version:
+            raise ValueError("Version 1 headers have no jurisdiction_version.")
+        return f"{HEADER_PREFIX}{header['issuer_id']:06d}{aamva_version:02d}{number_of_entries:02d}"
+    return f"{HEADER_PREFIX}{header['issuer_id']:06d}{aamva_version:02d}{jurisdiction_version:02d}{number_of_entries:02d}"
+
+
+def encode_subfile(subfile: Subfile) -> str:
+    items = list()
+    for code, value in subfile["elements"].items():
+        if len(code) != 3:
+            raise ValueError(f"Element ID '{code}' must be 3 characters.")
+        elif not SEPARATORS.isdisjoint(code):
+            raise ValueError(f"Element ID {code!r} contains a separator character.")
+        elif DATA_ELEMENT_SEPARATOR in value or SEGMENT_TERMINATOR in value:
+            raise ValueError(f"Element '{code}' contains a separator character.")
+        items.append(code + value)
+    if len(subfile["subfile_type"]) != 2:
+        raise ValueError(f"Subfile type '{subfile['subfile_type']}' must be 2 characters.")
+    elif not SEPARATORS.isdisjoint(subfile["subfile_type"]):
+        raise ValueError(f"Subfile type {subfile['subfile_type']!r} contains a separator character.")
+    return subfile["subfile_type"] + DATA_ELEMENT_SEPARATOR.join(items) + SEGMENT_TERMINATOR
+
+
+def encode_subfile_designator(subfile_type: str, offset: int, length: int) -> str:
+    if offset + length > MAX_SUBFILE_POSITION + 1:
+        raise ValueError("Subfile does not fit in 4 digit offset and length.")
+    return f"{subfile_type}{offset:04d}{length:04d}"
+
+
+def encode_barcode(barcode_file: BarcodeFile) -> BarcodeStr:
+    subfiles = barcode_file["subfiles"]
+    header = encode_file_header(barcode_file["header"], len(subfiles))
+    bodies = tuple(map(encode_subfile, subfiles))
+
+    designators = list()
+    offset = len(header) + DESIGNATOR_LENGTH * len(subfiles)
+    for subfile, body in zip(subfiles, bodies):
+        designators.append(encode_subfile_designator(subfile["subfile_type"], offset, len(body)))
+        offset += len(body)
+
+    return BarcodeStr(header + "".join(designators) + "".join(bodies))
+
+
+def encode_barcode_into(barcode_file: BarcodeFile, buffer: bytearray, start: int = 0) -> int:
+    # Writes the encoded barcode into a caller owned buffer, growing it if needed, and returns the end position.
+    # Subfile bodies are written first and the designator table is filled in afterwards, so the subfiles are
+    # never joined into an intermediate string.
+    if start > len(buffer):
+        raise ValueError("Start position is past the end of the buffer.")
+    subfiles = barcode_file["subfiles"]
+    header = encode_file_header(barcode_file["header"], len(subfiles)).encode(ENCODING)
+    buffer[start:start + len(header)] = header
+
+    designator_cursor = start + len(header)
+    cursor = designator_cursor + DESIGNATOR_LENGTH * len(subfiles)
+    if len(buffer) < cursor:
+        buffer[designator_cursor:] = bytes(cursor - designator_cursor)
+    for subfile in subfiles:
+        body = encode_subfile(subfile).encode(ENCODING)
+        buffer[cursor:cursor + len(body)] = body
+        designator = encode_subfile_designator(subfile["subfile_type"], cursor - start, len(body))
+        buffer[designator_cursor:designator_cursor + DESIGNATOR_LENGTH] = designator.encode(ENCODING)
+        designator_cursor += DESIGNATOR_LENGTH
+        cursor += len(body)
+
+    return cursor
+
+
+def encode_barcode_bytes(barcode_file: BarcodeFile) -> bytes:
+    buffer = bytearray()
+    encode_barcode_into(barcode_file, buffer)
+    return bytes(buffer)
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import NamedTuple
 
 
@@ -18,11 +19,12 @@ EYE_COLORS = (
     EyeColor("MAR", "Maroon", "Maroon"),
     EyeColor("PNK", "Pink", "Pink or albino"),
     EyeColor("UNK", "Unknown", "Unknown"))
+EYE_COLORS_BY_CODE = MappingProxyType({x.code: x for x in EYE_COLORS})
 
 
 def parse_eye_color(code: str) -> EyeColor:
     code = "BRO" if code == "BRN" else code  # Some cards use BRN for Brown
     try:
-        return tuple(filter(lambda x: x.code == code, EYE_COLORS))[0]
-    except IndexError:
+        return EYE_COLORS_BY_CODE[code]
+    except KeyError:
         raise ValueError(f"Color code '{code}' not found.")
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import NamedTuple
 
 
@@ -16,11 +17,12 @@ HAIR_COLORS = (
     HairColor("SDY", "Sandy"),
     HairColor("WHI", "White"),
     HairColor("UNK", "Unknown"))
+HAIR_COLORS_BY_CODE = MappingProxyType({x.code: x for x in HAIR_COLORS})
 
 
 def parse_hair_color(code: str) -> HairColor:
     code = "BRO" if code == "BRN" else code  # Some cards use BRN for Brown
     try:
-        return tuple(filter(lambda x: x.code == code, HAIR_COLORS))[0]
-    except IndexError:
+        return HAIR_COLORS_BY_CODE[code]
+    except KeyError:
         raise ValueError(f"Color code '{code}' not found.")
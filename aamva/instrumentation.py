@@ -0,0 +1,143 @@
+import re
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import NamedTuple, Optional
+
+import aamva.barcode as barcode
+import aamva.dates as dates
+import aamva.eye_color as eye_color
+import aamva.hair_color as hair_color
+import aamva.issuing_authority as issuing_authority
+import aamva.race_ethnicity as race_ethnicity
+
+# Called with (stage, elapsed_ns, error) after every instrumented call.
+Observer = Callable[[str, int, Optional[ValueError]], None]
+
+INSTRUMENTED_FUNCTIONS = (
+    (barcode, "parse_file_header"),
+    (barcode, "parse_subfile_designator"),
+    (barcode, "parse_subfile_designators"),
+    (barcode, "parse_subfile"),
+    (dates, "parse_date"),
+    (eye_color, "parse_eye_color"),
+    (hair_color, "parse_hair_color"),
+    (race_ethnicity, "parse_race_ethnicity"),
+    (issuing_authority, "get_authority_by_id"))
+
+# Upper bounds, in nanoseconds, of the latency histogram buckets. The last bucket is unbounded.
+LATENCY_BUCKETS_NS = (500, 1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, float("inf"))
+
+_QUOTED_VALUE_PATTERN = re.compile(r"'[^']*'")
+_patches = list()
+_patches_lock = threading.Lock()
+
+
+def error_reason(error: ValueError) -> str:
+    # Quoted values are masked so reasons like "Color code 'XYZ' not found." have bounded cardinality.
+    return _QUOTED_VALUE_PATTERN.sub("'*'", str(error))
+
+
+class StageMetrics(NamedTuple):
+    calls: int
+    total_ns: int
+    buckets: tuple[int, ...]
+    errors: dict[str, int]
+
+
+class MetricsRecorder:
+    # Observer that keeps per-stage call counts, latency histograms and error counts by reason.
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = Counter()
+        self._total_ns = Counter()
+        self._buckets = dict()
+        self._errors = dict()
+
+    def __call__(self, stage: str, elapsed_ns: int, error: Optional[ValueError]) -> None:
+        bucket = bisect_left(LATENCY_BUCKETS_NS, elapsed_ns)
+        with self._lock:
+            self._calls[stage] += 1
+            self._total_ns[stage] += elapsed_ns
+            buckets = self._buckets.get(stage)
+            if buckets is None:
+                buckets = self._buckets[stage] = [0] * len(LATENCY_BUCKETS_NS)
+                self._errors[stage] = Counter()
+            buckets[bucket] += 1
+            if error is not None:
+                self._errors[stage][error_reason(error)] += 1
+
+    def snapshot(self) -> dict[str, StageMetrics]:
+        with self._lock:
+            return {
+                stage: StageMetrics(
+                    calls=self._calls[stage],
+                    total_ns=self._total_ns[stage],
+                    buckets=tuple(self._buckets[stage]),
+                    errors=dict(self._errors[stage]))
+                for stage in self._calls}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls.clear()
+            self._total_ns.clear()
+            self._buckets.clear()
+            self._errors.clear()
+
+
+def instrument(func: Callable, stage: str, observer: Observer) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            result = func(*args, **kwargs)
+        except ValueError as error:
+            observer(stage, time.perf_counter_ns() - start, error)
+            raise
+        observer(stage, time.perf_counter_ns() - start, None)
+        return result
+    return wrapper
+
+
+def is_enabled() -> bool:
+    return bool(_patches)
+
+
+def enable(observer: Observer) -> None:
+    # Rebinds every reference to an instrumented function held by a loaded aamva module, including names
+    # imported with "from ... import", so there is no cost at all while instrumentation is disabled.
+    # Modules first imported while instrumentation is enabled keep the original functions.
+    with _patches_lock:
+        if _patches:
+            raise ValueError("Instrumentation is already enabled.")
+        originals = {id(getattr(module, name)): getattr(module, name) for module, name in INSTRUMENTED_FUNCTIONS}
+        wrappers = {key: instrument(func, func.__name__, observer) for key, func in originals.items()}
+        for module_name, module in tuple(sys.modules.items()):
+            if module is None or not (module_name == "aamva" or module_name.startswith("aamva.")):
+                continue
+            for name, value in tuple(vars(module).items()):
+                if id(value) in originals and originals[id(value)] is value:
+                    _patches.append((module, name, value))
+                    setattr(module, name, wrappers[id(value)])
+
+
+def disable() -> None:
+    with _patches_lock:
+        while _patches:
+            module, name, original = _patches.pop()
+            setattr(module, name, original)
+
+
+@contextmanager
+def instrumented(observer: Observer) -> Iterator[Observer]:
+    enable(observer)
+    try:
+        yield observer
+    finally:
+        disable()
@@ -1,3 +1,5 @@
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import NamedTuple
 
 
@@ -86,8 +88,60 @@ ISSUING_AUTHORITIES = (
     IssuingAuthority(636062, "Virgin Islands", "VI", "USA"))
 
 
+class AuthorityIndex(NamedTuple):
+    source: tuple[IssuingAuthority, ...]
+    by_id: Mapping[int, IssuingAuthority]
+    by_abbr: Mapping[str, IssuingAuthority]
+    by_country: Mapping[str, tuple[IssuingAuthority, ...]]
+    by_jurisdiction: Mapping[str, IssuingAuthority]
+
+
+def build_authority_index(authorities: tuple[IssuingAuthority, ...]) -> AuthorityIndex:
+    by_country = dict()
+    for authority in authorities:
+        by_country.setdefault(authority.country.upper(), []).append(authority)
+
+    return AuthorityIndex(
+        source=authorities,
+        by_id=MappingProxyType({i.issuer_id: i for i in authorities}),
+        by_abbr=MappingProxyType({i.abbr.upper(): i for i in authorities if i.abbr is not None}),
+        by_country=MappingProxyType({country: tuple(items) for country, items in by_country.items()}),
+        by_jurisdiction=MappingProxyType({i.jurisdiction.upper(): i for i in authorities}))
+
+
+_authority_index = build_authority_index(ISSUING_AUTHORITIES)
+
+
+def get_authority_index() -> AuthorityIndex:
+    # The index is rebuilt only when ISSUING_AUTHORITIES has been replaced with a different tuple. The index
+    # is immutable and swapped in with a single assignment, so concurrent callers at worst build it twice.
+    global _authority_index
+    index = _authority_index
+    if index.source is not ISSUING_AUTHORITIES:
+        index = _authority_index = build_authority_index(ISSUING_AUTHORITIES)
+    return index
+
+
 def get_authority_by_id(id_number: int) -> IssuingAuthority:
     try:
-        return tuple(filter(lambda i: i.issuer_id == id_number, ISSUING_AUTHORITIES))[0]
-    except IndexError:
+        return get_authority_index().by_id[id_number]
+    except KeyError:
         raise ValueError(f"Issuer ID number '{id_number}' not found in authority list.")
+
+
+def get_authority_by_abbr(abbr: str) -> IssuingAuthority:
+    try:
+        return get_authority_index().by_abbr[abbr.upper()]
+    except KeyError:
+        raise ValueError(f"Abbreviation '{abbr}' not found in authority list.")
+
+
+def get_authority_by_jurisdiction(jurisdiction: str) -> IssuingAuthority:
+    try:
+        return get_authority_index().by_jurisdiction[jurisdiction.upper()]
+    except KeyError:
+        raise ValueError(f"Jurisdiction '{jurisdiction}' not found in authority list.")
+
+
+def get_authorities_by_country(country: str) -> tuple[IssuingAuthority, ...]:
+    return get_authority_index().by_country.get(country.upper(), ())
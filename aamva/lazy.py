@@ -0,0 +1,54 @@
+from aamva.barcode import (
+    COMPLIANCE_INDICATOR, BarcodeFile, BarcodeStr, FileHeader, Subfile, SubfileDesignator,
+    parse_file_header, parse_subfile, parse_subfile_designators, trim_before)
+
+
+class LazyBarcodeFile:
+    # Subfiles are only split into elements, and validated, when they are first accessed.
+    __slots__ = ("barcode_string", "header", "designators", "_subfiles")
+
+    def __init__(self, barcode_string: BarcodeStr, header: FileHeader, designators: tuple[SubfileDesignator, ...]):
+        self.barcode_string = barcode_string
+        self.header = header
+        self.designators = designators
+        self._subfiles = dict()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(header={self.header!r}, designators={self.designators!r})"
+
+    @property
+    def subfile_types(self) -> tuple[str, ...]:
+        return tuple(designator["subfile_type"] for designator in self.designators)
+
+    def subfile_at(self, index: int) -> Subfile:
+        # Cached by designator index, as a barcode can hold more than one subfile of a type.
+        try:
+            return self._subfiles[index]
+        except KeyError:
+            subfile = self._subfiles[index] = parse_subfile(self.barcode_string, self.designators[index])
+            return subfile
+
+    def subfile(self, subfile_type: str) -> Subfile:
+        # The first subfile of the type.
+        for index, designator in enumerate(self.designators):
+            if designator["subfile_type"] == subfile_type:
+                return self.subfile_at(index)
+        raise ValueError(f"Subfile type '{subfile_type}' not found.")
+
+    @property
+    def subfiles(self) -> tuple[Subfile, ...]:
+        return tuple(map(self.subfile_at, range(len(self.designators))))
+
+    def to_dict(self) -> BarcodeFile:
+        return BarcodeFile(
+            header=self.header,
+            subfiles=self.subfiles)
+
+
+def parse_barcode_lazy(barcode_string: BarcodeStr) -> LazyBarcodeFile:
+    barcode_string = trim_before(COMPLIANCE_INDICATOR, barcode_string)
+    header = parse_file_header(barcode_string)
+    if header["number_of_entries"] < 1:
+        raise ValueError("Number of entries cannot be less than 1.")
+
+    return LazyBarcodeFile(barcode_string, header, parse_subfile_designators(barcode_string, header))
@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from typing import NamedTuple
 
 
@@ -14,10 +15,11 @@ RACE_ETHNICITIES = (
     RaceEthnicity("O", "Non-hispanic"),
     RaceEthnicity("U", "Unknown"),
     RaceEthnicity("W", "White"))
+RACE_ETHNICITIES_BY_CODE = MappingProxyType({x.code: x for x in RACE_ETHNICITIES})
 
 
 def parse_race_ethnicity(code: str) -> RaceEthnicity:
     try:
-        return tuple(filter(lambda x: x.code == code, RACE_ETHNICITIES))[0]
-    except IndexError:
+        return RACE_ETHNICITIES_BY_CODE[code]
+    except KeyError:
         raise ValueError(f"Race/Ethnicity code '{code}' not found.")
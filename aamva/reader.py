@@ -0,0 +1,100 @@
+import mmap
+import os
+from collections.abc import Callable, Iterator
+from functools import partial
+from typing import BinaryIO, Literal, Union
+
+from aamva.barcode import BarcodeFile, parse_barcode_string
+from aamva.barcode_bytes import ENCODING, HEADER_PREFIX_BYTES
+from aamva.batch import BatchResult, parse_one
+
+Framing = Literal["raw", "escaped"]
+
+BLOCK_SIZE = 64 * 1024
+
+
+def split_raw_records(data: Union[bytes, mmap.mmap]) -> Iterator[bytes]:
+    # Records in a raw dump start at the full header prefix rather than a bare COMPLIANCE_INDICATOR,
+    # which can also appear inside element data.
+    start = data.find(HEADER_PREFIX_BYTES)
+    while start != -1:
+        end = data.find(HEADER_PREFIX_BYTES, start + 1)
+        yield data[start:] if end == -1 else data[start:end]
+        start = end
+
+
+def read_raw_records(fileobj: BinaryIO, block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    buffer = bytearray()
+    while True:
+        block = fileobj.read(block_size)
+        buffer += block
+        start = buffer.find(HEADER_PREFIX_BYTES)
+        if start == -1:
+            # Keep only enough bytes to match a prefix split across two blocks.
+            del buffer[:-len(HEADER_PREFIX_BYTES)]
+        else:
+            end = buffer.find(HEADER_PREFIX_BYTES, start + 1)
+            while end != -1:
+                yield bytes(buffer[start:end])
+                start, end = end, buffer.find(HEADER_PREFIX_BYTES, end + 1)
+            del buffer[:start]
+        if not block:
+            if buffer.startswith(HEADER_PREFIX_BYTES):
+                yield bytes(buffer)
+            return
+
+
+def unescape_record(line: bytes) -> bytes:
+    return line.rstrip(b"\r\n").decode("unicode_escape").encode(ENCODING)
+
+
+def decode_record(record: bytes, framing: Framing = "raw") -> str:
+    # A record read with unescape=False is decoded here, one at a time, so a line with a bad escape sequence
+    # raises for that record only. UnicodeError is a ValueError, so it becomes that record's error result.
+    if framing == "escaped":
+        record = unescape_record(record)
+    return record.decode(ENCODING)
+
+
+def parse_framed_record(record: bytes, framing: Framing = "raw",
+                        parser: Callable[[str], BarcodeFile] = parse_barcode_string) -> BarcodeFile:
+    return parser(decode_record(record, framing))
+
+
+def read_escaped_records(lines: Iterator[bytes], unescape: bool = True) -> Iterator[bytes]:
+    for line in lines:
+        if line.strip():
+            yield unescape_record(line) if unescape else line.rstrip(b"\r\n")
+
+
+def iter_records(source: Union[str, os.PathLike, BinaryIO], framing: Framing = "raw",
+                 block_size: int = BLOCK_SIZE, unescape: bool = True) -> Iterator[bytes]:
+    # With unescape=False escaped lines are yielded as read, to be decoded record by record with decode_record.
+    if framing not in ("raw", "escaped"):
+        raise ValueError(f"Framing '{framing}' is not supported.")
+
+    if not isinstance(source, (str, os.PathLike)):
+        if framing == "raw":
+            yield from read_raw_records(source, block_size)
+        else:
+            yield from read_escaped_records(source, unescape)
+        return
+
+    with open(source, "rb") as fileobj:
+        try:
+            mapped = mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # Empty files and special files cannot be mapped
+            yield from iter_records(fileobj, framing, block_size, unescape)
+            return
+        with mapped:
+            if framing == "raw":
+                yield from split_raw_records(mapped)
+            else:
+                yield from read_escaped_records(iter(mapped.readline, b""), unescape)
+
+
+def iter_barcodes(source: Union[str, os.PathLike, BinaryIO], framing: Framing = "raw",
+                  block_size: int = BLOCK_SIZE) -> Iterator[BatchResult]:
+    parser = partial(parse_framed_record, framing=framing)
+    for record in iter_records(source, framing, block_size, unescape=False):
+        yield parse_one(parser, record)
@@ -0,0 +1,69 @@
+import sys
+from bisect import bisect_left
+from typing import NamedTuple, Optional
+
+from aamva.barcode import BarcodeFile, BarcodeStr, FileHeader, Subfile, parse_barcode_string
+
+
+class CompactFileHeader(NamedTuple):
+    issuer_id: int
+    aamva_version: int
+    number_of_entries: int
+    jurisdiction_version: int = 0
+
+    def to_dict(self) -> FileHeader:
+        return FileHeader(**self._asdict())
+
+
+class CompactSubfile(NamedTuple):
+    # Elements are stored as parallel tuples sorted by element ID. Element IDs are interned so they
+    # are shared between every record instead of being copied per card.
+    subfile_type: str
+    codes: tuple[str, ...]
+    values: tuple[str, ...]
+
+    def get(self, code: str, default: Optional[str] = None) -> Optional[str]:
+        index = bisect_left(self.codes, code)
+        if index < len(self.codes) and self.codes[index] == code:
+            return self.values[index]
+        return default
+
+    def elements(self) -> dict[str, str]:
+        return dict(zip(self.codes, self.values))
+
+    def to_dict(self) -> Subfile:
+        return Subfile(subfile_type=self.subfile_type, elements=self.elements())
+
+
+class CompactBarcodeFile(NamedTuple):
+    header: CompactFileHeader
+    subfiles: tuple[CompactSubfile, ...]
+
+    def subfile(self, subfile_type: str) -> CompactSubfile:
+        for subfile in self.subfiles:
+            if subfile.subfile_type == subfile_type:
+                return subfile
+        raise ValueError(f"Subfile type '{subfile_type}' not found.")
+
+    def to_dict(self) -> BarcodeFile:
+        return BarcodeFile(
+            header=self.header.to_dict(),
+            subfiles=tuple(subfile.to_dict() for subfile in self.subfiles))
+
+
+def compact_subfile(subfile: Subfile) -> CompactSubfile:
+    items = sorted(subfile["elements"].items())
+    return CompactSubfile(
+        subfile_type=sys.intern(subfile["subfile_type"]),
+        codes=tuple(sys.intern(code) for code, _ in items),
+        values=tuple(value for _, value in items))
+
+
+def compact_barcode_file(barcode_file: BarcodeFile) -> CompactBarcodeFile:
+    return CompactBarcodeFile(
+        header=CompactFileHeader(**barcode_file["header"]),
+        subfiles=tuple(map(compact_subfile, barcode_file["subfiles"])))
+
+
+def parse_barcode_compact(barcode_string: BarcodeStr) -> CompactBarcodeFile:
+    return compact_barcode_file(parse_barcode_string(barcode_string))
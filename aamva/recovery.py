@@ -0,0 +1,182 @@
+from collections import defaultdict, deque
+from enum import IntEnum
+from typing import NamedTuple, Optional
+
+from aamva.barcode import (
+    COMPLIANCE_INDICATOR, HEADER_LAYOUTS, HEADER_PREFIX, SEGMENT_TERMINATOR, BarcodeFile, BarcodeStr, Subfile, SubfileDesignator,
+    parse_elements)
+from aamva.result import parse_file_header_result, parse_subfile_designator_result, parse_subfile_result
+
+
+class RepairCode(IntEnum):
+    TRIMMED_PREFIX = 1
+    UNREADABLE_DESIGNATOR = 2
+    RELOCATED_SUBFILE = 3
+    RESIZED_SUBFILE = 4
+    MISSING_SEGMENT_TERMINATOR = 5
+    MISSING_SUBFILE = 6
+
+
+class Repair(NamedTuple):
+    code: RepairCode
+    subfile_type: Optional[str]
+    offset: int  # Position in the barcode string as given, including anything before the compliance indicator
+
+
+class RecoveredBarcode(NamedTuple):
+    barcode_file: BarcodeFile
+    repairs: tuple[Repair, ...]
+
+
+class Segment(NamedTuple):
+    start: int
+    end: int  # Position of the segment terminator, or the end of the data when it is missing
+    terminated: bool
+
+
+def split_segments(barcode_string: BarcodeStr, start: int) -> list[Segment]:
+    segments = list()
+    while start < len(barcode_string):
+        end = barcode_string.find(SEGMENT_TERMINATOR, start)
+        if end == -1:
+            segments.append(Segment(start, len(barcode_string), False))
+            break
+        segments.append(Segment(start, end, True))
+        start = end + 1
+    return segments
+
+
+class SegmentIndex:
+    # Segments of the subfile data area, indexed by the subfile type they start with. Lookups only move
+    # forward, so locating every subfile takes a single pass over the data however many are misplaced.
+
+    def __init__(self, barcode_string: BarcodeStr, start: int):
+        self.segments = split_segments(barcode_string, start)
+        self.by_type = defaultdict(deque)
+        for i, segment in enumerate(self.segments):
+            self.by_type[barcode_string[segment.start:segment.start + 2]].append(i)
+        self.position = 0
+
+    def take(self, subfile_type: str, cursor: int) -> Optional[int]:
+        # Index of the first unused segment starting with subfile_type at or after cursor.
+        candidates = self.by_type.get(subfile_type)
+        while candidates:
+            i = candidates[0]
+            if i >= self.position and self.segments[i].start >= cursor:
+                return i
+            candidates.popleft()
+        return None
+
+    def split(self, i: int, subfile_type: str, offset: int) -> None:
+        # A subfile missing its terminator runs into the next one; the rest of the segment is kept for it.
+        segment = self.segments[i]
+        self.segments[i] = Segment(offset, segment.end, segment.terminated)
+        self.by_type[subfile_type].appendleft(i)
+        self.position = i
+
+
+def read_designators(barcode_string: BarcodeStr, aamva_version: int, number_of_entries: int,
+                     repairs: list) -> list[tuple[Optional[str], Optional[SubfileDesignator]]]:
+    layout = HEADER_LAYOUTS[aamva_version]
+    designators = list()
+    for i in range(number_of_entries):
+        designator, error = parse_subfile_designator_result(barcode_string, aamva_version, i)
+        if designator is not None:
+            designators.append((designator["subfile_type"], designator))
+            continue
+        # The offset or length is not a number, or the designator is cut short. The subfile can still be
+        # found by its type if that much was read.
+        cursor = layout.header_length + i * layout.designator_stride
+        subfile_type = barcode_string[cursor:cursor + 2]
+        repairs.append(Repair(RepairCode.UNREADABLE_DESIGNATOR, subfile_type or None, cursor))
+        designators.append((subfile_type if len(subfile_type) == 2 else None, None))
+    return designators
+
+
+def split_candidates(designator: Optional[SubfileDesignator],
+                     next_designator: Optional[SubfileDesignator]) -> tuple[int, ...]:
+    candidates = tuple()
+    if next_designator is not None:
+        candidates += (next_designator["offset"],)
+    if designator is not None:
+        candidates += (designator["offset"] + designator["length"] - 1,)
+    return candidates
+
+
+def recover_barcode_string(barcode_string: BarcodeStr) -> RecoveredBarcode:
+    # Parses like parse_barcode_string while the designators are right. When a subfile is not where its
+    # designator says, it is located by its type at the start of a segment, and a subfile missing its
+    # terminator is ended where the next subfile's designator points. Every change is reported as a Repair.
+    # Only a header that cannot be read, or data with no recoverable subfile, raises ValueError.
+    # A bare COMPLIANCE_INDICATOR can also appear in the noise, so the full header prefix is looked for first.
+    start = barcode_string.find(HEADER_PREFIX)
+    if start == -1:
+        start = barcode_string.find(COMPLIANCE_INDICATOR)
+    if start > 0:
+        barcode_string = barcode_string[start:]
+    else:
+        start = 0
+
+    header, error = parse_file_header_result(barcode_string)
+    if error is not None:
+        raise error.to_value_error()
+    elif header["number_of_entries"] < 1:
+        raise ValueError("Number of entries cannot be less than 1.")
+
+    repairs = list()
+    designators = read_designators(barcode_string, header["aamva_version"], header["number_of_entries"], repairs)
+    layout = HEADER_LAYOUTS[header["aamva_version"]]
+    cursor = layout.header_length + layout.designator_stride * header["number_of_entries"]
+    index = None
+    subfiles = list()
+    for i, (subfile_type, designator) in enumerate(designators):
+        if subfile_type is None:
+            repairs.append(Repair(RepairCode.MISSING_SUBFILE, None, cursor))
+            continue
+        if designator is not None:
+            subfile, _ = parse_subfile_result(barcode_string, designator)
+            if subfile is not None:
+                subfiles.append(subfile)
+                cursor = max(cursor, designator["offset"] + designator["length"])
+                continue
+
+        if index is None:
+            index = SegmentIndex(barcode_string, cursor)
+        found = index.take(subfile_type, cursor)
+        if found is None:
+            repairs.append(Repair(RepairCode.MISSING_SUBFILE, subfile_type, cursor))
+            continue
+        segment = index.segments[found]
+        subfile_start, subfile_end, terminated = segment
+        index.position = found + 1
+
+        # A segment holding more than one subfile lost a terminator. The next subfile starts either where
+        # its designator points, or where this subfile's terminator should have been.
+        next_type, next_designator = designators[i + 1] if i + 1 < len(designators) else (None, None)
+        if next_type is not None:
+            for split in split_candidates(designator, next_designator):
+                if subfile_start + 2 < split < subfile_end and barcode_string.startswith(next_type, split):
+                    subfile_end = split
+                    terminated = False
+                    index.split(found, next_type, split)
+                    break
+
+        length = subfile_end - subfile_start + terminated
+        if designator is not None and designator["offset"] != subfile_start:
+            repairs.append(Repair(RepairCode.RELOCATED_SUBFILE, subfile_type, subfile_start))
+        if designator is not None and designator["length"] != length:
+            repairs.append(Repair(RepairCode.RESIZED_SUBFILE, subfile_type, subfile_start))
+        if not terminated:
+            repairs.append(Repair(RepairCode.MISSING_SEGMENT_TERMINATOR, subfile_type, subfile_end))
+
+        subfiles.append(Subfile(
+            subfile_type=subfile_type,
+            elements=parse_elements(barcode_string, subfile_start + 2, subfile_end)))
+        cursor = subfile_start + length
+
+    if not subfiles:
+        raise ValueError("No subfiles could be recovered.")
+    if start:
+        repairs = [Repair(RepairCode.TRIMMED_PREFIX, None, 0)] + [
+            Repair(repair.code, repair.subfile_type, repair.offset + start) for repair in repairs]
+    return RecoveredBarcode(BarcodeFile(header=header, subfiles=tuple(subfiles)), tuple(repairs))
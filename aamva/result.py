@@ -0,0 +1,206 @@
+from enum import IntEnum
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+from aamva.barcode import (
+    COMPLIANCE_INDICATOR, HEADER_LAYOUTS, HEADER_PREFIX, SEGMENT_TERMINATOR, BarcodeFile, BarcodeStr, FileHeader,
+    Subfile, SubfileDesignator, parse_elements)
+
+
+class ErrorCode(IntEnum):
+    HEADER_TOO_SHORT = 1
+    INVALID_COMPLIANCE_INDICATOR = 2
+    INVALID_DATA_ELEMENT_SEPARATOR = 3
+    INVALID_RECORD_SEPARATOR = 4
+    INVALID_SEGMENT_TERMINATOR = 5
+    INVALID_FILE_TYPE = 6
+    INVALID_NUMBER = 7
+    VERSION_OUT_OF_RANGE = 8
+    NO_ENTRIES = 9
+    DESIGNATOR_TOO_SHORT = 10
+    SUBFILE_TOO_SHORT = 11
+    MISSING_SUBFILE_TYPE = 12
+    MISSING_SEGMENT_TERMINATOR = 13
+
+
+# The same messages the raising parser uses, so errors can be reported the same way in either mode.
+ERROR_MESSAGES = MappingProxyType({
+    ErrorCode.HEADER_TOO_SHORT: "Header length is too short.",
+    ErrorCode.INVALID_COMPLIANCE_INDICATOR: "Header element 'COMPLIANCE_INDICATOR' is invalid.",
+    ErrorCode.INVALID_DATA_ELEMENT_SEPARATOR: "Header element 'DATA_ELEMENT_SEPARATOR' is invalid.",
+    ErrorCode.INVALID_RECORD_SEPARATOR: "Header element 'RECORD_SEPARATOR' is invalid.",
+    ErrorCode.INVALID_SEGMENT_TERMINATOR: "Header element 'SEGMENT_TERMINATOR' is invalid.",
+    ErrorCode.INVALID_FILE_TYPE: "Header element 'FILE_TYPE' is invalid.",
+    ErrorCode.INVALID_NUMBER: "Numeric field is not a number.",
+    ErrorCode.VERSION_OUT_OF_RANGE: "aamva_version is out of range (1-99).",
+    ErrorCode.NO_ENTRIES: "Number of entries cannot be less than 1.",
+    ErrorCode.DESIGNATOR_TOO_SHORT: "Subfile designator is too short.",
+    ErrorCode.SUBFILE_TOO_SHORT: "Subfile length is too short.",
+    ErrorCode.MISSING_SUBFILE_TYPE: "Subfile is missing subfile type.",
+    ErrorCode.MISSING_SEGMENT_TERMINATOR: "Subfile is missing segment terminator."})
+
+HEADER_PREFIX_ERRORS = (
+    (ErrorCode.INVALID_COMPLIANCE_INDICATOR, 0, 1),
+    (ErrorCode.INVALID_DATA_ELEMENT_SEPARATOR, 1, 2),
+    (ErrorCode.INVALID_RECORD_SEPARATOR, 2, 3),
+    (ErrorCode.INVALID_SEGMENT_TERMINATOR, 3, 4),
+    (ErrorCode.INVALID_FILE_TYPE, 4, 9))
+
+
+class ParseError(NamedTuple):
+    code: ErrorCode
+    offset: int  # Position in the barcode string, which is also the byte offset in the latin-1 payload
+
+    @property
+    def message(self) -> str:
+        return ERROR_MESSAGES[self.code]
+
+    def to_value_error(self) -> ValueError:
+        return ValueError(self.message)
+
+
+class ParseResult(NamedTuple):
+    barcode_file: Optional[BarcodeFile]
+    error: Optional[ParseError]
+
+
+def read_number(barcode_string: BarcodeStr, start: int, end: int) -> Optional[int]:
+    field = barcode_string[start:end]
+    if field.isdecimal():
+        return int(field)
+    # Rare, but int() also accepts padded and signed numbers, so this mode accepts what the raising parser does.
+    try:
+        return int(field)
+    except ValueError:
+        return None
+
+
+def parse_file_header_result(
+        barcode_string: BarcodeStr) -> tuple[Optional[FileHeader], Optional[ParseError]]:
+    MIN_LENGTH = 17
+
+    if len(barcode_string) < MIN_LENGTH:
+        return None, ParseError(ErrorCode.HEADER_TOO_SHORT, len(barcode_string))
+    elif not barcode_string.startswith(HEADER_PREFIX):
+        for code, start, end in HEADER_PREFIX_ERRORS:
+            if barcode_string[start:end] != HEADER_PREFIX[start:end]:
+                return None, ParseError(code, start)
+
+    aamva_version = read_number(barcode_string, 15, 17)
+    if aamva_version is None:
+        return None, ParseError(ErrorCode.INVALID_NUMBER, 15)
+    layout = HEADER_LAYOUTS.get(aamva_version)
+    if layout is None:
+        return None, ParseError(ErrorCode.VERSION_OUT_OF_RANGE, 15)
+    end = layout.header_length
+    if len(barcode_string) < end:
+        return None, ParseError(ErrorCode.HEADER_TOO_SHORT, len(barcode_string))
+
+    # Well formed headers are all digits from the issuer ID on, so the fields are checked one by one only
+    # when that fails.
+    entries = layout.number_of_entries_offset
+    jurisdiction = layout.jurisdiction_version_offset
+    if barcode_string[9:end].isdecimal():
+        return {
+            "issuer_id": int(barcode_string[9:15]),
+            "aamva_version": aamva_version,
+            "number_of_entries": int(barcode_string[entries:entries + 2]),
+            "jurisdiction_version": 0 if jurisdiction is None else int(
+                barcode_string[jurisdiction:jurisdiction + 2])}, None
+
+    issuer_id = read_number(barcode_string, 9, 15)
+    if issuer_id is None:
+        return None, ParseError(ErrorCode.INVALID_NUMBER, 9)
+    jurisdiction_version = 0 if jurisdiction is None else read_number(barcode_string, jurisdiction, jurisdiction + 2)
+    if jurisdiction_version is None:
+        return None, ParseError(ErrorCode.INVALID_NUMBER, jurisdiction)
+    number_of_entries = read_number(barcode_string, entries, entries + 2)
+    if number_of_entries is None:
+        return None, ParseError(ErrorCode.INVALID_NUMBER, entries)
+
+    return {
+        "issuer_id": issuer_id,
+        "aamva_version": aamva_version,
+        "number_of_entries": number_of_entries,
+        "jurisdiction_version": jurisdiction_version}, None
+
+
+def parse_subfile_designator_result(
+        barcode_string: BarcodeStr, aamva_version: int,
+        designator_index: int) -> tuple[Optional[SubfileDesignator], Optional[ParseError]]:
+    layout = HEADER_LAYOUTS[aamva_version]
+    cursor = layout.header_length + designator_index * layout.designator_stride
+
+    if len(barcode_string) < cursor + layout.designator_stride:
+        return None, ParseError(ErrorCode.DESIGNATOR_TOO_SHORT, cursor)
+
+    if barcode_string[cursor + 2:cursor + 10].isdecimal():
+        offset = int(barcode_string[cursor + 2:cursor + 6])
+        length = int(barcode_string[cursor + 6:cursor + 10])
+    else:
+        offset = read_number(barcode_string, cursor + 2, cursor + 6)
+        if offset is None:
+            return None, ParseError(ErrorCode.INVALID_NUMBER, cursor + 2)
+        length = read_number(barcode_string, cursor + 6, cursor + 10)
+        if length is None:
+            return None, ParseError(ErrorCode.INVALID_NUMBER, cursor + 6)
+
+    return {"subfile_type": barcode_string[cursor:cursor + 2], "offset": offset, "length": length}, None
+
+
+def parse_subfile_result(
+        barcode_string: BarcodeStr, designator: SubfileDesignator) -> tuple[Optional[Subfile], Optional[ParseError]]:
+    subfile_type = designator["subfile_type"]
+    offset = designator["offset"]
+    end_offset = offset + designator["length"]
+
+    if len(barcode_string) < end_offset:
+        return None, ParseError(ErrorCode.SUBFILE_TOO_SHORT, len(barcode_string))
+    elif barcode_string[offset:offset + 2] != subfile_type:
+        return None, ParseError(ErrorCode.MISSING_SUBFILE_TYPE, offset)
+    elif end_offset < 1 or barcode_string[end_offset - 1] != SEGMENT_TERMINATOR:
+        return None, ParseError(ErrorCode.MISSING_SEGMENT_TERMINATOR, max(end_offset - 1, 0))
+
+    return {"subfile_type": subfile_type, "elements": parse_elements(barcode_string, offset + 2, end_offset - 1)}, None
+
+
+def shift_error(error: ParseError, start: int) -> ParseError:
+    return ParseError(error.code, error.offset + start) if start else error
+
+
+def parse_barcode_string_result(barcode_string: BarcodeStr) -> ParseResult:
+    # Same as parse_barcode_string, but failures are returned as an error code and offset instead of raised.
+    # Offsets are relative to the string as given, including anything before the compliance indicator.
+    start = barcode_string.find(COMPLIANCE_INDICATOR)
+    if start > 0:
+        barcode_string = barcode_string[start:]
+    else:
+        start = 0
+
+    header, error = parse_file_header_result(barcode_string)
+    if error is not None:
+        return ParseResult(None, shift_error(error, start))
+    layout = HEADER_LAYOUTS[header["aamva_version"]]
+    if header["number_of_entries"] < 1:
+        return ParseResult(None, ParseError(ErrorCode.NO_ENTRIES, start + layout.number_of_entries_offset))
+
+    # Like parse_barcode_string, the whole designator table is read before any subfile.
+    end = layout.header_length + header["number_of_entries"] * layout.designator_stride
+    if len(barcode_string) < end:
+        cursor = len(barcode_string) - (len(barcode_string) - layout.header_length) % layout.designator_stride
+        return ParseResult(None, ParseError(ErrorCode.DESIGNATOR_TOO_SHORT, start + cursor))
+    designators = list()
+    for i in range(header["number_of_entries"]):
+        designator, error = parse_subfile_designator_result(barcode_string, header["aamva_version"], i)
+        if error is not None:
+            return ParseResult(None, shift_error(error, start))
+        designators.append(designator)
+
+    subfiles = list()
+    for designator in designators:
+        subfile, error = parse_subfile_result(barcode_string, designator)
+        if error is not None:
+            return ParseResult(None, shift_error(error, start))
+        subfiles.append(subfile)
+
+    return ParseResult({"header": header, "subfiles": tuple(subfiles)}, None)
@@ -0,0 +1,14 @@
+# Run every benchmark with: python -m benchmarks
+from benchmarks import (
+    bench_batch, bench_columnar, bench_dates, bench_duplicates, bench_elements, bench_encoder, bench_import, bench_lookups,
+    bench_parse)
+
+BENCHMARKS = (
+    bench_import, bench_parse, bench_lookups, bench_elements, bench_dates, bench_encoder, bench_batch, bench_columnar,
+    bench_duplicates)
+
+if __name__ == "__main__":
+    for module in BENCHMARKS:
+        print(f"== {module.__name__} ==")
+        module.main()
+        print()
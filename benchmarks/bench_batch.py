@@ -0,0 +1,52 @@
+# Run with: python -m benchmarks.bench_batch
+# Compare builds by running it under both a standard and a free-threaded (e.g. python3.13t) interpreter.
+import os
+import platform
+import sys
+import sysconfig
+import time
+
+from aamva.batch import parse_many, parse_many_threaded
+from benchmarks.corpus import generate_corpus
+
+RECORDS = 200_000
+CORPUS_SIZE = 5_000
+CHUNKSIZE = 512
+
+
+def corpus(size: int) -> list[str]:
+    barcode_strings = generate_corpus(CORPUS_SIZE)
+    return [barcode_strings[i % len(barcode_strings)] for i in range(size)]
+
+
+def gil_enabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)  # Python 3.13+
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def bench_worker_scaling() -> None:
+    records = corpus(RECORDS)
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({n for n in (1, 2, 4, 8, 16) if n < cpu_count} | {cpu_count, 2})
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    print(f"{platform.python_implementation()} {platform.python_version()}, "
+          f"free-threaded build: {free_threaded}, GIL enabled: {gil_enabled()}, CPUs: {cpu_count}")
+    print(f"{'workers':>8} {'processes/s':>12} {'threads/s':>12}")
+    for workers in worker_counts:
+        rates = list()
+        for parse in (parse_many, parse_many_threaded):
+            start = time.perf_counter()
+            for _ in parse(records, workers=workers, chunksize=CHUNKSIZE):
+                pass
+            rates.append(RECORDS / (time.perf_counter() - start))
+        inline = "*" if workers == 1 else " "
+        print(f"{workers:>8} {rates[0]:>11,.0f}{inline} {rates[1]:>12,.0f}")
+    print("* parse_many parses inline with one worker, so this is the single process baseline, not a pool.")
+
+
+def main() -> None:
+    bench_worker_scaling()
+
+
+if __name__ == "__main__":
+    main()
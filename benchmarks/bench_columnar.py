@@ -0,0 +1,64 @@
+# Run with: python -m benchmarks.bench_columnar
+import time
+import tracemalloc
+
+from aamva.barcode import parse_barcode_string
+from aamva.columnar import DATE_ELEMENTS, date_days, parse_columns
+from aamva.dates import get_issuer_date_format
+from benchmarks.corpus import generate_corpus
+
+RECORDS = 20_000
+COLUMNS = ("issuer_id", "aamva_version", "DBB", "DBA", "DAJ", "DAY", "DAQ")
+
+
+def pivot_dicts(barcodes: list[str]) -> dict[str, list]:
+    # Baseline: keep every parsed BarcodeFile, then pivot the list of dicts into columns.
+    barcode_files = list()
+    for barcode in barcodes:
+        try:
+            barcode_files.append(parse_barcode_string(barcode))
+        except ValueError:
+            pass
+    columns = {name: list() for name in COLUMNS}
+    for barcode_file in barcode_files:
+        header = barcode_file["header"]
+        date_format = get_issuer_date_format(header["issuer_id"], header["aamva_version"])
+        elements = dict()
+        for subfile in reversed(barcode_file["subfiles"]):
+            elements.update(subfile["elements"])
+        for name in COLUMNS:
+            if name in header:
+                columns[name].append(header[name])
+            elif name in DATE_ELEMENTS:
+                columns[name].append(date_days(elements.get(name), date_format))
+            else:
+                columns[name].append(elements.get(name))
+    return columns
+
+
+def measure(func, barcodes: list[str]) -> tuple[float, int]:
+    start = time.perf_counter()
+    func(barcodes)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        result = func(barcodes)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def main() -> None:
+    barcodes = generate_corpus(RECORDS)
+    print(f"{'export':>14} {'records/s':>12} {'peak bytes/record':>18}")
+    for name, func in (
+            ("pivot dicts", pivot_dicts),
+            ("parse_columns", lambda x: parse_columns(x, COLUMNS, workers=1))):
+        elapsed, peak = measure(func, barcodes)
+        print(f"{name:>14} {RECORDS / elapsed:>12,.0f} {peak / RECORDS:>18,.0f}")
+
+
+if __name__ == "__main__":
+    main()
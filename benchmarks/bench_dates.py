@@ -0,0 +1,41 @@
+# Run with: python -m benchmarks.bench_dates
+import timeit
+from datetime import datetime
+
+from aamva.dates import IMPERIAL_FORMAT, ISO_FORMAT, parse_date, parse_dates, parse_dates_array
+
+NUMBER = 100_000
+COLUMN = ["06061986", "12102024", "06062019"] * 10_000
+
+
+def bench_single_date() -> None:
+    print(f"{'format':>10} {'decoder':>10} {'ns/date':>10}")
+    for name, format, date_string in (("ISO", ISO_FORMAT, "19860606"), ("Imperial", IMPERIAL_FORMAT, "06061986")):
+        for decoder, stmt in (
+                ("strptime", lambda: datetime.strptime(date_string, format).date()),
+                ("parse_date", lambda: parse_date(date_string, format))):
+            seconds = min(timeit.repeat(stmt, number=NUMBER, repeat=3))
+            print(f"{name:>10} {decoder:>10} {seconds / NUMBER * 1e9:>10.0f}")
+
+
+def bench_date_column() -> None:
+    print(f"{'batch decoder':>18} {'ns/date':>10}")
+    decoders = [("parse_dates", lambda: parse_dates(COLUMN, IMPERIAL_FORMAT))]
+    try:
+        import numpy  # noqa: F401
+        decoders.append(("parse_dates_array", lambda: parse_dates_array(COLUMN, IMPERIAL_FORMAT)))
+    except ImportError:
+        print(f"{'parse_dates_array':>18} {'skipped, numpy not installed':>10}")
+    for decoder, stmt in decoders:
+        seconds = min(timeit.repeat(stmt, number=10, repeat=3))
+        print(f"{decoder:>18} {seconds / 10 / len(COLUMN) * 1e9:>10.0f}")
+
+
+def main() -> None:
+    bench_single_date()
+    print()
+    bench_date_column()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# Run with: python -m benchmarks.bench_duplicates
+from aamva.barcode import find_element_value, parse_barcode_string
+from aamva.duplicates import DuplicateScanIndex
+from benchmarks.corpus import generate_corpus
+from benchmarks.harness import report
+
+CORPUS_SIZE = 5_000
+
+
+def bench_duplicate_index() -> None:
+    barcode_files = [parse_barcode_string(barcode_string) for barcode_string in generate_corpus(CORPUS_SIZE)]
+    barcode_files = [f for f in barcode_files if (find_element_value(f, "DAQ") or "").strip()]  # Only cards that can be keyed
+    # A full index keeps expiring and evicting, so every insert also pays for removing the oldest entry.
+    full_index = DuplicateScanIndex(max_entries=CORPUS_SIZE // 10)
+    seen_index = DuplicateScanIndex()
+    for barcode_file in barcode_files:
+        seen_index.record(barcode_file)
+    report((
+        ("record, new cards", DuplicateScanIndex().record, [(f,) for f in barcode_files]),
+        ("record, repeat scans", seen_index.record, [(f,) for f in barcode_files]),
+        ("record, evicting", full_index.record, [(f,) for f in barcode_files]),
+        ("lookup", seen_index.lookup, [(f,) for f in barcode_files])))
+    print(f"entries: {len(seen_index)}, duplicates: {seen_index.stats.duplicates}")
+
+
+def main() -> None:
+    bench_duplicate_index()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# Run with: python -m benchmarks.bench_elements
+import timeit
+
+from aamva.barcode import (
+    COMPLIANCE_INDICATOR, DATA_ELEMENT_SEPARATOR, parse_elements, parse_file_header, parse_subfile_designators,
+    trim_before)
+from benchmarks.corpus import generate_corpus
+
+CORPUS_SIZE = 2_000
+WANTED = ("DAQ", "DBB", "DBA")
+
+
+def split_filter_loop(barcode_string: str, start: int, end: int) -> dict[str, str]:
+    # The parse_subfile implementation this module replaced.
+    items = filter(None, barcode_string[start:end].split(DATA_ELEMENT_SEPARATOR))
+    elements = dict()
+    for item in items:
+        elements[item[:3]] = item[3:]
+    return elements
+
+
+def card_subfile_spans() -> list[tuple[str, int, int]]:
+    # The first subfile of every corpus card, which is its DL or ID subfile.
+    spans = list()
+    for barcode_string in generate_corpus(CORPUS_SIZE):
+        barcode_string = trim_before(COMPLIANCE_INDICATOR, barcode_string)
+        designator = parse_subfile_designators(barcode_string, parse_file_header(barcode_string))[0]
+        spans.append((barcode_string, designator["offset"] + 2, designator["offset"] + designator["length"] - 1))
+    return spans
+
+
+def bench_element_scanners() -> None:
+    spans = card_subfile_spans()
+    print(f"{'scanner':>28} {'us/subfile':>11}")
+    for name, scanner in (
+            ("split + filter + loop", split_filter_loop),
+            ("parse_elements", parse_elements),
+            ("parse_elements(wanted)", lambda s, start, end: parse_elements(s, start, end, WANTED))):
+        seconds = min(timeit.repeat(lambda: [scanner(*span) for span in spans], number=1, repeat=5))
+        print(f"{name:>28} {seconds / len(spans) * 1e6:>11.2f}")
+
+
+def main() -> None:
+    bench_element_scanners()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+# Run with: python -m benchmarks.bench_encoder
+from aamva.barcode import parse_barcode_string
+from aamva.encoder import encode_barcode, encode_barcode_bytes, encode_barcode_into
+from benchmarks.corpus import generate_corpus
+from benchmarks.harness import report
+
+CORPUS_SIZE = 5_000
+
+
+def bench_encoders() -> None:
+    barcode_files = [(parse_barcode_string(s),) for s in generate_corpus(CORPUS_SIZE)]
+    buffer = bytearray(4096)
+    report((
+        ("encode_barcode", encode_barcode, barcode_files),
+        ("encode_barcode_bytes", encode_barcode_bytes, barcode_files),
+        ("encode_barcode_into (reused)", lambda barcode_file: encode_barcode_into(barcode_file, buffer), barcode_files)))
+
+
+def main() -> None:
+    bench_encoders()
+
+
+if __name__ == "__main__":
+    main()
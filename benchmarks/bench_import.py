@@ -0,0 +1,54 @@
+# Run with: python -m benchmarks.bench_import
+import os
+import subprocess
+import sys
+
+ROUNDS = 5
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATEMENTS = (
+    "import aamva",
+    "from aamva import parse_barcode_string",
+    "from aamva import get_authority_by_id",
+    "from aamva import DuplicateScanIndex",
+    "from aamva import decode_barcode_file",
+    "import aamva.cli")
+
+
+def import_times(statement: str) -> dict[str, int]:
+    # Self time in microseconds of every module the statement imports, from python -X importtime. Bytecode
+    # writing is left on, so after the first round modules load from cached bytecode as a deployment would.
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    result = subprocess.run(
+        (sys.executable, "-X", "importtime", "-c", statement),
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    times = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(self_us)
+    return times
+
+
+def best_import_times(statement: str) -> dict[str, int]:
+    best = dict()
+    for _ in range(ROUNDS):
+        for module, self_us in import_times(statement).items():
+            best[module] = min(best.get(module, self_us), self_us)
+    return best
+
+
+def bench_import_time() -> None:
+    startup = set(best_import_times("pass"))
+    print(f"{'statement':>40} {'modules':>8} {'import us':>10} {'datetime':>9}")
+    for statement in STATEMENTS:
+        times = {module: us for module, us in best_import_times(statement).items() if module not in startup}
+        print(f"{statement:>40} {len(times):>8} {sum(times.values()):>10,} {'datetime' in times!s:>9}")
+
+
+def main() -> None:
+    bench_import_time()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Run with: python -m benchmarks.bench_lookups
+import timeit
+
+import aamva.issuing_authority as issuing_authority
+from aamva.eye_color import parse_eye_color
+from aamva.hair_color import parse_hair_color
+from aamva.race_ethnicity import parse_race_ethnicity
+
+TABLE_SIZES = (72, 1_000, 10_000, 100_000)
+NUMBER = 100_000
+
+
+def linear_lookup(id_number: int) -> issuing_authority.IssuingAuthority:
+    return tuple(filter(lambda i: i.issuer_id == id_number, issuing_authority.ISSUING_AUTHORITIES))[0]
+
+
+def synthetic_authorities(size: int) -> tuple[issuing_authority.IssuingAuthority, ...]:
+    return tuple(
+        issuing_authority.IssuingAuthority(100000 + i, f"Jurisdiction {i}", f"J{i}", "USA")
+        for i in range(size))
+
+
+def time_per_call(stmt, number: int) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=3)) / number * 1e9
+
+
+def bench_authority_table_growth() -> None:
+    saved_authorities = issuing_authority.ISSUING_AUTHORITIES
+    print(f"{'table size':>12} {'indexed ns/call':>16} {'linear ns/call':>16}")
+    try:
+        for size in TABLE_SIZES:
+            issuing_authority.ISSUING_AUTHORITIES = synthetic_authorities(size)
+            last_id = issuing_authority.ISSUING_AUTHORITIES[-1].issuer_id
+            issuing_authority.get_authority_by_id(last_id)  # Build the index outside the timed loop
+            indexed = time_per_call(lambda: issuing_authority.get_authority_by_id(last_id), NUMBER)
+            linear = time_per_call(lambda: linear_lookup(last_id), max(1, NUMBER // size))
+            print(f"{size:>12} {indexed:>16.1f} {linear:>16.1f}")
+    finally:
+        issuing_authority.ISSUING_AUTHORITIES = saved_authorities
+
+
+def bench_code_tables() -> None:
+    print(f"{'lookup':>22} {'ns/call':>10}")
+    for name, func, code in (
+            ("parse_eye_color", parse_eye_color, "UNK"),
+            ("parse_hair_color", parse_hair_color, "UNK"),
+            ("parse_race_ethnicity", parse_race_ethnicity, "W"),
+            ("get_authority_by_abbr", issuing_authority.get_authority_by_abbr, "VI")):
+        print(f"{name:>22} {time_per_call(lambda: func(code), NUMBER):>10.1f}")
+
+
+def main() -> None:
+    bench_authority_table_growth()
+    print()
+    bench_code_tables()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Run with: python -m benchmarks.bench_parse
+from aamva.barcode import (
+    COMPLIANCE_INDICATOR, extract_fields, parse_barcode_string, parse_file_header, parse_subfile, parse_subfile_designator,
+    parse_subfile_designators, trim_before)
+from aamva.dates import get_issuer_date_format, parse_date
+from aamva.eye_color import EYE_COLORS, parse_eye_color
+from aamva.hair_color import HAIR_COLORS, parse_hair_color
+from aamva.issuing_authority import (
+    ISSUING_AUTHORITIES, get_authorities_by_country, get_authority_by_abbr, get_authority_by_id,
+    get_authority_by_jurisdiction)
+from aamva.race_ethnicity import RACE_ETHNICITIES, parse_race_ethnicity
+from aamva.recovery import recover_barcode_string
+from aamva.result import parse_barcode_string_result
+from benchmarks.corpus import generate_corpus
+from benchmarks.harness import report
+
+CORPUS_SIZE = 5_000
+LOOKUP_ROUNDS = 200
+AGE_GATE_FIELDS = {"DL": {"DBB", "DAQ", "DBA"}, "ID": {"DBB", "DAQ", "DBA"}}
+
+
+def bench_parse_stages() -> None:
+    corpus = [trim_before(COMPLIANCE_INDICATOR, barcode_string) for barcode_string in generate_corpus(CORPUS_SIZE)]
+    headers = [parse_file_header(barcode_string) for barcode_string in corpus]
+    designators = [
+        parse_subfile_designator(barcode_string, header["aamva_version"], 0)
+        for barcode_string, header in zip(corpus, headers)]
+    print(f"corpus: {len(corpus)} barcodes, {sum(map(len, corpus)) / len(corpus):.0f} characters on average")
+    report((
+        ("parse_file_header", parse_file_header, [(s,) for s in corpus]),
+        ("parse_subfile_designator", parse_subfile_designator,
+            [(s, h["aamva_version"], 0) for s, h in zip(corpus, headers)]),
+        ("parse_subfile", parse_subfile, list(zip(corpus, designators))),
+        ("parse_barcode_string", parse_barcode_string, [(s,) for s in corpus]),
+        ("extract_fields (DBB, DAQ, DBA)", extract_fields, [(s, AGE_GATE_FIELDS) for s in corpus])))
+
+
+def designators_one_at_a_time(barcode_string: str, header: dict) -> tuple:
+    return tuple(
+        parse_subfile_designator(barcode_string, header["aamva_version"], i)
+        for i in range(header["number_of_entries"]))
+
+
+def parse_fixed_overhead(barcode_string: str) -> tuple:
+    # Everything parse_barcode_string does before it reaches the subfile data.
+    return parse_subfile_designators(barcode_string, parse_file_header(barcode_string))
+
+
+def bench_fixed_overhead() -> None:
+    corpus = [trim_before(COMPLIANCE_INDICATOR, barcode_string) for barcode_string in generate_corpus(CORPUS_SIZE)]
+    headers = [parse_file_header(barcode_string) for barcode_string in corpus]
+    report((
+        ("designators one at a time", designators_one_at_a_time, list(zip(corpus, headers))),
+        ("parse_subfile_designators", parse_subfile_designators, list(zip(corpus, headers))),
+        ("header + designator table", parse_fixed_overhead, [(s,) for s in corpus])))
+
+
+def parse_or_none(barcode_string: str):
+    try:
+        return parse_barcode_string(barcode_string)
+    except ValueError:
+        return None
+
+
+def bench_error_modes() -> None:
+    # Partial reads: every barcode truncated somewhere inside its subfiles.
+    corpus = generate_corpus(CORPUS_SIZE)
+    truncated = [s[:len(s) * 3 // 4] for s in corpus]
+    report((
+        ("valid, raising", parse_or_none, [(s,) for s in corpus]),
+        ("valid, parse_barcode_string_result", parse_barcode_string_result, [(s,) for s in corpus]),
+        ("truncated, raising", parse_or_none, [(s,) for s in truncated]),
+        ("truncated, parse_barcode_string_result", parse_barcode_string_result, [(s,) for s in truncated]),
+        ("valid, recover_barcode_string", recover_barcode_string, [(s,) for s in corpus]),
+        ("truncated, recover_barcode_string", recover_barcode_string, [(s,) for s in truncated])))
+
+
+def bench_lookups() -> None:
+    authorities = ISSUING_AUTHORITIES * LOOKUP_ROUNDS
+    report((
+        ("get_authority_by_id", get_authority_by_id, [(a.issuer_id,) for a in authorities]),
+        ("get_authority_by_abbr", get_authority_by_abbr, [(a.abbr,) for a in authorities if a.abbr]),
+        ("get_authority_by_jurisdiction", get_authority_by_jurisdiction, [(a.jurisdiction,) for a in authorities]),
+        ("get_authorities_by_country", get_authorities_by_country, [(a.country,) for a in authorities]),
+        ("get_issuer_date_format", get_issuer_date_format, [(a.issuer_id, 10) for a in authorities]),
+        ("parse_eye_color", parse_eye_color, [(c.code,) for c in EYE_COLORS] * LOOKUP_ROUNDS * 7),
+        ("parse_hair_color", parse_hair_color, [(c.code,) for c in HAIR_COLORS] * LOOKUP_ROUNDS * 7),
+        ("parse_race_ethnicity", parse_race_ethnicity, [(r.code,) for r in RACE_ETHNICITIES] * LOOKUP_ROUNDS * 10),
+        ("parse_date", parse_date, [("06061986", "%m%d%Y"), ("19860606", "%Y%m%d")] * LOOKUP_ROUNDS * 35)))
+
+
+def main() -> None:
+    bench_parse_stages()
+    print()
+    bench_fixed_overhead()
+    print()
+    bench_error_modes()
+    print()
+    bench_lookups()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import random
+import string
+from datetime import date, timedelta
+from itertools import cycle, islice, product
+
+import aamva.elements as elements
+from aamva.barcode import AAMVA_VERSIONS, BarcodeFile, FileHeader, Subfile
+from aamva.dates import get_issuer_date_format
+from aamva.encoder import encode_barcode
+from aamva.eye_color import EYE_COLORS
+from aamva.hair_color import HAIR_COLORS
+from aamva.issuing_authority import ISSUING_AUTHORITIES, IssuingAuthority
+from aamva.race_ethnicity import RACE_ETHNICITIES
+
+SEED = 636000
+MAX_JURISDICTION_SUBFILES = 3
+MAX_JURISDICTION_ELEMENTS = 8
+TEXT_CHARACTERS = string.ascii_uppercase + string.digits + " ,-"
+FIRST_DATE = date(1920, 1, 1)
+
+
+def random_text(rng: random.Random, max_length: int = 20) -> str:
+    return "".join(rng.choices(TEXT_CHARACTERS, k=rng.randint(1, max_length)))
+
+
+def random_value(rng: random.Random, decoder, aamva_version: int, date_format: str) -> str:
+    if decoder is elements.decode_date:
+        return (FIRST_DATE + timedelta(days=rng.randrange(40_000))).strftime(date_format)
+    elif decoder is elements.decode_eye_color:
+        return rng.choice(EYE_COLORS).code
+    elif decoder is elements.decode_hair_color:
+        return rng.choice(HAIR_COLORS).code
+    elif decoder is elements.decode_eye_color_version_1:
+        return rng.choice(tuple(elements.VERSION_1_EYE_COLORS)).ljust(3)
+    elif decoder is elements.decode_hair_color_version_1:
+        return rng.choice(tuple(elements.VERSION_1_HAIR_COLORS)).ljust(3)
+    elif decoder is elements.decode_race_ethnicity:
+        return rng.choice(RACE_ETHNICITIES).code
+    elif decoder is elements.decode_sex:
+        return rng.choice("MF" if aamva_version < 2 else "129")
+    elif decoder is elements.decode_truncation:
+        return rng.choice(tuple(elements.TRUNCATIONS))
+    elif decoder is elements.decode_flag:
+        return rng.choice("01")
+    elif decoder is elements.decode_int:
+        return f"{rng.randint(90, 350):03d}"
+    elif decoder is elements.decode_height:
+        return f"{rng.randint(55, 80):03d} in" if rng.random() < 0.5 else f"{rng.randint(140, 205):03d} cm"
+    elif decoder is elements.decode_height_feet_inches:
+        return f"{rng.randint(4, 6)}{rng.randint(0, 11):02d}"
+    elif decoder is elements.decode_height_cm:
+        return f"{rng.randint(140, 205):03d}"
+    return random_text(rng)
+
+
+def card_elements(rng: random.Random, authority: IssuingAuthority, aamva_version: int) -> dict[str, str]:
+    date_format = get_issuer_date_format(authority.issuer_id, aamva_version)
+    schema = elements.get_schema(aamva_version)
+    element_ids = rng.sample(sorted(schema), rng.randint(len(schema) // 2, len(schema)))
+    if "DAQ" not in element_ids:
+        element_ids.insert(0, "DAQ")
+    return {
+        element_id: random_value(rng, schema[element_id].decoder, aamva_version, date_format)
+        for element_id in element_ids}
+
+
+def generate_barcode(rng: random.Random, authority: IssuingAuthority, aamva_version: int) -> str:
+    subfiles = [(rng.choice(elements.CARD_SUBFILE_TYPES), card_elements(rng, authority, aamva_version))]
+    for letter in rng.sample(string.ascii_uppercase, rng.randint(0, MAX_JURISDICTION_SUBFILES)):
+        subfile_type = "Z" + letter
+        subfiles.append((subfile_type, {
+            subfile_type + element_letter: random_text(rng)
+            for element_letter in string.ascii_uppercase[:rng.randint(1, MAX_JURISDICTION_ELEMENTS)]}))
+
+    header = FileHeader(
+        issuer_id=authority.issuer_id,
+        aamva_version=aamva_version,
+        number_of_entries=len(subfiles),
+        jurisdiction_version=0 if aamva_version < 2 else rng.randint(0, 99))
+    return encode_barcode(BarcodeFile(
+        header=header,
+        subfiles=tuple(Subfile(subfile_type=subfile_type, elements=items) for subfile_type, items in subfiles)))
+
+
+def generate_corpus(size: int = len(ISSUING_AUTHORITIES) * len(AAMVA_VERSIONS), seed: int = SEED) -> list[str]:
+    # Cycles through every issuer and AAMVA version, so the default size covers each combination once.
+    rng = random.Random(seed)
+    combinations = islice(cycle(product(ISSUING_AUTHORITIES, AAMVA_VERSIONS)), size)
+    return [generate_barcode(rng, authority, aamva_version) for authority, aamva_version in combinations]
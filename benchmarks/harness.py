@@ -0,0 +1,34 @@
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+
+REPEAT = 3
+
+
+def ops_per_second(func: Callable, args: Sequence[tuple], repeat: int = REPEAT) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in args:
+            func(*item)
+        best = min(best, time.perf_counter() - start)
+    return len(args) / best
+
+
+def retained_bytes(func: Callable, args: Sequence[tuple]) -> float:
+    # Average bytes still allocated per call while every result is kept alive.
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        results = [func(*item) for item in args]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del results
+    return (after - before) / len(args)
+
+
+def report(rows: Sequence[tuple[str, Callable, Sequence[tuple]]]) -> None:
+    print(f"{'benchmark':>34} {'ops/s':>12} {'bytes/op':>10}")
+    for name, func, args in rows:
+        print(f"{name:>34} {ops_per_second(func, args):>12,.0f} {retained_bytes(func, args):>10.0f}")
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.fixture
+def replace_char_at_index():
+    def _replace_char_at_index(self, index, replace_with="#"):
+        self = list(self)
+        self[index] = replace_with
+        return "".join(self)
+    return _replace_char_at_index
@@ -0,0 +1,140 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import aamva.aio as aio
+from tests.test_barcode import barcode_testdata
+
+raw_records = tuple(map(lambda x: x[1].encode("latin-1"), barcode_testdata))
+expected_files = tuple(map(lambda x: {"header": x[2], "subfiles": x[4]}, barcode_testdata))
+
+
+def stream_from(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+async def collect(async_iterator):
+    return [item async for item in async_iterator]
+
+
+def run_with_stream(data, coroutine_function):
+    # StreamReader has to be created inside the running event loop.
+    async def run():
+        return await coroutine_function(stream_from(data))
+    return asyncio.run(run())
+
+
+async def serve_and_collect(payload, framing, piece_size=7, keep_open=False):
+    # Sends the payload over a loopback connection in small pieces and collects the parsed results. With
+    # keep_open the connection stays open after the payload, so only as many results as there are records
+    # in the payload are collected.
+    done = asyncio.Event()
+
+    async def handle(reader, writer):
+        for i in range(0, len(payload), piece_size):
+            writer.write(payload[i:i + piece_size])
+            await writer.drain()
+        if keep_open:
+            await done.wait()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    async with server:
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+        results = list()
+        async for result in aio.iter_stream_barcodes(reader, framing):
+            results.append(result)
+            if keep_open and len(results) == payload.count(aio.HEADER_PREFIX_BYTES):
+                break
+        done.set()
+        writer.close()
+    return results
+
+
+class TestReadRawRecordFunction:
+    def test_should_successfully_frame_records_without_waiting_for_next_record(self):
+        async def run():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b"noise" + raw_records[0])
+            return await asyncio.wait_for(aio.read_raw_record(reader), 1)
+        assert asyncio.run(run()) == raw_records[0]
+
+    def test_should_return_none_at_end_of_stream(self):
+        assert run_with_stream(b"It's not here!", aio.read_raw_record) is None
+
+    def test_should_return_partial_record_when_header_is_invalid(self):
+        record = run_with_stream(raw_records[1][:15] + b"XX" + raw_records[1][17:], aio.read_raw_record)
+        assert record == raw_records[1][:15] + b"XX"
+
+    def test_should_keep_bytes_read_past_record_for_next_call(self):
+        async def run():
+            reader = stream_from(raw_records[0] + raw_records[1])
+            buffer = bytearray()
+            return [await aio.read_raw_record(reader, buffer) for _ in range(3)]
+        assert asyncio.run(run()) == [raw_records[0], raw_records[1], None]
+
+    def test_should_cap_record_at_maximum_length(self):
+        record = raw_records[1].replace(b"ZV03190008", b"ZV99999999")
+        assert len(run_with_stream(record + b"\0" * 20000, aio.read_raw_record)) == aio.MAX_RECORD_LENGTH
+
+
+class TestIterStreamRecordsFunction:
+    def test_should_raise_value_error_when_framing_not_supported(self):
+        with pytest.raises(ValueError, match="not supported"):
+            run_with_stream(b"", lambda reader: collect(aio.iter_stream_records(reader, "csv")))
+
+
+class TestIterStreamBarcodesFunction:
+    def test_should_successfully_parse_raw_records_from_loopback_server(self):
+        results = asyncio.run(serve_and_collect(b"noise".join(raw_records + raw_records), "raw"))
+        assert tuple(map(lambda x: x.barcode_file, results)) == expected_files + expected_files
+
+    def test_should_successfully_parse_escaped_records_from_loopback_server(self):
+        payload = b"".join(map(lambda x: x.decode("latin-1").encode("unicode_escape") + b"\n", raw_records))
+        results = asyncio.run(serve_and_collect(payload, "escaped"))
+        assert tuple(map(lambda x: x.barcode_file, results)) == expected_files
+
+    def test_should_yield_error_result_for_escaped_line_with_bad_escape(self):
+        lines = (raw_records[0].decode("latin-1").encode("unicode_escape"), b"\\u0141",
+                 raw_records[1].decode("latin-1").encode("unicode_escape"))
+        results = asyncio.run(serve_and_collect(b"\n".join(lines) + b"\n", "escaped"))
+        assert isinstance(results[1].error, ValueError)
+        assert (results[0].barcode_file, results[2].barcode_file) == expected_files
+
+    def test_should_yield_error_result_and_resynchronise_after_corrupted_subfile_offset(self):
+        async def run():
+            payload = raw_records[1].replace(b"ZV0319", b"ZV9319") + raw_records[0]
+            return await asyncio.wait_for(serve_and_collect(payload, "raw", keep_open=True), 5)
+        results = asyncio.run(run())
+        assert isinstance(results[0].error, ValueError)
+        assert results[1].barcode_file == expected_files[0]
+
+    def test_should_yield_error_result_and_resynchronise_after_malformed_record(self):
+        payload = raw_records[1][:15] + b"XX" + raw_records[1][17:] + raw_records[0]
+        results = run_with_stream(payload, lambda reader: collect(aio.iter_stream_barcodes(reader)))
+        assert isinstance(results[0].error, ValueError)
+        assert results[-1].barcode_file == expected_files[0]
+
+
+class TestParseBatchFunction:
+    @pytest.mark.parametrize("use_executor", (False, True), ids=("Default executor", "Thread pool"))
+    def test_should_successfully_return_results_in_input_order(self, use_executor):
+        barcodes = (barcode_testdata[0][1], "garbage", barcode_testdata[1][1]) * 10
+
+        async def run():
+            if not use_executor:
+                return await aio.parse_batch(barcodes, chunksize=4, max_in_flight=2)
+            with ThreadPoolExecutor(2) as executor:
+                return await aio.parse_batch(barcodes, executor, chunksize=4, max_in_flight=2)
+
+        results = asyncio.run(run())
+        assert len(results) == len(barcodes)
+        assert tuple(map(lambda x: x.barcode_file, results[:3])) == (expected_files[0], None, expected_files[1])
+
+    def test_should_raise_value_error_when_max_in_flight_less_than_1(self):
+        with pytest.raises(ValueError, match="less than 1"):
+            asyncio.run(aio.parse_batch((), max_in_flight=0))
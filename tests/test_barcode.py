@@ -112,15 +112,6 @@ barcode_testdata = (
 barcode_testdata_ids = tuple(map(lambda v: f"Version {v[0]}", barcode_testdata))
 
 
-@pytest.fixture
-def replace_char_at_index():
-    def _replace_char_at_index(self, index, replace_with="#"):
-        self = list(self)
-        self[index] = replace_with
-        return "".join(self)
-    return _replace_char_at_index
-
-
 class TestTrimBeforeFunction:
     def test_should_successfully_trim_everything_before_the_search_character(self):
         assert barcode.trim_before("@", "Before@After") == "@After"
@@ -143,6 +134,20 @@ class TestHeaderLengthFunction:
             barcode.header_length(aamva_version)
 
 
+class TestGetHeaderLayoutFunction:
+    def test_should_return_version_1_layout_without_jurisdiction_version(self):
+        assert barcode.get_header_layout(1) == barcode.HeaderLayout(19, None, 17, 10)
+
+    @pytest.mark.parametrize("aamva_version", (2, 10, 99))
+    def test_should_return_same_layout_for_every_later_version(self, aamva_version):
+        assert barcode.get_header_layout(aamva_version) == barcode.HeaderLayout(21, 17, 19, 10)
+
+    @pytest.mark.parametrize("aamva_version", (-1, 0, 100))
+    def test_should_raise_value_error_when_aamva_version_out_of_range(self, aamva_version):
+        with pytest.raises(ValueError, match="out of range"):
+            barcode.get_header_layout(aamva_version)
+
+
 class TestParseFileHeaderFunction:
     raises_testdata = tuple(map(lambda x: (x[0], x[1]), barcode_testdata))
     header_testdata = tuple(map(lambda x: (x[1], x[2]), barcode_testdata))
@@ -207,6 +212,56 @@ class TestParseSubfileDesignatorFunction:
         assert test_subfile_designator == designators[index]
 
 
+class TestParseSubfileDesignatorsFunction:
+    testdata = tuple((x[1], x[2], x[3]) for x in barcode_testdata)
+
+    @pytest.mark.parametrize("barcode_string, header, designators", testdata, ids=barcode_testdata_ids)
+    def test_should_return_every_designator_in_the_table(self, barcode_string, header, designators):
+        test_designators = barcode.parse_subfile_designators(barcode_string, header)
+        assert test_designators == designators
+        assert all(type(designator) is dict for designator in test_designators)
+
+    @pytest.mark.parametrize("barcode_string, header, designators", testdata, ids=barcode_testdata_ids)
+    def test_should_raise_value_error_when_designator_table_too_short(self, barcode_string, header, designators):
+        end = barcode.header_length(header["aamva_version"]) + 10 * len(designators)
+        with pytest.raises(ValueError, match="Subfile designator is too short."):
+            barcode.parse_subfile_designators(barcode_string[:end - 1], header)
+
+
+class TestFindElementFunction:
+    barcode_string = "DLDAQ123\nDBB19761123\nDCSSAMPLE\r"
+
+    @pytest.mark.parametrize("element_id, expects", (("DAQ", "123"), ("DBB", "19761123"), ("DCS", "SAMPLE"), ("DAC", None)))
+    def test_should_successfully_return_element_value(self, element_id, expects):
+        assert barcode.find_element(self.barcode_string, element_id, 2, len(self.barcode_string) - 1) == expects
+
+    def test_should_return_last_copy_of_repeated_element(self):
+        barcode_string = "DAQ1\nDBB2\nDAQ3"
+        assert barcode.find_element(barcode_string, "DAQ", 0, len(barcode_string)) == "3"
+
+
+class TestParseElementsFunction:
+    testdata = tuple(map(lambda x: (x[1], x[3][0], x[4][0]["elements"]), barcode_testdata))
+
+    @pytest.mark.parametrize("barcode_string, designator, elements", testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_return_all_elements(self, barcode_string, designator, elements):
+        start, end = designator["offset"] + 2, designator["offset"] + designator["length"] - 1
+        assert barcode.parse_elements(barcode_string, start, end) == elements
+
+    def test_should_keep_same_copy_of_repeated_element_with_and_without_wanted(self):
+        barcode_string = "DAQ1\n\nDBB2\nDAQ3\nDA"
+        elements = barcode.parse_elements(barcode_string, 0, len(barcode_string))
+        assert elements == {"DAQ": "3", "DBB": "2", "DA": ""}
+        assert barcode.parse_elements(barcode_string, 0, len(barcode_string), ("DAQ", "DBB")) == {"DAQ": "3", "DBB": "2"}
+
+    @pytest.mark.parametrize("barcode_string, designator, elements", testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_return_only_wanted_elements(self, barcode_string, designator, elements):
+        start, end = designator["offset"] + 2, designator["offset"] + designator["length"] - 1
+        wanted = ("DAQ", "DBB", "DBA", "ZZZ")
+        expects = {k: v for k, v in elements.items() if k in wanted}
+        assert barcode.parse_elements(barcode_string, start, end, wanted) == expects
+
+
 class TestParseSubfileFunction:
     raises_testdata = tuple(map(lambda x: (x[1], x[3]), barcode_testdata))
     subfile_testdata = tuple(map(lambda x: (x[1], x[3], x[4]), barcode_testdata))
@@ -257,3 +312,42 @@ class TestParseBarcodeStringFunction:
         barcode_file = barcode.parse_barcode_string(barcode_string)
         assert type(barcode_file) is dict
         assert barcode_file == {"header": header, "subfiles": subfiles}
+
+    @pytest.mark.parametrize("barcode_string, header, subfiles", file_testdata, ids=barcode_testdata_ids)
+    def test_should_only_return_wanted_elements(self, barcode_string, header, subfiles):
+        barcode_file = barcode.parse_barcode_string(barcode_string, wanted=("DAQ", "ZZZ"))
+        assert barcode_file["header"] == header
+        for subfile, expects in zip(barcode_file["subfiles"], subfiles):
+            assert subfile["elements"] == {k: v for k, v in expects["elements"].items() if k == "DAQ"}
+
+
+class TestFindElementValueFunction:
+    barcode_file = {"header": barcode_testdata[1][2], "subfiles": barcode_testdata[1][4]}
+
+    @pytest.mark.parametrize("element_id, expects", (("DAQ", "T64235789"), ("ZVA", "01"), ("ZZZ", None)))
+    def test_should_return_value_from_first_subfile_with_element(self, element_id, expects):
+        assert barcode.find_element_value(self.barcode_file, element_id) == expects
+
+
+class TestExtractFieldsFunction:
+    file_testdata = tuple(map(lambda x: (x[1], x[4]), barcode_testdata))
+    raises_testdata = tuple(map(lambda x: (x[0], x[1]), barcode_testdata))
+
+    @pytest.mark.parametrize("barcode_string, subfiles", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_return_wanted_elements(self, barcode_string, subfiles):
+        elements = subfiles[0]["elements"]
+        fields = barcode.extract_fields(barcode_string, {"DL": {"DBB", "DAQ", "DBA"}})
+        assert fields == {"DL": {"DBB": elements["DBB"], "DAQ": elements["DAQ"], "DBA": elements["DBA"]}}
+
+    @pytest.mark.parametrize("barcode_string, subfiles", file_testdata, ids=barcode_testdata_ids)
+    def test_should_leave_out_missing_subfiles_and_elements(self, barcode_string, subfiles):
+        fields = barcode.extract_fields(barcode_string, {"ID": {"DAQ"}, "ZV": {"ZVA", "ZVZ"}})
+        assert fields == {"ZV": {"ZVA": subfiles[1]["elements"]["ZVA"]}}
+
+    @pytest.mark.parametrize("version, barcode_string", raises_testdata, ids=barcode_testdata_ids)
+    def test_should_not_read_subfiles_after_the_last_wanted_one(self, version, barcode_string):
+        designator = barcode.parse_subfile_designator(barcode_string, version, 1)
+        truncated = barcode_string[:designator["offset"]]
+        assert barcode.extract_fields(truncated, {"DL": {"DAQ"}})["DL"]["DAQ"]
+        with pytest.raises(ValueError, match="too short"):
+            barcode.extract_fields(truncated, {"ZV": {"ZVA"}})
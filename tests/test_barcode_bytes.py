@@ -0,0 +1,145 @@
+import pickle
+
+import pytest
+
+import aamva.barcode as barcode
+import aamva.barcode_bytes as barcode_bytes
+from tests.test_barcode import barcode_testdata, barcode_testdata_ids
+
+
+def to_bytes(barcode_string):
+    return barcode_string.encode(barcode_bytes.ENCODING)
+
+
+class TestReadIntFunction:
+    def test_should_successfully_read_digits(self):
+        assert barcode_bytes.read_int(memoryview(b"xx0123xx"), 2, 6) == 123
+
+    def test_should_raise_same_value_error_as_int_when_not_digits(self):
+        with pytest.raises(ValueError, match="invalid literal for int"):
+            barcode_bytes.read_int(memoryview(b"12a4"), 0, 4)
+
+    def test_should_accept_padded_numbers_like_int(self):
+        assert barcode_bytes.read_int(memoryview(b" 410"), 0, 4) == 410
+
+
+def parse_outcome(parser, barcode):
+    try:
+        barcode_file = parser(barcode)
+    except ValueError as error:
+        return str(error)
+    return {"header": barcode_file["header"], "subfiles": tuple(
+        {"subfile_type": subfile["subfile_type"], "elements": dict(subfile["elements"])}
+        for subfile in barcode_file["subfiles"])}
+
+
+class TestStrParserParity:
+    @pytest.mark.parametrize("replace_with", ("\n", " ", "X", "\r"), ids=("separator", "space", "letter", "terminator"))
+    @pytest.mark.parametrize("barcode_string", tuple(x[1] for x in barcode_testdata), ids=barcode_testdata_ids)
+    def test_should_return_same_result_or_error_as_str_parser(self, barcode_string, replace_with):
+        for index in range(len(barcode_string)):
+            mutated = barcode_string[:index] + replace_with + barcode_string[index + 1:]
+            assert parse_outcome(barcode_bytes.parse_barcode_bytes, to_bytes(mutated)) == \
+                parse_outcome(barcode.parse_barcode_string, mutated), index
+
+    @pytest.mark.parametrize("barcode_string", tuple(x[1] for x in barcode_testdata), ids=barcode_testdata_ids)
+    def test_should_return_same_error_as_str_parser_when_truncated(self, barcode_string):
+        for end in range(len(barcode_string)):
+            assert parse_outcome(barcode_bytes.parse_barcode_bytes, to_bytes(barcode_string[:end])) == \
+                parse_outcome(barcode.parse_barcode_string, barcode_string[:end]), end
+
+
+class TestTrimBeforeBytesFunction:
+    def test_should_successfully_trim_everything_before_compliance_indicator(self):
+        assert barcode_bytes.trim_before_bytes(memoryview(b"Before@After")) == b"@After"
+
+    def test_should_not_trim_when_compliance_indicator_not_found(self):
+        assert barcode_bytes.trim_before_bytes(memoryview(b"It's not here!")) == b"It's not here!"
+
+
+class TestParseFileHeaderBytesFunction:
+    header_testdata = tuple(map(lambda x: (x[1], x[2]), barcode_testdata))
+
+    @pytest.mark.parametrize("index, name", (
+        (0, "COMPLIANCE_INDICATOR"),
+        (1, "DATA_ELEMENT_SEPARATOR"),
+        (2, "RECORD_SEPARATOR"),
+        (3, "SEGMENT_TERMINATOR"),
+        (4, "FILE_TYPE")))
+    @pytest.mark.parametrize("barcode_string, _", header_testdata, ids=barcode_testdata_ids)
+    def test_should_raise_value_error_when_header_element_is_invalid(self, barcode_string, _, index, name):
+        buf = bytearray(to_bytes(barcode_string))
+        buf[index] = ord("#")
+        with pytest.raises(ValueError, match=name):
+            barcode_bytes.parse_file_header_bytes(memoryview(buf))
+
+    @pytest.mark.parametrize("barcode_string, _", header_testdata, ids=barcode_testdata_ids)
+    def test_should_raise_value_error_when_header_is_too_short(self, barcode_string, _):
+        with pytest.raises(ValueError, match="too short"):
+            barcode_bytes.parse_file_header_bytes(memoryview(to_bytes(barcode_string)[:16]))
+
+    @pytest.mark.parametrize("barcode_string, header", header_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_return_file_header_dict(self, barcode_string, header):
+        assert barcode_bytes.parse_file_header_bytes(memoryview(to_bytes(barcode_string))) == header
+
+
+class TestParseSubfileDesignatorsBytesFunction:
+    designator_testdata = tuple(map(lambda x: (x[1], x[2], x[3]), barcode_testdata))
+
+    @pytest.mark.parametrize("barcode_string, header, designators", designator_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_return_designator_table(self, barcode_string, header, designators):
+        view = memoryview(to_bytes(barcode_string))
+        assert barcode_bytes.parse_subfile_designators_bytes(view, header) == designators
+
+
+class TestParseBarcodeBytesFunction:
+    file_testdata = tuple(map(lambda x: (x[1], x[2], x[4]), barcode_testdata))
+
+    @pytest.mark.parametrize("buffer_type", (bytes, bytearray, memoryview))
+    @pytest.mark.parametrize("barcode_string, header, subfiles", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_return_barcode_file_dict(self, barcode_string, header, subfiles, buffer_type):
+        barcode_file = barcode_bytes.parse_barcode_bytes(buffer_type(to_bytes(barcode_string)))
+        assert barcode_file == {"header": header, "subfiles": subfiles}
+
+    @pytest.mark.parametrize("barcode_string, header, subfiles", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_parse_with_noise_prefix(self, barcode_string, header, subfiles):
+        barcode_file = barcode_bytes.parse_barcode_bytes(b"\x00noise" + to_bytes(barcode_string))
+        assert barcode_file == {"header": header, "subfiles": subfiles}
+
+    def test_should_not_alias_mutable_input_buffer(self):
+        buf = bytearray(to_bytes(barcode_testdata[1][1]))
+        barcode_file = barcode_bytes.parse_barcode_bytes(buf)
+        buf[buf.index(b"DAQ") + 3] = ord("X")
+        assert barcode_file["subfiles"][0]["elements"]["DAQ"] == "T64235789"
+        buf.clear()
+
+    def test_should_pickle_elements_as_dict(self):
+        barcode_file = barcode_bytes.parse_barcode_bytes(to_bytes(barcode_testdata[1][1]))
+        assert pickle.loads(pickle.dumps(barcode_file)) == {"header": barcode_testdata[1][2], "subfiles": barcode_testdata[1][4]}
+
+    def test_should_key_short_element_on_what_is_there(self):
+        spans = barcode_bytes.element_spans(memoryview(b"DAQ1\nDB\n"), 0, 8)
+        assert spans == {"DAQ": (3, 4), "DB": (7, 7)}
+
+    def test_should_return_lazy_elements_view(self):
+        barcode_file = barcode_bytes.parse_barcode_bytes(to_bytes(barcode_testdata[1][1]))
+        elements = barcode_file["subfiles"][0]["elements"]
+        assert isinstance(elements, barcode_bytes.ElementsView)
+        assert elements["DBB"] == "06061986"
+        assert "DAQ" in elements and "ZZZ" not in elements
+        with pytest.raises(KeyError):
+            elements["ZZZ"]
+
+    @pytest.mark.parametrize("index", (0, 1), ids=("Subfile 0", "Subfile 1"))
+    def test_should_raise_value_error_when_missing_segment_terminator(self, index):
+        _, barcode_string, _, designators, _ = barcode_testdata[1]
+        buf = bytearray(to_bytes(barcode_string))
+        buf[designators[index]["offset"] + designators[index]["length"] - 1] = ord("#")
+        with pytest.raises(ValueError, match="missing segment terminator"):
+            barcode_bytes.parse_barcode_bytes(buf)
+
+    def test_should_raise_value_error_when_number_of_entries_less_than_1(self):
+        buf = bytearray(to_bytes(barcode_testdata[1][1]))
+        buf[20] = ord("0")
+        with pytest.raises(ValueError, match="less than 1"):
+            barcode_bytes.parse_barcode_bytes(buf)
@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import aamva.batch as batch
+from aamva.barcode import parse_barcode_string
+from aamva.barcode_bytes import parse_barcode_bytes
+from aamva.elements import decode_barcode_file
+from tests.test_barcode import barcode_testdata
+
+barcode_strings = tuple(map(lambda x: x[1], barcode_testdata))
+expected_files = tuple(map(lambda x: {"header": x[2], "subfiles": x[4]}, barcode_testdata))
+
+
+def parse_unpicklable(barcode_string):
+    # Module level so it can be sent to workers; its result cannot be sent back.
+    if barcode_string == "unpicklable":
+        return {"callback": lambda: None}
+    return parse_barcode_string(barcode_string)
+
+
+class TestChunkedFunction:
+    def test_should_successfully_split_iterable_into_chunks(self):
+        assert tuple(batch.chunked(range(5), 2)) == ((0, 1), (2, 3), (4,))
+
+
+class TestParseOneFunction:
+    def test_should_successfully_return_barcode_file(self):
+        assert batch.parse_one(batch.parse_barcode_string, barcode_strings[0]) == (expected_files[0], None)
+
+    def test_should_return_error_instead_of_raising(self):
+        result = batch.parse_one(batch.parse_barcode_string, "garbage")
+        assert result.barcode_file is None
+        assert type(result.error) is ValueError
+
+    def test_should_return_error_for_wrong_typed_input(self):
+        result = batch.parse_one(batch.parse_barcode_string, 12345)
+        assert result.barcode_file is None and result.error is not None
+
+
+class TestParseManyFunction:
+    @pytest.mark.parametrize("workers", (1, 2))
+    def test_should_successfully_return_results_in_input_order(self, workers):
+        barcodes = (barcode_strings[0], "garbage", barcode_strings[1]) * 5
+        results = tuple(batch.parse_many(barcodes, workers=workers, chunksize=2))
+        assert len(results) == len(barcodes)
+        for barcode, result in zip(barcodes, results):
+            if barcode == "garbage":
+                assert result.barcode_file is None and isinstance(result.error, ValueError)
+            else:
+                assert result.error is None
+                assert result.barcode_file == expected_files[barcode_strings.index(barcode)]
+
+    def test_should_successfully_use_provided_parser(self):
+        barcodes = map(lambda x: x.encode("latin-1"), barcode_strings)
+        results = tuple(batch.parse_many(barcodes, workers=1, parser=parse_barcode_bytes))
+        assert tuple(map(lambda x: x.barcode_file, results)) == expected_files
+
+    def test_should_successfully_use_bytes_parser_in_worker_processes(self):
+        barcodes = tuple(map(lambda x: x.encode("latin-1"), barcode_strings)) + (b"junk",)
+        results = tuple(batch.parse_many(barcodes, workers=2, chunksize=1, parser=parse_barcode_bytes))
+        assert tuple(map(lambda x: x.barcode_file, results)) == expected_files + (None,)
+        assert isinstance(results[-1].error, ValueError)
+
+    def test_should_return_error_for_result_that_cannot_leave_worker(self):
+        barcodes = (barcode_strings[0], "unpicklable", barcode_strings[1])
+        results = tuple(batch.parse_many(barcodes, workers=2, chunksize=3, parser=parse_unpicklable))
+        assert (results[0].barcode_file, results[2].barcode_file) == expected_files
+        assert isinstance(results[1].error, TypeError)
+
+    def test_should_raise_value_error_when_parser_not_picklable(self):
+        with pytest.raises(ValueError, match="picklable"):
+            tuple(batch.parse_many(barcode_strings, workers=2, parser=lambda x: x))
+
+    @pytest.mark.parametrize("workers, chunksize", ((0, 1), (1, 0)), ids=("workers", "chunksize"))
+    def test_should_raise_value_error_when_argument_less_than_1(self, workers, chunksize):
+        with pytest.raises(ValueError, match="less than 1"):
+            tuple(batch.parse_many(barcode_strings, workers=workers, chunksize=chunksize))
+
+
+class TestParseManyThreadedFunction:
+    def test_should_successfully_return_results_in_input_order(self):
+        barcodes = (barcode_strings[0], "garbage", barcode_strings[1]) * 50
+        results = tuple(batch.parse_many_threaded(barcodes, workers=4, chunksize=2))
+        assert len(results) == len(barcodes)
+        for barcode, result in zip(barcodes, results):
+            if barcode == "garbage":
+                assert result.barcode_file is None and isinstance(result.error, ValueError)
+            else:
+                assert result.barcode_file == expected_files[barcode_strings.index(barcode)]
+
+    def test_should_successfully_use_provided_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for _ in range(2):
+                results = tuple(batch.parse_many_threaded(barcode_strings, chunksize=1, executor=executor))
+                assert tuple(map(lambda x: x.barcode_file, results)) == expected_files
+
+    def test_should_return_same_decoded_elements_from_concurrent_threads(self):
+        barcodes = barcode_strings * 200
+        expects = tuple(map(decode_barcode_file, expected_files)) * 200
+        results = tuple(batch.parse_many_threaded(
+            barcodes, workers=8, chunksize=3, parser=lambda x: decode_barcode_file(parse_barcode_string(x))))
+        assert tuple(map(lambda x: x.barcode_file, results)) == expects
+
+    @pytest.mark.parametrize("workers, chunksize", ((0, 1), (1, 0)), ids=("workers", "chunksize"))
+    def test_should_raise_value_error_when_argument_less_than_1(self, workers, chunksize):
+        with pytest.raises(ValueError, match="less than 1"):
+            tuple(batch.parse_many_threaded(barcode_strings, workers=workers, chunksize=chunksize))
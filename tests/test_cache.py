@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+import aamva.cache as cache
+from tests.test_barcode import barcode_testdata
+
+barcode_strings = tuple(map(lambda x: x[1], barcode_testdata))
+expected_files = tuple(map(lambda x: {"header": x[2], "subfiles": x[4]}, barcode_testdata))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestFreezeBarcodeFileFunction:
+    def test_should_return_equal_read_only_barcode_file(self):
+        barcode_file = cache.freeze_barcode_file(cache.parse_barcode_string(barcode_strings[1]))
+        assert barcode_file == expected_files[1]
+        with pytest.raises(TypeError):
+            barcode_file["header"]["issuer_id"] = 1
+        with pytest.raises(TypeError):
+            barcode_file["subfiles"][0]["elements"]["DAQ"] = "X"
+
+
+class TestParseCacheClass:
+    def test_should_successfully_return_cached_result_on_repeat_scan(self):
+        parse_cache = cache.ParseCache()
+        first = parse_cache.parse(barcode_strings[1])
+        assert first == expected_files[1]
+        assert parse_cache.parse(barcode_strings[1]) is first
+        assert parse_cache.stats[:3] == (1, 1, 0)
+
+    def test_should_raise_value_error_and_not_cache_invalid_payload(self):
+        parse_cache = cache.ParseCache()
+        with pytest.raises(ValueError):
+            parse_cache.parse("garbage")
+        assert len(parse_cache) == 0
+
+    def test_should_evict_least_recently_used_entry_when_over_byte_budget(self):
+        sizes = tuple(map(lambda x: cache.estimate_size(x, cache.parse_barcode_string(x)), barcode_strings))
+        parse_cache = cache.ParseCache(max_bytes=max(sizes) + min(sizes) - 1)
+        parse_cache.parse(barcode_strings[0])
+        parse_cache.parse(barcode_strings[1])
+        assert parse_cache.stats.evictions == 1
+        assert parse_cache.stats.size_bytes == sizes[1]
+
+    def test_should_not_cache_result_larger_than_byte_budget(self):
+        parse_cache = cache.ParseCache(max_bytes=1)
+        assert parse_cache.parse(barcode_strings[0]) == expected_files[0]
+        assert len(parse_cache) == 0
+
+    def test_should_expire_entry_after_ttl(self):
+        clock = FakeClock()
+        parse_cache = cache.ParseCache(ttl=5, clock=clock)
+        first = parse_cache.parse(barcode_strings[0])
+        clock.now = 4.9
+        assert parse_cache.parse(barcode_strings[0]) is first
+        clock.now = 5.0
+        assert parse_cache.parse(barcode_strings[0]) is not first
+        assert parse_cache.stats[:4] == (1, 2, 0, 1)
+
+    def test_should_successfully_clear_entries(self):
+        parse_cache = cache.ParseCache()
+        parse_cache.parse(barcode_strings[0])
+        parse_cache.clear()
+        assert (len(parse_cache), parse_cache.stats.size_bytes) == (0, 0)
+
+    def test_should_keep_consistent_counters_across_threads(self):
+        parse_cache = cache.ParseCache()
+
+        def scan():
+            for _ in range(200):
+                for barcode_string in barcode_strings:
+                    parse_cache.parse(barcode_string)
+
+        threads = [threading.Thread(target=scan) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = parse_cache.stats
+        assert stats.hits + stats.misses == 4 * 200 * len(barcode_strings)
+        assert stats.entries == len(barcode_strings)
+
+    @pytest.mark.parametrize("kwargs", ({"max_bytes": 0}, {"ttl": 0}), ids=("max_bytes", "ttl"))
+    def test_should_raise_value_error_when_limit_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            cache.ParseCache(**kwargs)
@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+import sys
+
+import pytest
+
+import aamva.cli as cli
+from tests.test_barcode import barcode_testdata
+
+barcode_strings = tuple(map(lambda x: x[1], barcode_testdata))
+
+
+@pytest.fixture
+def barcode_file(tmp_path):
+    path = tmp_path / "barcodes.bin"
+    path.write_bytes("".join(barcode_strings).encode("latin-1"))
+    return path
+
+
+class TestFormatValueFunction:
+    @pytest.mark.parametrize("value, expects", (
+        (cli.date(1986, 6, 6), "1986-06-06"),
+        (cli.Height(68, "in"), "68 in"),
+        (cli.EyeColor("BRO", "Brown", "Brown, including amber"), "BRO"),
+        (True, True),
+        ("SAMPLE", "SAMPLE")))
+    def test_should_successfully_flatten_value(self, value, expects):
+        assert cli.format_value(value) == expects
+
+
+class TestMainFunction:
+    @pytest.mark.parametrize("workers", ("1", "2"))
+    def test_should_successfully_write_ndjson(self, barcode_file, capsys, workers):
+        assert cli.main(["parse", str(barcode_file), "--workers", workers, "--batch-size", "1"]) == 0
+        out, err = capsys.readouterr()
+        rows = list(map(json.loads, out.splitlines()))
+        assert [row["record"] for row in rows] == [0, 1]
+        assert rows[1]["customer_family_name"] == "SAMPLE"
+        assert rows[1]["date_of_birth"] == "1986-06-06"
+        assert rows[1]["eye_color"] == "BRO"
+        assert err.startswith("2 records, 0 errors in ")
+
+    def test_should_successfully_write_csv_with_selected_fields(self, barcode_file, capsys):
+        argv = ["parse", str(barcode_file), "--workers", "1", "--format", "csv", "--fields", "issuer_id,customer_id_number"]
+        assert cli.main(argv) == 0
+        rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+        assert rows == [
+            ["record", "issuer_id", "customer_id_number", "error"],
+            ["0", "636000", "0123456789ABC", ""],
+            ["1", "636000", "T64235789", ""]]
+
+    def test_should_read_escaped_barcodes_from_stdin_and_report_errors(self, capsys, monkeypatch):
+        lines = [barcode_strings[1].encode("unicode_escape"), b"@garbage", b"@\\x1", barcode_strings[0].encode("unicode_escape")]
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"\n".join(lines) + b"\n")))
+        assert cli.main(["parse", "--workers", "1", "--framing", "escaped", "--fields", "customer_id_number", "-q"]) == 0
+        out, err = capsys.readouterr()
+        rows = list(map(json.loads, out.splitlines()))
+        assert rows[0] == {"record": 0, "customer_id_number": "T64235789"}
+        assert rows[1]["record"] == 1 and rows[1]["error"]
+        assert rows[2]["record"] == 2 and "decode" in rows[2]["error"]
+        assert rows[3] == {"record": 3, "customer_id_number": "0123456789ABC"}
+        assert err == ""
+
+    def test_should_exit_with_error_when_field_is_unknown(self, barcode_file, capsys):
+        with pytest.raises(SystemExit):
+            cli.main(["parse", str(barcode_file), "--fields", "nope"])
+        assert "unknown fields: nope" in capsys.readouterr().err
+
+    def test_should_exit_with_error_when_workers_less_than_1(self, barcode_file, capsys):
+        assert cli.main(["parse", str(barcode_file), "--workers", "0"]) == 2
+        assert "less than 1" in capsys.readouterr().err
@@ -0,0 +1,108 @@
+from datetime import date
+
+import pytest
+
+import aamva.columnar as columnar
+import aamva.elements as elements
+from aamva.barcode import parse_barcode_string
+from aamva.encoder import encode_barcode
+from tests.test_barcode import barcode_testdata
+
+barcode_strings = tuple(map(lambda x: x[1], barcode_testdata))
+columns = ("issuer_id", "aamva_version", "DBB", "DAQ", "DAY", "ZVA")
+
+
+class TestColumnKindFunction:
+    @pytest.mark.parametrize("name, expects", (
+        ("issuer_id", "int"),
+        ("jurisdiction_version", "int"),
+        ("DBB", "date"),
+        ("DDH", "date"),
+        ("DAQ", "string"),
+        ("ZVA", "string")))
+    def test_should_successfully_return_column_kind(self, name, expects):
+        assert columnar.column_kind(name) == expects
+
+    def test_should_raise_value_error_when_name_is_not_a_column(self):
+        with pytest.raises(ValueError, match="not a header field or element ID"):
+            columnar.column_kind("date_of_birth")
+
+
+class TestColumnBuilderClass:
+    @pytest.mark.parametrize("kind, values", (
+        ("int", [1, None, 3, 4, 5, 6, 7, 8, None, 10]),
+        ("date", [0, None, 19_000]),
+        ("string", ["A", None, "", "ÉÈ"])))
+    def test_should_successfully_round_trip_values(self, kind, values):
+        builder = columnar.ColumnBuilder(kind)
+        for value in values:
+            builder.append(value)
+        column = builder.finish()
+        assert column.length == len(values)
+        assert len(column.validity) == (len(values) + 7) // 8
+        if kind == "date":
+            values = [None if x is None else date.fromordinal(x + columnar.UNIX_EPOCH_ORDINAL) for x in values]
+        assert columnar.column_to_list(column) == values
+
+
+class TestParseColumnsFunction:
+    def test_should_successfully_return_columns(self):
+        batch = columnar.parse_columns(barcode_strings, columns, workers=1)
+        assert batch.num_rows == 2
+        assert batch.errors == ()
+        assert tuple(batch.columns) == columns
+        values = {name: columnar.column_to_list(column) for name, column in batch.columns.items()}
+        assert values == {
+            "issuer_id": [636000, 636000],
+            "aamva_version": [1, 10],
+            "DBB": [date(1976, 11, 23), date(1986, 6, 6)],
+            "DAQ": ["0123456789ABC", "T64235789"],
+            "DAY": ["BL ", "BRO"],
+            "ZVA": ["JURISDICTIONDEFINEDELEMENT", "01"]}
+
+    @pytest.mark.parametrize("barcode_string", barcode_strings, ids=("Version 1", "Version 10"))
+    def test_should_decode_dates_as_element_schema_does(self, barcode_string):
+        barcode_file = parse_barcode_string(barcode_string)
+        barcode_file["subfiles"][0]["elements"]["DBB"] += " "
+        batch = columnar.parse_columns((encode_barcode(barcode_file),), ("DBB",), workers=1)
+        expects = elements.decode_barcode_file(barcode_file).fields["date_of_birth"]
+        assert columnar.column_to_list(batch.columns["DBB"]) == [expects]
+
+    @pytest.mark.parametrize("workers", (1, 2))
+    def test_should_report_errors_by_input_position(self, workers):
+        barcodes = (barcode_strings[0], "garbage", barcode_strings[1])
+        batch = columnar.parse_columns(barcodes, ("DAQ",), workers=workers, chunksize=1)
+        assert batch.num_rows == 2
+        assert [index for index, _ in batch.errors] == [1]
+        assert type(batch.errors[0][1]) is ValueError
+        assert columnar.column_to_list(batch.columns["DAQ"]) == ["0123456789ABC", "T64235789"]
+
+    def test_should_raise_value_error_when_columns_is_empty(self):
+        with pytest.raises(ValueError, match="cannot be empty"):
+            columnar.parse_columns(barcode_strings, ())
+
+
+class TestToNumpyFunction:
+    def test_should_successfully_return_numpy_arrays(self):
+        numpy = pytest.importorskip("numpy")
+        arrays = columnar.to_numpy(columnar.parse_columns(barcode_strings, columns, workers=1))
+        assert arrays["issuer_id"].tolist() == [636000, 636000]
+        assert numpy.array_equal(arrays["DBB"], numpy.array(["1976-11-23", "1986-06-06"], dtype="datetime64[D]"))
+        assert arrays["DAQ"].tolist() == ["0123456789ABC", "T64235789"]
+
+
+class TestToArrowFunction:
+    def test_should_successfully_return_arrow_table(self):
+        pytest.importorskip("pyarrow")
+        batch = columnar.parse_columns(barcode_strings, columns, workers=1)
+        table = columnar.to_arrow(batch)
+        assert table.column_names == list(columns)
+        assert table.num_rows == 2
+        for name, column in batch.columns.items():
+            assert table.column(name).to_pylist() == columnar.column_to_list(column)
+
+    def test_should_successfully_write_parquet(self, tmp_path):
+        parquet = pytest.importorskip("pyarrow.parquet")
+        batch = columnar.parse_columns(barcode_strings, columns, workers=1)
+        columnar.write_parquet(batch, tmp_path / "cards.parquet")
+        assert parquet.read_table(tmp_path / "cards.parquet").equals(columnar.to_arrow(batch))
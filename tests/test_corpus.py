@@ -0,0 +1,15 @@
+from aamva.barcode import parse_barcode_string
+from aamva.elements import decode_barcode_file
+from benchmarks.corpus import generate_corpus
+
+
+class TestGenerateCorpusFunction:
+    def test_should_generate_values_every_element_decoder_accepts(self):
+        errors = {
+            index: decoded.errors
+            for index, decoded in enumerate(map(decode_barcode_file, map(parse_barcode_string, generate_corpus())))
+            if decoded.errors}
+        assert errors == {}
+
+    def test_should_generate_same_corpus_for_same_seed(self):
+        assert generate_corpus(20) == generate_corpus(20)
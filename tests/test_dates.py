@@ -2,6 +2,7 @@ import pytest
 import datetime
 
 import aamva.dates as dates
+import aamva.issuing_authority as issuing_authority
 
 country_format_testdata = (
     # ((country, expects), ...)
@@ -23,9 +24,9 @@ class TestCountryDateFormatFunction:
 
 date_format_testdata = (
     # ((*args, expects), ...)
-    ((1, "Canada"), "%m%d%Y"),  # Imperial
-    ((1, "Mexico"), "%m%d%Y"),  # Imperial
-    ((1, "USA"), "%m%d%Y"),  # Imperial
+    ((1, "Canada"), "%Y%m%d"),  # ISO
+    ((1, "Mexico"), "%Y%m%d"),  # ISO
+    ((1, "USA"), "%Y%m%d"),  # ISO
     ((2, "Canada"), "%m%d%Y"),  # Imperial
     ((2, "Mexico"), "%m%d%Y"),  # Imperial
     ((2, "USA"), "%m%d%Y"),  # Imperial
@@ -78,3 +79,79 @@ class TestParseDateFunction:
     def test_should_raise_value_error_when_invalid_date_format(self):
         with pytest.raises(ValueError, match="Invalid date format"):
             dates.parse_date("05162024", "%Y%m%d")
+
+
+invalid_date_testdata = (
+    # ((date_string, format), ...)
+    ("05162024", "%Y%m%d"),  # Month out of range
+    ("20240230", "%Y%m%d"),  # Day out of range
+    ("2024051", "%Y%m%d"),  # Too short
+    ("202405160", "%Y%m%d"),  # Too long
+    ("2024-5-6", "%Y%m%d"),  # Not digits
+    ("00000101", "%Y%m%d"),  # Year out of range
+    ("13012024", "%m%d%Y"))  # Month out of range
+
+
+class TestDecodeDateFunction:
+    @pytest.mark.parametrize("args, expects", date_testdata, ids=date_testdata_ids)
+    def test_should_successfully_return_date_object(self, args, expects):
+        assert dates.decode_date(*args) == expects
+
+    @pytest.mark.parametrize("date_string, format", invalid_date_testdata)
+    def test_should_raise_value_error_when_invalid_date(self, date_string, format):
+        with pytest.raises(ValueError, match="Invalid date format"):
+            dates.decode_date(date_string, format)
+
+
+class TestParseDatesFunction:
+    def test_should_successfully_return_list_of_dates(self):
+        date_strings = ("20240516", "garbage", "19761123")
+        expects = [datetime.date(2024, 5, 16), None, datetime.date(1976, 11, 23)]
+        assert dates.parse_dates(date_strings, dates.ISO_FORMAT) == expects
+
+
+class TestParseDatesArrayFunction:
+    @pytest.mark.parametrize("format", (dates.ISO_FORMAT, dates.IMPERIAL_FORMAT), ids=("ISO", "Imperial"))
+    def test_should_return_same_dates_as_parse_dates(self, format):
+        numpy = pytest.importorskip("numpy")
+        date_strings = ["20240516", "05162024", "20240229", "02292023", "19761123", "11231976"]
+        date_strings += list(map(lambda x: x[0], invalid_date_testdata))
+        expects = numpy.array(dates.parse_dates(date_strings, format), dtype="datetime64[D]")
+        assert numpy.array_equal(dates.parse_dates_array(date_strings, format), expects, equal_nan=True)
+
+
+class TestGetIssuerDateFormatFunction:
+    @pytest.mark.parametrize("args, expects", (
+        ((636000, 1), "%Y%m%d"),  # Virginia, ISO
+        ((636000, 10), "%m%d%Y"),  # Virginia, Imperial
+        ((636012, 2), "%m%d%Y"),  # Ontario, Imperial
+        ((636012, 3), "%Y%m%d"),  # Ontario, ISO
+        ((636056, 10), "%Y%m%d"),  # Coahuila, ISO
+        ((636012, 11), "%Y%m%d")),  # Ontario, ISO, not precomputed
+        ids=("VA 1", "VA 10", "ON 2", "ON 3", "CU 10", "ON 11"))
+    def test_should_successfully_return_correct_date_format(self, args, expects):
+        assert dates.get_issuer_date_format(*args) == expects
+
+    def test_should_match_get_date_format_for_every_precomputed_issuer(self):
+        for (issuer_id, aamva_version), format in dates.build_issuer_date_formats(issuing_authority.ISSUING_AUTHORITIES).items():
+            country = dates.get_authority_by_id(issuer_id).country
+            assert format == dates.get_date_format(aamva_version, country)
+
+    def test_should_raise_value_error_when_issuer_not_found(self):
+        with pytest.raises(ValueError, match="not found"):
+            dates.get_issuer_date_format(1, 10)
+
+    @pytest.mark.parametrize("aamva_version", (0, -1, 100))
+    def test_should_raise_value_error_and_not_cache_when_aamva_version_out_of_range(self, aamva_version):
+        with pytest.raises(ValueError, match="out of range"):
+            dates.get_issuer_date_format(636000, aamva_version)
+        assert (636000, aamva_version) not in dates.get_issuer_date_formats().formats
+
+    @pytest.mark.parametrize("aamva_version", (10, 11), ids=("precomputed", "resolved"))
+    def test_should_follow_replaced_authority_list(self, monkeypatch, aamva_version):
+        assert dates.get_issuer_date_format(636000, aamva_version) == "%m%d%Y"
+        authorities = tuple(
+            authority._replace(country="Canada") if authority.issuer_id == 636000 else authority
+            for authority in issuing_authority.ISSUING_AUTHORITIES)
+        monkeypatch.setattr(issuing_authority, "ISSUING_AUTHORITIES", authorities)
+        assert dates.get_issuer_date_format(636000, aamva_version) == "%Y%m%d"
@@ -0,0 +1,116 @@
+import copy
+import threading
+
+import pytest
+
+import aamva.duplicates as duplicates
+from tests.test_barcode import barcode_testdata
+from tests.test_cache import FakeClock
+
+barcode_strings = tuple(x[1] for x in barcode_testdata)
+barcode_files = tuple({"header": x[2], "subfiles": x[4]} for x in barcode_testdata)
+
+
+def with_element(barcode_file, element_id, value):
+    barcode_file = copy.deepcopy(barcode_file)
+    barcode_file["subfiles"][0]["elements"][element_id] = value
+    return barcode_file
+
+
+class TestScanKeyFunction:
+    def test_should_successfully_key_on_issuer_and_customer_id(self):
+        assert duplicates.scan_key(barcode_files[1]) == "636000\nT64235789"
+
+    def test_should_include_document_discriminator_when_matched(self):
+        assert duplicates.scan_key(barcode_files[1], True) == "636000\nT64235789\n2424244747474786102204"
+
+    def test_should_raise_value_error_when_issuer_unknown(self):
+        barcode_file = copy.deepcopy(barcode_files[1])
+        barcode_file["header"]["issuer_id"] = 999999
+        with pytest.raises(ValueError, match="not found"):
+            duplicates.scan_key(barcode_file)
+
+    def test_should_raise_value_error_when_customer_id_missing(self):
+        with pytest.raises(ValueError, match="DAQ"):
+            duplicates.scan_key(with_element(barcode_files[1], "DAQ", "  "))
+
+
+class TestDuplicateScanIndexClass:
+    def test_should_return_previous_sighting_on_repeat_scan(self):
+        clock = FakeClock()
+        index = duplicates.DuplicateScanIndex(clock=clock)
+        assert index.record(barcode_files[1], "kiosk-1") is None
+        clock.now = 10.0
+        assert index.record(barcode_files[1], "kiosk-2") == duplicates.Sighting(0.0, 0.0, 1, "kiosk-1")
+        assert index.lookup(barcode_files[1]) == duplicates.Sighting(0.0, 10.0, 2, "kiosk-2")
+        assert index.stats[:2] == (2, 1)
+
+    def test_should_not_flag_different_cards(self):
+        index = duplicates.DuplicateScanIndex()
+        assert index.record(barcode_files[1]) is None
+        assert index.record(with_element(barcode_files[1], "DAQ", "X1234")) is None
+        assert len(index) == 2
+
+    @pytest.mark.parametrize("match_discriminator, expects", ((False, 1), (True, None)), ids=("ignored", "matched"))
+    def test_should_only_tell_reissued_cards_apart_when_matching_discriminator(self, match_discriminator, expects):
+        index = duplicates.DuplicateScanIndex(match_discriminator=match_discriminator)
+        index.record(barcode_files[1])
+        sighting = index.record(with_element(barcode_files[1], "DCF", "REISSUED"))
+        assert (sighting and sighting.count) == expects
+
+    def test_should_expire_sighting_after_window(self):
+        clock = FakeClock()
+        index = duplicates.DuplicateScanIndex(window=5, clock=clock)
+        index.record(barcode_files[1])
+        clock.now = 4.9
+        assert index.record(barcode_files[1]) is not None
+        clock.now = 9.9
+        assert index.lookup(barcode_files[1]) is None
+        assert index.stats.expirations == 1
+
+    def test_should_evict_least_recently_seen_card_when_full(self):
+        index = duplicates.DuplicateScanIndex(max_entries=2)
+        for customer_id in ("A1", "A2", "A1", "A3"):
+            index.record(with_element(barcode_files[1], "DAQ", customer_id))
+        assert index.lookup(with_element(barcode_files[1], "DAQ", "A2")) is None
+        assert index.lookup(with_element(barcode_files[1], "DAQ", "A1")) is not None
+        assert index.stats.evictions == 1
+
+    def test_should_successfully_parse_and_record_scan(self):
+        index = duplicates.DuplicateScanIndex()
+        barcode_file, sighting = index.scan(barcode_strings[0])
+        assert barcode_file == barcode_files[0]
+        assert sighting is None
+        assert index.scan(barcode_strings[0])[1].count == 1
+
+    def test_should_raise_value_error_and_not_record_invalid_payload(self):
+        index = duplicates.DuplicateScanIndex()
+        with pytest.raises(ValueError):
+            index.scan("garbage")
+        assert index.stats.scans == 0
+
+    def test_should_successfully_clear_entries(self):
+        index = duplicates.DuplicateScanIndex()
+        index.record(barcode_files[0])
+        index.clear()
+        assert len(index) == 0
+
+    def test_should_count_every_duplicate_across_threads(self):
+        index = duplicates.DuplicateScanIndex()
+
+        def scan(source):
+            for _ in range(200):
+                index.record(barcode_files[1], source)
+
+        threads = [threading.Thread(target=scan, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert index.stats == (800, 799, 0, 0, 1)
+        assert index.lookup(barcode_files[1]).count == 800
+
+    @pytest.mark.parametrize("kwargs", ({"window": 0}, {"max_entries": 0}), ids=("window", "max_entries"))
+    def test_should_raise_value_error_when_limit_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            duplicates.DuplicateScanIndex(**kwargs)
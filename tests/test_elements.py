@@ -0,0 +1,109 @@
+import datetime
+
+import pytest
+
+import aamva.elements as elements
+from aamva.barcode import parse_barcode_string
+from aamva.eye_color import EyeColor
+from aamva.hair_color import HairColor
+from tests.test_barcode import barcode_testdata
+
+decoder_testdata = (
+    # ((decoder, value, expects), ...)
+    (elements.decode_text, "123459999  ", "123459999"),
+    (elements.decode_int, "175", 175),
+    (elements.decode_flag, "1", True),
+    (elements.decode_flag, "0", False),
+    (elements.decode_sex, "2", "Female"),
+    (elements.decode_sex, "M", "Male"),
+    (elements.decode_truncation, "T", True),
+    (elements.decode_truncation, "U", None),
+    (elements.decode_height, "068 in", elements.Height(68, "in")),
+    (elements.decode_height, "175 cm", elements.Height(175, "cm")),
+    (elements.decode_height_feet_inches, "509", elements.Height(69, "in")),
+    (elements.decode_eye_color_version_1, "BL ", ("BLU", "Blue", "Blue")),
+    (elements.decode_eye_color_version_1, "HAZ", ("HAZ", "Hazel", "Hazel, a mixture of colors, most commonly green and brown")),
+    (elements.decode_hair_color_version_1, "BR ", ("BRO", "Brown")),
+    (elements.decode_race_ethnicity, "W", ("W", "White")))
+decoder_testdata_ids = tuple(map(lambda x: f"{x[0].__name__} {x[1]!r}", decoder_testdata))
+
+
+class TestDecoderFunctions:
+    @pytest.mark.parametrize("decoder, value, expects", decoder_testdata, ids=decoder_testdata_ids)
+    def test_should_successfully_decode_value(self, decoder, value, expects):
+        assert decoder(value, "%m%d%Y") == expects
+
+    @pytest.mark.parametrize("decoder, value", (
+        (elements.decode_sex, "X"),
+        (elements.decode_truncation, "X"),
+        (elements.decode_height, "068"),
+        (elements.decode_int, "ABC")))
+    def test_should_raise_value_error_when_value_invalid(self, decoder, value):
+        with pytest.raises(ValueError):
+            decoder(value, "%m%d%Y")
+
+
+class TestGetSchemaFunction:
+    @pytest.mark.parametrize("aamva_version, element_id, field", (
+        (1, "DAA", "customer_full_name"),
+        (1, "DAR", "jurisdiction_vehicle_class"),
+        (3, "DCT", "customer_given_names"),
+        (3, "DCA", "jurisdiction_vehicle_class"),
+        (10, "DAC", "customer_first_name"),
+        (10, "DDE", "family_name_truncation")))
+    def test_should_successfully_map_element_to_field(self, aamva_version, element_id, field):
+        assert elements.get_schema(aamva_version)[element_id].field == field
+
+    def test_should_not_include_later_elements_in_earlier_versions(self):
+        assert "DCS" not in elements.get_schema(1)
+        assert "DDE" not in elements.get_schema(3)
+
+    def test_should_use_latest_schema_for_newer_versions(self):
+        assert elements.get_schema(11) is elements.get_schema(10)
+
+    def test_should_raise_value_error_when_aamva_version_out_of_range(self):
+        with pytest.raises(ValueError, match="out of range"):
+            elements.get_schema(0)
+
+    def test_should_return_read_only_schema(self):
+        with pytest.raises(TypeError):
+            elements.get_schema(10)["DAQ"] = elements.ElementSchema("changed", elements.decode_text)
+
+
+class TestDecodeElementsFunction:
+    def test_should_skip_unknown_elements_and_report_decode_errors(self):
+        decoded = elements.decode_elements({"DAQ": "123", "ZZZ": "1", "DBB": "garbage"}, 10, "%m%d%Y")
+        assert decoded.fields == {"customer_id_number": "123"}
+        assert tuple(decoded.errors) == ("DBB",)
+
+
+class TestDecodeBarcodeFileFunction:
+    def test_should_successfully_decode_card_subfile(self):
+        decoded = elements.decode_barcode_file(parse_barcode_string(barcode_testdata[1][1]))
+        assert decoded.errors == {}
+        assert decoded.fields["customer_family_name"] == "SAMPLE"
+        assert decoded.fields["date_of_birth"] == datetime.date(1986, 6, 6)
+        assert decoded.fields["eye_color"] == EyeColor("BRO", "Brown", "Brown, including amber")
+        assert decoded.fields["height"] == elements.Height(68, "in")
+        assert decoded.fields["limited_duration_document"] is True
+
+    def test_should_successfully_decode_version_1_card_subfile(self):
+        decoded = elements.decode_barcode_file(parse_barcode_string(barcode_testdata[0][1]))
+        assert decoded.errors == {}
+        assert decoded.fields["date_of_birth"] == datetime.date(1976, 11, 23)
+        assert decoded.fields["document_expiration_date"] == datetime.date(2001, 12, 1)
+        assert decoded.fields["eye_color"] == EyeColor("BLU", "Blue", "Blue")
+        assert decoded.fields["hair_color"] == HairColor("BRO", "Brown")
+
+    def test_should_report_date_errors_when_issuer_unknown(self):
+        barcode_file = parse_barcode_string(barcode_testdata[1][1])
+        barcode_file["header"]["issuer_id"] = 999999
+        decoded = elements.decode_barcode_file(barcode_file)
+        assert {"DBA", "DBB", "DBD"} <= set(decoded.errors)
+        assert all(map(lambda x: "unknown" in x, decoded.errors.values()))
+        assert decoded.fields["customer_family_name"] == "SAMPLE"
+
+    def test_should_raise_value_error_when_no_card_subfile(self):
+        barcode_file = {"header": barcode_testdata[1][2], "subfiles": ({"subfile_type": "ZV", "elements": {}},)}
+        with pytest.raises(ValueError, match="no DL or ID subfile"):
+            elements.decode_barcode_file(barcode_file)
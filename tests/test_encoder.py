@@ -0,0 +1,102 @@
+import pytest
+
+import aamva.encoder as encoder
+from aamva.barcode import parse_barcode_string
+from tests.test_barcode import barcode_testdata, barcode_testdata_ids
+
+file_testdata = tuple(map(lambda x: (x[1], {"header": x[2], "subfiles": x[4]}), barcode_testdata))
+
+
+class TestEncodeFileHeaderFunction:
+    @pytest.mark.parametrize("barcode_string, barcode_file", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_encode_file_header(self, barcode_string, barcode_file):
+        header = encoder.encode_file_header(barcode_file["header"], 2)
+        assert barcode_string.startswith(header)
+
+    def test_should_raise_value_error_when_number_of_entries_does_not_match(self):
+        with pytest.raises(ValueError, match="does not match"):
+            encoder.encode_file_header(barcode_testdata[1][2], 3)
+
+    def test_should_raise_value_error_when_issuer_id_too_wide(self):
+        header = dict(barcode_testdata[1][2], issuer_id=1234567)
+        with pytest.raises(ValueError, match="6 digits"):
+            encoder.encode_file_header(header, 2)
+
+    def test_should_raise_value_error_when_version_1_header_has_jurisdiction_version(self):
+        header = dict(barcode_testdata[0][2], jurisdiction_version=7)
+        with pytest.raises(ValueError, match="no jurisdiction_version"):
+            encoder.encode_file_header(header, header["number_of_entries"])
+
+    def test_should_raise_value_error_when_aamva_version_out_of_range(self):
+        header = dict(barcode_testdata[1][2], aamva_version=100)
+        with pytest.raises(ValueError, match="out of range"):
+            encoder.encode_file_header(header, 2)
+
+
+class TestEncodeSubfileFunction:
+    def test_should_successfully_encode_subfile(self):
+        assert encoder.encode_subfile({"subfile_type": "ZV", "elements": {"ZVA": "01", "ZVB": ""}}) == "ZVZVA01\nZVB\r"
+
+    @pytest.mark.parametrize("elements, match", (
+        ({"ZV": "01"}, "3 characters"),
+        ({"ZVA": "0\n1"}, "separator"),
+        ({"ZVA": "0\r1"}, "separator"),
+        ({"Z\nA": "01"}, "Element ID .* separator"),
+        ({"ZV\r": "01"}, "Element ID .* separator"),
+        ({"Z\x1eA": "01"}, "Element ID .* separator")))
+    def test_should_raise_value_error_when_element_cannot_round_trip(self, elements, match):
+        with pytest.raises(ValueError, match=match):
+            encoder.encode_subfile({"subfile_type": "ZV", "elements": elements})
+
+    @pytest.mark.parametrize("subfile_type", ("Z\n", "\rV", "Z\x1e"))
+    def test_should_raise_value_error_when_subfile_type_contains_separator(self, subfile_type):
+        with pytest.raises(ValueError, match="Subfile type .* separator"):
+            encoder.encode_subfile({"subfile_type": subfile_type, "elements": {"ZVA": "01"}})
+
+
+class TestEncodeBarcodeFunction:
+    @pytest.mark.parametrize("barcode_string, barcode_file", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_reproduce_original_barcode_string(self, barcode_string, barcode_file):
+        assert encoder.encode_barcode(barcode_file) == barcode_string
+
+    @pytest.mark.parametrize("barcode_string, barcode_file", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_round_trip_through_parser(self, barcode_string, barcode_file):
+        assert parse_barcode_string(encoder.encode_barcode(barcode_file)) == barcode_file
+
+    def test_should_raise_value_error_when_subfile_too_large(self):
+        barcode_file = {
+            "header": dict(barcode_testdata[1][2], number_of_entries=1),
+            "subfiles": ({"subfile_type": "DL", "elements": {"DAQ": "X" * 10_000}},)}
+        with pytest.raises(ValueError, match="4 digit"):
+            encoder.encode_barcode(barcode_file)
+
+
+class TestEncodeBarcodeIntoFunction:
+    @pytest.mark.parametrize("barcode_string, barcode_file", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_encode_into_empty_buffer(self, barcode_string, barcode_file):
+        buffer = bytearray()
+        end = encoder.encode_barcode_into(barcode_file, buffer)
+        assert buffer[:end] == barcode_string.encode("latin-1")
+
+    def test_should_successfully_reuse_larger_buffer(self):
+        buffer = bytearray(b"#" * 1000)
+        for barcode_string, barcode_file in file_testdata + file_testdata:
+            end = encoder.encode_barcode_into(barcode_file, buffer)
+            assert buffer[:end] == barcode_string.encode("latin-1")
+        assert len(buffer) == 1000
+
+    def test_should_successfully_encode_at_start_position(self):
+        barcode_string, barcode_file = file_testdata[1]
+        buffer = bytearray(b"prefix")
+        end = encoder.encode_barcode_into(barcode_file, buffer, 6)
+        assert buffer[:end] == b"prefix" + barcode_string.encode("latin-1")
+
+    def test_should_raise_value_error_when_start_past_end_of_buffer(self):
+        with pytest.raises(ValueError, match="past the end"):
+            encoder.encode_barcode_into(file_testdata[1][1], bytearray(), 1)
+
+
+class TestEncodeBarcodeBytesFunction:
+    @pytest.mark.parametrize("barcode_string, barcode_file", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_return_encoded_bytes(self, barcode_string, barcode_file):
+        assert encoder.encode_barcode_bytes(barcode_file) == barcode_string.encode("latin-1")
@@ -0,0 +1,67 @@
+import pytest
+
+import aamva.barcode as barcode
+import aamva.elements as elements
+import aamva.instrumentation as instrumentation
+from tests.test_barcode import barcode_testdata
+
+
+@pytest.fixture
+def recorder():
+    recorder = instrumentation.MetricsRecorder()
+    with instrumentation.instrumented(recorder):
+        yield recorder
+
+
+class TestErrorReasonFunction:
+    def test_should_mask_quoted_values(self):
+        assert instrumentation.error_reason(ValueError("Color code 'XYZ' not found.")) == "Color code '*' not found."
+
+
+class TestMetricsRecorderClass:
+    def test_should_successfully_record_calls_latency_and_errors(self):
+        recorder = instrumentation.MetricsRecorder()
+        recorder("stage", 750, None)
+        recorder("stage", 10**9, ValueError("Code 'A' not found."))
+        metrics = recorder.snapshot()["stage"]
+        assert (metrics.calls, metrics.total_ns) == (2, 750 + 10**9)
+        assert metrics.buckets[1] == 1 and metrics.buckets[-1] == 1
+        assert metrics.errors == {"Code '*' not found.": 1}
+
+    def test_should_successfully_reset(self):
+        recorder = instrumentation.MetricsRecorder()
+        recorder("stage", 1, None)
+        recorder.reset()
+        assert recorder.snapshot() == {}
+
+
+class TestInstrumentedFunction:
+    def test_should_record_every_parse_stage(self, recorder):
+        barcode.parse_barcode_string(barcode_testdata[1][1])
+        metrics = recorder.snapshot()
+        assert metrics["parse_file_header"].calls == 1
+        assert metrics["parse_subfile_designators"].calls == 1
+        assert metrics["parse_subfile"].calls == 2
+
+    def test_should_record_decoders_imported_by_other_modules(self, recorder):
+        elements.decode_barcode_file(barcode.parse_barcode_string(barcode_testdata[1][1]))
+        metrics = recorder.snapshot()
+        assert metrics["parse_date"].calls == 5  # DBD, DBB, DBA, DDB and DDC
+        assert metrics["parse_eye_color"].calls == 1
+
+    def test_should_count_errors_by_reason_and_reraise(self, recorder, replace_char_at_index):
+        with pytest.raises(ValueError):
+            barcode.parse_barcode_string(replace_char_at_index(barcode_testdata[1][1], 4))
+        assert recorder.snapshot()["parse_file_header"].errors == {"Header element '*' is invalid.": 1}
+
+    def test_should_restore_original_functions_when_disabled(self):
+        original = elements.parse_date
+        with instrumentation.instrumented(instrumentation.MetricsRecorder()):
+            assert instrumentation.is_enabled()
+            assert elements.parse_date is not original
+        assert not instrumentation.is_enabled()
+        assert elements.parse_date is original
+
+    def test_should_raise_value_error_when_already_enabled(self, recorder):
+        with pytest.raises(ValueError, match="already enabled"):
+            instrumentation.enable(recorder)
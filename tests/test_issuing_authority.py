@@ -25,3 +25,45 @@ class TestGetAuthorityByIdFunction:
     def test_should_raise_value_error_when_id_not_found(self):
         with pytest.raises(ValueError, match="not found"):
             issuing_authority.get_authority_by_id(1)
+
+
+class TestGetAuthorityIndexFunction:
+    def test_should_return_same_index_while_authority_list_is_unchanged(self):
+        assert issuing_authority.get_authority_index() is issuing_authority.get_authority_index()
+
+    def test_should_return_read_only_index(self):
+        with pytest.raises(TypeError):
+            issuing_authority.get_authority_index().by_id[1] = issuing_authority.ISSUING_AUTHORITIES[0]
+
+    def test_should_rebuild_index_when_authority_list_is_replaced(self, fake_authority_list):
+        index = issuing_authority.get_authority_index()
+        assert index.source is issuing_authority.ISSUING_AUTHORITIES
+        assert tuple(index.by_id) == (100001, 100002)
+
+
+class TestGetAuthorityByAbbrFunction:
+    @pytest.mark.parametrize("abbr", ("T1", "t1"), ids=("Upper", "Lower"))
+    def test_should_successfully_return_issuing_authority_tuple(self, fake_authority_list, abbr):
+        assert issuing_authority.get_authority_by_abbr(abbr) == issuing_authority_testdata[0]
+
+    def test_should_raise_value_error_when_abbr_not_found(self):
+        with pytest.raises(ValueError, match="not found"):
+            issuing_authority.get_authority_by_abbr("ZZ")
+
+
+class TestGetAuthorityByJurisdictionFunction:
+    def test_should_successfully_return_issuing_authority_tuple(self, fake_authority_list):
+        assert issuing_authority.get_authority_by_jurisdiction("test jurisdiction 2") == issuing_authority_testdata[1]
+
+    def test_should_raise_value_error_when_jurisdiction_not_found(self):
+        with pytest.raises(ValueError, match="not found"):
+            issuing_authority.get_authority_by_jurisdiction("Atlantis")
+
+
+class TestGetAuthoritiesByCountryFunction:
+    @pytest.mark.parametrize("country", ("Canada", "CANADA"), ids=("Title", "Upper"))
+    def test_should_successfully_return_tuple_of_authorities(self, fake_authority_list, country):
+        assert issuing_authority.get_authorities_by_country(country) == (issuing_authority_testdata[0],)
+
+    def test_should_return_empty_tuple_when_country_not_found(self):
+        assert issuing_authority.get_authorities_by_country("England") == ()
@@ -0,0 +1,56 @@
+import pytest
+
+import aamva.lazy as lazy
+from aamva.barcode import parse_barcode_string
+from aamva.encoder import encode_barcode
+from tests.test_barcode import barcode_testdata, barcode_testdata_ids
+
+file_testdata = tuple(map(lambda x: (x[1], x[2], x[3], x[4]), barcode_testdata))
+
+
+class TestLazyBarcodeFileClass:
+    @pytest.mark.parametrize("barcode_string, header, designators, subfiles", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_parse_header_and_designators_up_front(self, barcode_string, header, designators, subfiles):
+        barcode_file = lazy.parse_barcode_lazy(barcode_string)
+        assert barcode_file.header == header
+        assert barcode_file.designators == designators
+        assert barcode_file.subfile_types == ("DL", "ZV")
+
+    @pytest.mark.parametrize("barcode_string, header, designators, subfiles", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_return_and_cache_requested_subfile(self, barcode_string, header, designators, subfiles):
+        barcode_file = lazy.parse_barcode_lazy(barcode_string)
+        assert barcode_file.subfile("DL") == subfiles[0]
+        assert barcode_file.subfile("DL") is barcode_file.subfile("DL")
+
+    def test_should_not_validate_subfile_until_accessed(self, replace_char_at_index):
+        _, barcode_string, _, designators, subfiles = barcode_testdata[1]
+        subfile_end = designators[1]["offset"] + designators[1]["length"] - 1
+        barcode_file = lazy.parse_barcode_lazy(replace_char_at_index(barcode_string, subfile_end))
+        assert barcode_file.subfile("DL") == subfiles[0]
+        with pytest.raises(ValueError, match="missing segment terminator"):
+            barcode_file.subfile("ZV")
+
+    def test_should_raise_value_error_when_subfile_type_not_found(self):
+        barcode_file = lazy.parse_barcode_lazy(barcode_testdata[1][1])
+        with pytest.raises(ValueError, match="not found"):
+            barcode_file.subfile("ZZ")
+
+    def test_should_keep_every_subfile_of_a_repeated_type(self):
+        subfiles = barcode_testdata[1][4] + ({"subfile_type": "ZV", "elements": {"ZVA": "02"}},)
+        header = dict(barcode_testdata[1][2], number_of_entries=len(subfiles))
+        barcode_string = encode_barcode({"header": header, "subfiles": subfiles})
+        barcode_file = lazy.parse_barcode_lazy(barcode_string)
+        assert barcode_file.to_dict() == parse_barcode_string(barcode_string)
+        assert barcode_file.subfile("ZV") is barcode_file.subfile_at(1)
+        assert barcode_file.subfile_at(2)["elements"] == {"ZVA": "02"}
+
+    @pytest.mark.parametrize("barcode_string, header, designators, subfiles", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_convert_to_barcode_file_dict(self, barcode_string, header, designators, subfiles):
+        assert lazy.parse_barcode_lazy(barcode_string).to_dict() == {"header": header, "subfiles": subfiles}
+
+
+class TestParseBarcodeLazyFunction:
+    def test_should_raise_value_error_when_number_of_entries_less_than_1(self, replace_char_at_index):
+        barcode_string = replace_char_at_index(barcode_testdata[1][1], 20, "0")
+        with pytest.raises(ValueError, match="less than 1"):
+            lazy.parse_barcode_lazy(barcode_string)
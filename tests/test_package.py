@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import aamva
+import aamva.barcode as barcode
+import aamva.instrumentation as instrumentation
+
+
+class TestLazyAttributes:
+    def test_should_not_import_submodules_or_datetime_on_package_import(self):
+        code = "import sys, aamva; print(sorted(m for m in sys.modules if m.startswith('aamva') or m == 'datetime'))"
+        root = os.path.dirname(os.path.dirname(aamva.__file__))
+        output = subprocess.run((sys.executable, "-c", code), cwd=root, capture_output=True, text=True, check=True).stdout
+        assert output.strip() == "['aamva']"
+
+    def test_should_successfully_return_submodule_attribute(self):
+        assert aamva.parse_barcode_string is barcode.parse_barcode_string
+
+    @pytest.mark.parametrize("name", aamva.__all__)
+    def test_should_resolve_every_exported_name(self, name):
+        assert getattr(aamva, name) is getattr(sys.modules[aamva.LAZY_ATTRIBUTES[name]], name)
+
+    def test_should_not_keep_instrumented_function_after_disable(self, monkeypatch):
+        monkeypatch.delitem(vars(aamva), "parse_file_header", raising=False)
+        monkeypatch.setitem(aamva.LAZY_ATTRIBUTES, "parse_file_header", "aamva.barcode")
+        original = barcode.parse_file_header
+        with instrumentation.instrumented(lambda *args: None):
+            assert aamva.parse_file_header is not original
+        assert aamva.parse_file_header is original
+
+    def test_should_raise_attribute_error_when_name_unknown(self):
+        with pytest.raises(AttributeError, match="no attribute 'parse_everything'"):
+            aamva.parse_everything
+
+    def test_should_list_lazy_attributes_in_dir(self):
+        assert set(aamva.__all__) <= set(dir(aamva))
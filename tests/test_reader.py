@@ -0,0 +1,83 @@
+import io
+
+import pytest
+
+import aamva.reader as reader
+from tests.test_barcode import barcode_testdata
+
+raw_records = tuple(map(lambda x: x[1].encode("latin-1"), barcode_testdata))
+expected_files = tuple(map(lambda x: {"header": x[2], "subfiles": x[4]}, barcode_testdata))
+raw_dump = b"noise" + b"".join(raw_records) + raw_records[0]
+escaped_dump = b"".join(map(
+    lambda x: x.decode("latin-1").encode("unicode_escape") + b"\n", raw_records + raw_records[:1])) + b"\n"
+
+
+class TestSplitRawRecordsFunction:
+    def test_should_successfully_split_records_at_header_prefix(self):
+        assert tuple(reader.split_raw_records(raw_dump)) == raw_records + raw_records[:1]
+
+    def test_should_return_nothing_when_header_prefix_not_found(self):
+        assert tuple(reader.split_raw_records(b"It's not here!")) == ()
+
+
+class TestReadRawRecordsFunction:
+    @pytest.mark.parametrize("block_size", (1, 7, 64, 4096))
+    def test_should_successfully_read_records_across_block_boundaries(self, block_size):
+        records = tuple(reader.read_raw_records(io.BytesIO(raw_dump), block_size))
+        assert records == raw_records + raw_records[:1]
+
+    def test_should_return_nothing_when_header_prefix_not_found(self):
+        assert tuple(reader.read_raw_records(io.BytesIO(b"It's not here!" * 100), 8)) == ()
+
+
+class TestReadEscapedRecordsFunction:
+    def test_should_successfully_unescape_one_record_per_line(self):
+        records = tuple(reader.read_escaped_records(io.BytesIO(escaped_dump)))
+        assert records == raw_records + raw_records[:1]
+
+
+class TestDecodeRecordFunction:
+    def test_should_successfully_unescape_escaped_record(self):
+        assert reader.decode_record(escaped_dump.splitlines()[0], "escaped") == barcode_testdata[0][1]
+
+    def test_should_raise_value_error_for_bad_escape(self):
+        with pytest.raises(ValueError):
+            reader.decode_record(b"\\x1", "escaped")
+
+
+class TestIterRecordsFunction:
+    def test_should_raise_value_error_when_framing_not_supported(self):
+        with pytest.raises(ValueError, match="not supported"):
+            tuple(reader.iter_records(io.BytesIO(raw_dump), "csv"))
+
+    @pytest.mark.parametrize("framing, dump", (("raw", raw_dump), ("escaped", escaped_dump)), ids=("raw", "escaped"))
+    def test_should_successfully_read_records_from_path(self, tmp_path, framing, dump):
+        path = tmp_path / "dump.bin"
+        path.write_bytes(dump)
+        assert tuple(reader.iter_records(path, framing)) == raw_records + raw_records[:1]
+
+    def test_should_return_nothing_for_empty_file(self, tmp_path):
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+        assert tuple(reader.iter_records(str(path))) == ()
+
+
+class TestIterBarcodesFunction:
+    @pytest.mark.parametrize("framing, dump", (("raw", raw_dump), ("escaped", escaped_dump)), ids=("raw", "escaped"))
+    def test_should_successfully_yield_parsed_barcode_files(self, framing, dump):
+        results = tuple(reader.iter_barcodes(io.BytesIO(dump), framing))
+        assert tuple(map(lambda x: x.barcode_file, results)) == expected_files + expected_files[:1]
+        assert tuple(map(lambda x: x.error, results)) == (None, None, None)
+
+    @pytest.mark.parametrize("bad_line", (b"\\x1", b"\\u0141"), ids=("truncated escape", "not latin-1"))
+    def test_should_yield_error_result_for_line_with_bad_escape_and_keep_reading(self, bad_line):
+        dump = escaped_dump.replace(b"\n", b"\n" + bad_line + b"\n", 1)
+        results = tuple(reader.iter_barcodes(io.BytesIO(dump), "escaped"))
+        assert len(results) == 4
+        assert results[1].barcode_file is None and isinstance(results[1].error, ValueError)
+        assert tuple(map(lambda x: x.barcode_file, results[:1] + results[2:])) == expected_files + expected_files[:1]
+
+    def test_should_yield_error_result_for_malformed_record(self):
+        results = tuple(reader.iter_barcodes(io.BytesIO(raw_records[0][:40] + raw_records[1])))
+        assert results[0].barcode_file is None and isinstance(results[0].error, ValueError)
+        assert results[1].barcode_file == expected_files[1]
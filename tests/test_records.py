@@ -0,0 +1,47 @@
+import pytest
+
+import aamva.records as records
+from tests.test_barcode import barcode_testdata, barcode_testdata_ids
+
+file_testdata = tuple(map(lambda x: (x[1], x[2], x[4]), barcode_testdata))
+
+
+class TestCompactSubfileClass:
+    subfile = records.CompactSubfile("DL", ("DAQ", "DBB"), ("T64235789", "06061986"))
+
+    @pytest.mark.parametrize("code, expects", (("DAQ", "T64235789"), ("DBB", "06061986"), ("DCS", None), ("ZZZ", None)))
+    def test_should_successfully_get_element_value(self, code, expects):
+        assert self.subfile.get(code) == expects
+
+    def test_should_return_default_when_element_not_found(self):
+        assert self.subfile.get("DCS", "") == ""
+
+    def test_should_successfully_return_subfile_dict(self):
+        assert self.subfile.to_dict() == {"subfile_type": "DL", "elements": {"DAQ": "T64235789", "DBB": "06061986"}}
+
+
+class TestCompactBarcodeFileClass:
+    def test_should_successfully_return_subfile_by_type(self):
+        barcode_file = records.parse_barcode_compact(barcode_testdata[1][1])
+        assert barcode_file.subfile("ZV").get("ZVA") == "01"
+
+    def test_should_raise_value_error_when_subfile_type_not_found(self):
+        barcode_file = records.parse_barcode_compact(barcode_testdata[1][1])
+        with pytest.raises(ValueError, match="not found"):
+            barcode_file.subfile("ZZ")
+
+
+class TestParseBarcodeCompactFunction:
+    @pytest.mark.parametrize("barcode_string, header, subfiles", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_return_compact_barcode_file(self, barcode_string, header, subfiles):
+        barcode_file = records.parse_barcode_compact(barcode_string)
+        assert type(barcode_file) is records.CompactBarcodeFile
+        assert barcode_file.header == tuple(header.values())
+        for subfile, expects in zip(barcode_file.subfiles, subfiles):
+            assert subfile.codes == tuple(sorted(expects["elements"]))
+
+    @pytest.mark.parametrize("barcode_string, header, subfiles", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_convert_back_to_barcode_file_dict(self, barcode_string, header, subfiles):
+        barcode_file = records.parse_barcode_compact(barcode_string).to_dict()
+        assert type(barcode_file) is dict
+        assert barcode_file == {"header": header, "subfiles": subfiles}
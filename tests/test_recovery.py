@@ -0,0 +1,87 @@
+import pytest
+
+import aamva.recovery as recovery
+from aamva.barcode import parse_barcode_string
+from aamva.recovery import Repair, RepairCode
+from tests.test_barcode import barcode_testdata, barcode_testdata_ids
+
+barcode_strings = tuple(map(lambda x: x[1], barcode_testdata))
+v10_barcode = barcode_strings[1]  # Designators: DL00410278 ZV03190008
+
+
+def subfile_types(recovered):
+    return tuple(subfile["subfile_type"] for subfile in recovered.barcode_file["subfiles"])
+
+
+class TestSplitSegmentsFunction:
+    def test_should_successfully_split_at_segment_terminators(self):
+        assert recovery.split_segments("xxAB1\rCD2\rEF", 2) == [(2, 5, True), (6, 9, True), (10, 12, False)]
+
+
+class TestRecoverBarcodeStringFunction:
+    @pytest.mark.parametrize("barcode_string", barcode_strings, ids=barcode_testdata_ids)
+    def test_should_return_same_barcode_file_without_repairs_when_valid(self, barcode_string):
+        assert recovery.recover_barcode_string(barcode_string) == (parse_barcode_string(barcode_string), ())
+
+    def test_should_report_trimmed_prefix(self):
+        recovered = recovery.recover_barcode_string("noise" + v10_barcode)
+        assert recovered.barcode_file == parse_barcode_string(v10_barcode)
+        assert recovered.repairs == (Repair(RepairCode.TRIMMED_PREFIX, None, 0),)
+
+    def test_should_trim_prefix_containing_compliance_indicator(self):
+        recovered = recovery.recover_barcode_string("scan@kiosk " + v10_barcode)
+        assert recovered.barcode_file == parse_barcode_string(v10_barcode)
+        assert recovered.repairs == (Repair(RepairCode.TRIMMED_PREFIX, None, 0),)
+
+    def test_should_relocate_subfile_with_wrong_offset(self):
+        recovered = recovery.recover_barcode_string(v10_barcode.replace("DL00410278", "DL00450278"))
+        assert recovered.barcode_file == parse_barcode_string(v10_barcode)
+        assert recovered.repairs == (Repair(RepairCode.RELOCATED_SUBFILE, "DL", 41),)
+
+    def test_should_resize_subfile_with_wrong_length(self):
+        recovered = recovery.recover_barcode_string(v10_barcode.replace("DL00410278", "DL00410100"))
+        assert recovered.barcode_file == parse_barcode_string(v10_barcode)
+        assert recovered.repairs == (Repair(RepairCode.RESIZED_SUBFILE, "DL", 41),)
+
+    def test_should_locate_subfile_with_unreadable_designator(self):
+        recovered = recovery.recover_barcode_string(v10_barcode.replace("DL00410278", "DL0X410278"))
+        assert recovered.barcode_file == parse_barcode_string(v10_barcode)
+        assert recovered.repairs == (Repair(RepairCode.UNREADABLE_DESIGNATOR, "DL", 21),)
+
+    @pytest.mark.parametrize("barcode_string", barcode_strings, ids=barcode_testdata_ids)
+    def test_should_split_subfiles_when_segment_terminator_is_missing(self, barcode_string):
+        terminator = barcode_string.index("\rZV")
+        recovered = recovery.recover_barcode_string(barcode_string[:terminator] + barcode_string[terminator + 1:])
+        assert recovered.barcode_file == parse_barcode_string(barcode_string)
+        assert tuple(repair.code for repair in recovered.repairs) == (
+            RepairCode.RESIZED_SUBFILE, RepairCode.MISSING_SEGMENT_TERMINATOR, RepairCode.RELOCATED_SUBFILE)
+        assert recovered.repairs[1].offset == terminator
+
+    def test_should_salvage_truncated_subfile(self):
+        recovered = recovery.recover_barcode_string(v10_barcode[:200])
+        assert subfile_types(recovered) == ("DL",)
+        elements = parse_barcode_string(v10_barcode)["subfiles"][0]["elements"]
+        assert recovered.barcode_file["subfiles"][0]["elements"]["DAQ"] == elements["DAQ"]
+        assert tuple(repair.code for repair in recovered.repairs) == (
+            RepairCode.RESIZED_SUBFILE, RepairCode.MISSING_SEGMENT_TERMINATOR, RepairCode.MISSING_SUBFILE)
+
+    def test_should_report_missing_subfile_and_keep_the_rest(self, replace_char_at_index):
+        barcode_string = replace_char_at_index(v10_barcode.replace("DL00410278", "DL00450278"), 41, "X")
+        recovered = recovery.recover_barcode_string(barcode_string)
+        assert subfile_types(recovered) == ("ZV",)
+        assert recovered.repairs == (Repair(RepairCode.MISSING_SUBFILE, "DL", 41),)
+
+    def test_should_raise_value_error_when_header_is_invalid(self, replace_char_at_index):
+        with pytest.raises(ValueError, match="FILE_TYPE"):
+            recovery.recover_barcode_string(replace_char_at_index(v10_barcode, 5, "X"))
+
+    def test_should_raise_value_error_when_no_subfile_is_recovered(self):
+        with pytest.raises(ValueError, match="No subfiles"):
+            recovery.recover_barcode_string(v10_barcode[:41])
+
+    def test_should_locate_subfiles_among_many_segments(self):
+        designators = "".join(f"Z{chr(65 + i % 26)}00000000" for i in range(99))
+        barcode_string = "@\n\x1e\rANSI 636000100199" + designators + "ZQ\r" * 100_000 + "ZAZAA1\r"
+        recovered = recovery.recover_barcode_string(barcode_string)
+        assert subfile_types(recovered) == ("ZA",)
+        assert len(recovered.repairs) == 2 + 98
@@ -0,0 +1,85 @@
+import pytest
+
+import aamva.barcode as barcode
+import aamva.result as result
+from aamva.result import ErrorCode
+from tests.test_barcode import barcode_testdata, barcode_testdata_ids
+
+barcode_strings = tuple(map(lambda x: x[1], barcode_testdata))
+header_testdata = tuple(map(lambda x: (x[1], x[2]), barcode_testdata))
+file_testdata = tuple(map(lambda x: (x[1], x[2], x[4]), barcode_testdata))
+
+
+def mutations(barcode_string: str):
+    yield from (barcode_string[:i] for i in range(len(barcode_string)))
+    for i in range(len(barcode_string)):
+        for char in "0 9\rX@\n+":
+            yield barcode_string[:i] + char + barcode_string[i + 1:]
+
+
+class TestParseFileHeaderResultFunction:
+    @pytest.mark.parametrize("barcode_string, header", header_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_return_file_header(self, barcode_string, header):
+        assert result.parse_file_header_result(barcode_string) == (header, None)
+
+    @pytest.mark.parametrize("index, char, code", (
+        (0, "#", ErrorCode.INVALID_COMPLIANCE_INDICATOR),
+        (1, " ", ErrorCode.INVALID_DATA_ELEMENT_SEPARATOR),
+        (2, " ", ErrorCode.INVALID_RECORD_SEPARATOR),
+        (3, " ", ErrorCode.INVALID_SEGMENT_TERMINATOR),
+        (4, "X", ErrorCode.INVALID_FILE_TYPE),
+        (10, "X", ErrorCode.INVALID_NUMBER),
+        (16, "X", ErrorCode.INVALID_NUMBER),
+        (20, "X", ErrorCode.INVALID_NUMBER)))
+    def test_should_return_error_code_and_offset(self, index, char, code, replace_char_at_index):
+        header, error = result.parse_file_header_result(replace_char_at_index(barcode_strings[1], index, char))
+        assert header is None
+        assert error.code == code
+        assert error.offset <= index
+
+    def test_should_return_error_when_header_is_too_short(self):
+        assert result.parse_file_header_result(barcode_strings[1][:20]) == (
+            None, (ErrorCode.HEADER_TOO_SHORT, 20))
+
+    def test_should_return_error_when_version_is_out_of_range(self, replace_char_at_index):
+        barcode_string = replace_char_at_index(barcode_strings[1], 15, "0")
+        assert result.parse_file_header_result(barcode_string) == (None, (ErrorCode.VERSION_OUT_OF_RANGE, 15))
+
+
+class TestParseSubfileResultFunction:
+    def test_should_return_error_when_segment_terminator_is_missing(self, replace_char_at_index):
+        designator = barcode.parse_subfile_designator(barcode_strings[1], 10, 0)
+        end = designator["offset"] + designator["length"]
+        barcode_string = replace_char_at_index(barcode_strings[1], end - 1, "X")
+        assert result.parse_subfile_result(barcode_string, designator) == (
+            None, (ErrorCode.MISSING_SEGMENT_TERMINATOR, end - 1))
+
+
+class TestParseBarcodeStringResultFunction:
+    @pytest.mark.parametrize("barcode_string, header, subfiles", file_testdata, ids=barcode_testdata_ids)
+    def test_should_successfully_return_barcode_file(self, barcode_string, header, subfiles):
+        assert result.parse_barcode_string_result(barcode_string) == ({"header": header, "subfiles": subfiles}, None)
+
+    def test_should_report_offset_in_untrimmed_string(self):
+        barcode_string = "noise" + barcode_strings[1][:50]
+        error = result.parse_barcode_string_result(barcode_string).error
+        assert error == (ErrorCode.SUBFILE_TOO_SHORT, len(barcode_string))
+        assert error.message == "Subfile length is too short."
+        assert type(error.to_value_error()) is ValueError
+
+    def test_should_return_error_when_number_of_entries_less_than_1(self, replace_char_at_index):
+        barcode_string = replace_char_at_index(replace_char_at_index(barcode_strings[1], 19, "0"), 20, "0")
+        assert result.parse_barcode_string_result(barcode_string).error == (ErrorCode.NO_ENTRIES, 19)
+
+    @pytest.mark.parametrize("barcode_string", barcode_strings, ids=barcode_testdata_ids)
+    def test_should_accept_and_reject_same_barcodes_as_parse_barcode_string(self, barcode_string):
+        for mutation in mutations(barcode_string):
+            try:
+                expects = barcode.parse_barcode_string(mutation), None
+            except ValueError as error:
+                expects = None, str(error)
+            barcode_file, error = result.parse_barcode_string_result(mutation)
+            assert barcode_file == expects[0]
+            assert (error is None) == (expects[1] is None)
+            if error is not None and error.code != ErrorCode.INVALID_NUMBER:
+                assert error.message == expects[1]